@@ -0,0 +1,55 @@
+import json
+import random
+from datetime import date, timedelta
+
+from match_store import SQLiteMatchStore
+
+PLAYERS = ["Brad", "Natalia", "Cake", "Smokey", "Dungeon", "Mullet"]
+VENUES = ["Home", "Cake House", "The Mullet"]
+GOLF_SCORES = [1, 2, 3, 3, 4, 4, 4, 5, 5, 6]
+TWO_OR_THREE = ["Singles Match (1v1)", "Triple Threat (1v1v1)", "Fatal 4 Way (1v1v1v1)"]
+
+
+def _ordinal(place):
+    return f"{place}{'st' if place == 1 else 'nd' if place == 2 else 'rd' if place == 3 else 'th'}"
+
+
+def write_history(path, golf_matches=500, cricket_matches=500, seed=1):
+    """Fill a match history SQLite file with deterministic synthetic matches (stands in for Google Sheets)"""
+    rng = random.Random(seed)
+    store = SQLiteMatchStore(path)
+    start = date(2024, 1, 1)
+
+    rows = []
+    for m in range(golf_matches):
+        when = f"{start + timedelta(days=m // 3)} 20:00"
+        venue = rng.choice(VENUES)
+        players = rng.sample(PLAYERS, rng.randint(2, 4))
+        for player in players:
+            scores = [rng.choice(GOLF_SCORES) for _ in range(18)]
+            rows.append({
+                "Match_ID": f"G{m:05d}", "Date": when, "Venue": venue, "Player": player,
+                "Total": sum(scores), "Hole_Scores": json.dumps(scores),
+                "Opponents": ", ".join(p for p in players if p != player)
+            })
+    store.append_golf_match(rows)
+
+    rows = []
+    for m in range(cricket_matches):
+        when = f"{start + timedelta(days=m // 3)} 21:00"
+        mode = rng.choice(TWO_OR_THREE)
+        players = rng.sample(PLAYERS, {"Singles Match (1v1)": 2, "Triple Threat (1v1v1)": 3}.get(mode, 4))
+        for place, player in enumerate(players, 1):
+            darts = rng.randint(30, 120)
+            marks = rng.randint(10, 27)
+            rows.append({
+                "Match_ID": f"C{m:05d}", "Date": when, "Venue": rng.choice(VENUES), "Game_Mode": mode,
+                "Player": player, "Placement": _ordinal(place), "Total_Marks": marks, "Total_Darts": darts,
+                "Marks_Per_Dart": round(marks / darts, 2), "Accuracy_Pct": round(marks / darts * 100, 1),
+                "Darts_To_Close": darts if marks == 27 else "", "KO_Hits_Given": rng.randint(0, 4),
+                "KO_Hits_Received": rng.randint(0, 4), "Players_Eliminated": 0,
+                "Was_Eliminated": place > 2, "PIN_Attempts": rng.randint(0, 6), "Won_Match": place == 1,
+                "Opponents": ", ".join(p for p in players if p != player)
+            })
+    store.append_cricket_match(rows)
+    return store
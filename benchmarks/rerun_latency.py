@@ -0,0 +1,320 @@
+"""Rerun latency benchmarks - drives each page of the app headlessly through scripted games.
+
+Every widget click reruns golf_pro_app.py top to bottom, so each scenario records, per rerun:
+wall time, peak Python allocations (tracemalloc, measured on a second pass so it doesn't skew
+the timings) and the size of the page it sends (serialized element protos).
+
+Wall times depend on the machine (and on whatever else it is doing), so each scenario is also
+reported as a multiple of a calibration run timed just before it - a fixed Streamlit script
+rerun the same way - and only those multiples are compared with and stored in the baseline.
+
+    python benchmarks/rerun_latency.py                   # run, compare against baseline.json
+    python benchmarks/rerun_latency.py golf cricket      # just these scenarios
+    python benchmarks/rerun_latency.py --update-baseline # accept the current numbers
+
+Exits 1 if a scenario's relative median or p95 time, allocations or payload regress past the baseline
+by more than the tolerance. History comes from synthetic fixtures in a temp dir, never Sheets.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+from cricket_engine import CRICKET_NUMBERS
+from fixtures import write_history
+from match_store import MATCH_DB_FILE
+
+APP = os.path.join(ROOT, "golf_pro_app.py")
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+TIME_TOLERANCE = 0.5  # Timings are noisy - fail at 50% over baseline
+SIZE_TOLERANCE = 0.2  # Allocations and payload are steadier
+APP_TIMEOUT = 120
+CALIBRATION_RERUNS = 15
+
+# Fixed workload every timing is divided by - a bit of everything a page rerun does
+CALIBRATION_APP = """
+import pandas as pd
+import streamlit as st
+
+st.sidebar.radio("Page", ["A", "B", "C"])
+df = pd.DataFrame({"a": range(50_000), "b": [i % 7 for i in range(50_000)]})
+for i in range(150):
+    st.markdown(f"<div style='color: white;'>row {i}</div>", unsafe_allow_html=True)
+st.dataframe(df.groupby("b").agg(["sum", "mean"]))
+st.dataframe(df.head(500))
+cols = st.columns(6)
+for i, col in enumerate(cols):
+    col.button(str(i + 1), key=f"calibration_{i}")
+"""
+
+
+class Recorder:
+    """Wraps an AppTest and measures every rerun it triggers after setup"""
+
+    def __init__(self, trace_alloc):
+        self.at = AppTest.from_file(APP, default_timeout=APP_TIMEOUT)
+        self.trace_alloc = trace_alloc
+        self.recording = False
+        self.times, self.allocs, self.payloads = [], [], []
+
+    def run(self, widget=None):
+        """Rerun (through widget if given, e.g. a clicked button) and record it"""
+        if self.trace_alloc:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        (widget or self.at).run()
+        elapsed = time.perf_counter() - start
+        if self.at.exception:
+            raise RuntimeError(f"App raised: {self.at.exception[0].value}")
+        if self.recording:
+            self.times.append(elapsed)
+            self.payloads.append(payload_bytes(self.at.main) + payload_bytes(self.at.sidebar))
+            if self.trace_alloc:
+                self.allocs.append(tracemalloc.get_traced_memory()[1] - before)
+        return self.at
+
+    # Helpers for scripting a game
+    def click(self, label=None, key=None):
+        """Click the button with this label and/or key"""
+        button = next(b for b in self.at.button if label in (None, b.label) and key in (None, b.key))
+        return self.run(button.click())
+
+    def nav(self, page):
+        return self.run(self.at.sidebar.radio[0].set_value(page))
+
+
+def payload_bytes(node):
+    """Serialized size of every element under a block of the public element tree"""
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if proto is not None else 0
+    for child in getattr(node, "children", {}).values():
+        size += payload_bytes(child)
+    return size
+
+
+# --- SCENARIOS ---
+# Each one does its setup with recording off, then plays a scripted game with it on.
+def home(rec):
+    rec.run()
+    rec.recording = True
+    for _ in range(20):
+        rec.run()
+
+
+def golf(rec):
+    rec.run()
+    rec.nav("Golf")
+    rec.recording = True
+    for hole in range(18):
+        for player in range(2):
+            rec.click(str(3 + (hole + player) % 3))
+    rec.click("UNDO")
+    rec.click("REDO")
+
+
+def golf_skins_6p(rec):
+    rec.run()
+    rec.nav("Golf")
+    rec.run(rec.at.sidebar.slider[0].set_value(6))
+    rec.run(rec.at.sidebar.selectbox[1].set_value("Skins"))
+    rec.run(rec.at.sidebar.toggle(key="golf_odds_toggle").set_value(True))  # Monte Carlo odds after every score
+    rec.recording = True
+    for hole in range(4):
+        for player in range(6):
+            rec.click(str(2 + (hole * player) % 4))
+
+
+def cricket(rec):
+    rec.run()
+    rec.nav("KO Cricket")
+    rec.click("🎲 Start New Game")
+    rec.recording = True
+    game = rec.at.session_state.cricket_game
+    for _ in range(40):
+        # P1 goes for triples, everyone else singles; nobody throws KOs (a skip waits on a timer)
+        num = next((n for n in CRICKET_NUMBERS if game.can_hit(n)), None)
+        if game.game_over or num is None:
+            break
+        if game.dart_count == 2 and game.current_player_idx:
+            rec.click(key="next_player")
+            continue
+        if game.current_player_idx == 0:
+            rec.click(key="mult3")
+        rec.click(key=f"num_{num}")
+    rec.click(key="undo")
+
+
+def rumble(rec):
+    rec.run()
+    rec.nav("Royal Rumble")
+    rec.run(rec.at.slider[0].set_value(6))
+    rec.click("START ROYAL RUMBLE!")
+    rec.recording = True
+    game = rec.at.session_state.rumble_game
+    for turn in range(30):
+        # Hit the first number in the ring that isn't the thrower's own
+        target = next((n for n in range(1, 21) if game.owner_of(n) not in (None, game.current)), None)
+        if game.game_over or target is None:
+            break
+        rec.click(key=f"num_{target}")
+        if turn % 3 == 2:
+            rec.click("Next Player")
+    rec.click("Undo")
+
+
+def stats_golf(rec):
+    rec.run()
+    rec.nav("Stats Dashboard")
+    rec.recording = True
+    rec.run(rec.at.sidebar.multiselect[0].set_value(["Brad", "Natalia"]))
+    rec.run(rec.at.sidebar.multiselect[1].set_value(["Home", "Cake House"]))
+    for players in (["Brad"], ["Brad", "Cake", "Smokey"], ["Natalia", "Mullet"]):
+        rec.run(rec.at.sidebar.multiselect[0].set_value(players))
+        rec.run()
+
+
+def stats_cricket(rec):
+    rec.run()
+    rec.nav("Stats Dashboard")
+    rec.run(rec.at.radio[0].set_value("Cricket KO"))
+    rec.recording = True
+    for _ in range(10):
+        rec.run()
+
+
+SCENARIOS = {
+    "home": home, "golf": golf, "golf_skins_6p": golf_skins_6p, "cricket": cricket,
+    "rumble": rumble, "stats_golf": stats_golf, "stats_cricket": stats_cricket
+}
+
+
+# --- RUNNING ---
+def run_scenario(name, trace_alloc):
+    random.seed(0)  # Shuffled KO numbers / entry order come out the same every run
+    np.random.seed(0)
+    rec = Recorder(trace_alloc)
+    SCENARIOS[name](rec)
+    return rec
+
+
+def calibrate():
+    """Median rerun time (ms) of CALIBRATION_APP on this machine"""
+    at = AppTest.from_string(CALIBRATION_APP, default_timeout=APP_TIMEOUT).run()  # Warm up
+    times = []
+    for _ in range(CALIBRATION_RERUNS):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def summarize(timed, traced, calibration_ms):
+    ms = sorted(t * 1000 for t in timed.times)
+    median, p95 = statistics.median(ms), ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    return {
+        "reruns": len(ms),
+        "calibration_ms": round(calibration_ms, 1),
+        "median_ms": round(median, 1),
+        "p95_ms": round(p95, 1),
+        "max_ms": round(ms[-1], 1),
+        "median_x": round(median / calibration_ms, 2),
+        "p95_x": round(p95 / calibration_ms, 2),
+        "peak_alloc_kb": round(statistics.median(traced.allocs) / 1024, 1),
+        "payload_kb": round(statistics.median(timed.payloads) / 1024, 1),
+    }
+
+
+def regressions(name, result, baseline):
+    """Metrics over their baseline allowance, as messages"""
+    found = []
+    limits = {"median_x": TIME_TOLERANCE, "p95_x": TIME_TOLERANCE,
+              "peak_alloc_kb": SIZE_TOLERANCE, "payload_kb": SIZE_TOLERANCE}
+    for metric, tolerance in limits.items():
+        allowed = baseline[metric] * (1 + tolerance)
+        if result[metric] > allowed:
+            found.append(f"{name}: {metric} {result[metric]} > {allowed:.2f} (baseline {baseline[metric]})")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rerun latency of every page of the app")
+    parser.add_argument("scenarios", nargs="*", help=f"any of {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument("--golf-matches", type=int, default=500, help="synthetic golf matches in history")
+    parser.add_argument("--cricket-matches", type=int, default=500, help="synthetic cricket matches in history")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true", help="save these results as the new baseline")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    logging.disable(logging.WARNING)  # Streamlit's per-rerun deprecation warnings would bury the results
+    workdir = tempfile.mkdtemp(prefix="darts-bench-")
+    for name in ("profiles.txt", "venues.txt"):
+        shutil.copy(os.path.join(ROOT, name), workdir)
+    os.chdir(workdir)  # The app reads profiles and match history from the working directory
+    write_history(MATCH_DB_FILE, args.golf_matches, args.cricket_matches)
+
+    results = {}
+    try:
+        for name in names:
+            calibration_ms = calibrate()
+            timed = run_scenario(name, trace_alloc=False)
+            tracemalloc.start()
+            traced = run_scenario(name, trace_alloc=True)
+            tracemalloc.stop()
+            results[name] = summarize(timed, traced, calibration_ms)
+            r = results[name]
+            print(f"{name:<15} {r['reruns']:>4} reruns  calibration {calibration_ms:>5.1f} ms  median {r['median_ms']:>7.1f} ms ({r['median_x']:>5.2f}x)  "
+                  f"p95 {r['p95_ms']:>7.1f} ms ({r['p95_x']:>5.2f}x)  "
+                  f"alloc {r['peak_alloc_kb']:>8.1f} KB  payload {r['payload_kb']:>6.1f} KB")
+    finally:
+        os.chdir(ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        # Only machine independent numbers go in the baseline
+        for name, r in results.items():
+            baseline[name] = {metric: r[metric] for metric in ("reruns", "median_x", "p95_x", "peak_alloc_kb", "payload_kb")}
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline yet - run with --update-baseline to record one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    failures = [msg for name in results if name in baseline for msg in regressions(name, results[name], baseline[name])]
+    for msg in failures:
+        print(f"REGRESSION {msg}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
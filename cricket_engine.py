@@ -0,0 +1,458 @@
+import random
+from dataclasses import dataclass, field
+from datetime import datetime
+
+CRICKET_NUMBERS = [20, 19, 18, 17, 16, 15, 'B', 'T', 'D']
+NUMBER_INDEX = {num: i for i, num in enumerate(CRICKET_NUMBERS)}  # Board array position of each number
+
+CRICKET_MODES = ["Singles Match (1v1)", "Tag Team (2v2)", "Triple Threat (1v1v1)", "Fatal 4 Way (1v1v1v1)"]
+MODE_PLAYERS = {
+    "Singles Match (1v1)": 2,
+    "Tag Team (2v2)": 4,
+    "Triple Threat (1v1v1)": 3,
+    "Fatal 4 Way (1v1v1v1)": 4
+}
+
+MARKS_TO_CLOSE = 3
+KO_HITS_TO_ELIMINATE = 3
+PIN_TO_WIN = 3
+DARTS_PER_TURN = 3
+
+# Kinds of dart apply_dart() understands
+NUMBER, KO, PIN, MISS = "number", "ko", "pin", "miss"
+# Journal-only events: the Next Player button and a KO'd player losing their turn
+NEXT, SKIP = "next", "skip"
+
+
+def players_for_mode(game_mode):
+    return MODE_PLAYERS[game_mode]
+
+
+def number_label(num):
+    return "BULL" if num == 'B' else ("TRIP" if num == 'T' else ("DBL" if num == 'D' else str(num)))
+
+
+def update_pin_count(current_pin, player_idx, player_board_closed):
+    """
+    Update pin count when PIN button is pressed.
+    Player 0 (P1) moves in positive direction (+1, +2, +3)
+    Player 1 (P2) moves in negative direction (-1, -2, -3)
+
+    Logic:
+    - Can always reverse opponent's pin (move toward 0)
+    - Can only advance in YOUR direction if YOUR board is closed
+    """
+    if player_idx == 0:  # Player 1 (positive direction)
+        if current_pin >= 0:
+            # Moving in our direction - need board closed
+            if player_board_closed:
+                return current_pin + 1
+            else:
+                return current_pin  # Can't advance without closed board
+        else:
+            # Reversing opponent's pin - always allowed
+            return current_pin + 1
+    else:  # Player 2 (negative direction)
+        if current_pin <= 0:
+            # Moving in our direction - need board closed
+            if player_board_closed:
+                return current_pin - 1
+            else:
+                return current_pin  # Can't advance without closed board
+        else:
+            # Reversing opponent's pin - always allowed
+            return current_pin - 1
+
+
+@dataclass
+class DartResult:
+    """What a dart did, so the UI knows which banner (if any) to show"""
+    turn_over: bool = False
+    perfect_turn: bool = False
+    eliminated: int = None  # Player knocked out by this dart
+    game_over: bool = False
+
+
+@dataclass
+class DartEvent:
+    """One journal entry - what was thrown and every value it changed.
+
+    changes holds (list, index, old, new) for list cells and (None, attribute, old, new)
+    for plain attributes, in the order they were written.
+    """
+    kind: str
+    player: int
+    target: object = None
+    multiplier: int = 1
+    changes: list = field(default_factory=list)
+
+
+class CricketKOGame:
+    """KO Cricket rules with no UI - 1v1, Tag Team, Triple Threat and Fatal 4 Way.
+
+    Players are indexes (0 = P1). Each board is a fixed-size list of marks indexed by
+    CRICKET_NUMBERS position; tag teams share board 0 (P1+P2) and board 1 (P3+P4).
+    A board is closed when its count of closed numbers reaches len(CRICKET_NUMBERS),
+    tracked incrementally as marks are added.
+    """
+
+    def __init__(self, player_names, game_mode, venue='Home', ko_numbers=None, rng=None):
+        if game_mode not in MODE_PLAYERS:
+            raise ValueError(f"Unknown cricket mode: {game_mode}")
+        num_players = MODE_PLAYERS[game_mode]
+        if len(player_names) != num_players:
+            raise ValueError(f"{game_mode} needs {num_players} players")
+
+        if ko_numbers is None:
+            available = list(range(1, 21))
+            (rng or random).shuffle(available)
+            ko_numbers = available[:num_players]
+
+        self.num_players = num_players
+        self.player_names = list(player_names)
+        self.game_mode = game_mode
+        self.is_tag_team = "Tag Team" in game_mode
+        self.venue = venue
+        self.start_time = datetime.now()
+        self.ko_numbers = list(ko_numbers)
+
+        # Boards
+        num_boards = 2 if self.is_tag_team else num_players
+        self.boards = [[0] * len(CRICKET_NUMBERS) for _ in range(num_boards)]
+        self.numbers_closed = [0] * num_boards
+        self.boards_closed = 0  # How many boards are fully closed
+
+        # Per-player state
+        self.ko_skipped = [False] * num_players
+        self.consecutive_skips = [0] * num_players
+        self.eliminated = [False] * num_players
+        self.ko_elimination_progress = [0] * num_players
+        self.active_players = num_players
+
+        # Current turn
+        self.current_player_idx = 0
+        self.dart_count = 0
+        self.marks_per_dart = [0] * DARTS_PER_TURN
+        self.dart_hits = [''] * DARTS_PER_TURN
+        self.pin_count = 0
+        self.game_over = False
+        self.winner = None
+
+        # Stats tracking
+        self.total_darts = [0] * num_players
+        self.total_marks = [0] * num_players
+        self.ko_hits_given = [0] * num_players
+        self.ko_hits_received = [0] * num_players
+        self.eliminations = [0] * num_players
+        self.pin_attempts = [0] * num_players
+        self.darts_to_close = [None] * num_players
+        self.board_close_dart_count = [0] * num_players
+
+        # Undo/redo journal of DartEvents
+        self.journal = []
+        self.redo_stack = []
+        self._event = None
+
+    # --- BOARD QUERIES ---
+    def board_index(self, player):
+        if self.is_tag_team:
+            return 0 if player < 2 else 1
+        return player
+
+    def marks(self, player, num):
+        return self.boards[self.board_index(player)][NUMBER_INDEX[num]]
+
+    def board_marks(self, player):
+        return sum(self.boards[self.board_index(player)])
+
+    def is_board_closed(self, player):
+        return self.numbers_closed[self.board_index(player)] == len(CRICKET_NUMBERS)
+
+    def any_board_closed(self):
+        return self.boards_closed > 0
+
+    def in_elimination_phase(self):
+        return self.any_board_closed() and self.active_players > 2 and not self.is_tag_team
+
+    # --- WHAT CAN BE THROWN ---
+    def can_hit(self, num):
+        player = self.current_player_idx
+        return not (
+            self.game_over or
+            self.eliminated[player] or
+            self.ko_skipped[player] or
+            self.is_board_closed(player) or
+            self.marks(player, num) >= MARKS_TO_CLOSE
+        )
+
+    def can_ko(self, target):
+        if self.game_over or target == self.current_player_idx or self.eliminated[target]:
+            return False
+        if self.in_elimination_phase():
+            return True
+        return not self.ko_skipped[target] and self.consecutive_skips[target] < 1
+
+    def pin_available(self):
+        """PIN only shows once down to 2 active players (or tag team) and a board is closed"""
+        return (self.active_players == 2 or self.is_tag_team) and self.any_board_closed()
+
+    def can_pin(self):
+        return not self.game_over and self.pin_available() and not self.ko_skipped[self.current_player_idx]
+
+    def current_is_skipped(self):
+        return self.ko_skipped[self.current_player_idx]
+
+    # --- THROWING ---
+    def apply_dart(self, kind, target=None, multiplier=1):
+        """Throw one dart for the current player.
+
+        kind is NUMBER (target = a CRICKET_NUMBERS entry, multiplier 1-3), KO (target = player
+        index), PIN or MISS. Raises ValueError for a dart the rules don't allow right now.
+        """
+        player = self.current_player_idx
+        if kind == NUMBER:
+            if not self.can_hit(target):
+                raise ValueError(f"Can't hit {target} right now")
+            if multiplier not in (1, 2, 3):
+                raise ValueError("Multiplier must be 1, 2 or 3")
+        elif kind == KO:
+            if not self.can_ko(target):
+                raise ValueError(f"Can't KO player {target} right now")
+        elif kind == PIN:
+            if not self.can_pin():
+                raise ValueError("Can't PIN right now")
+        elif kind == MISS:
+            if self.game_over:
+                raise ValueError("Game is over")
+        else:
+            raise ValueError(f"Unknown dart kind: {kind}")
+
+        self._begin(kind, player, target, multiplier)
+        if kind == NUMBER:
+            self._hit_number(player, target, multiplier)
+            result = self._after_dart(player)
+        elif kind == KO:
+            result = self._hit_ko(player, target)
+        elif kind == PIN:
+            result = DartResult(game_over=True) if self._hit_pin(player) else self._after_dart(player)
+        else:
+            self._miss(player)
+            result = self._after_dart(player)
+        self._commit()
+        return result
+
+    def _record(self, label, marks):
+        self._put(self.dart_hits, self.dart_count, label)
+        self._put(self.marks_per_dart, self.dart_count, marks)
+        self._set('dart_count', self.dart_count + 1)
+
+    def _hit_number(self, player, num, multiplier):
+        board = self.board_index(player)
+        pos = NUMBER_INDEX[num]
+        self._add(self.total_darts, player)
+        self._add(self.total_marks, player, multiplier)
+
+        # Cap marks at 3 - no extra points in Cricket KO
+        before = self.boards[board][pos]
+        self._put(self.boards[board], pos, min(before + multiplier, MARKS_TO_CLOSE))
+        prefix = "" if multiplier == 1 else ("D" if multiplier == 2 else "T")
+        self._record(f"{prefix}{number_label(num)}", multiplier)
+        self._put(self.consecutive_skips, player, 0)
+
+        # Closed this number just now - maybe the whole board too
+        if before < MARKS_TO_CLOSE <= self.boards[board][pos]:
+            self._add(self.numbers_closed, board)
+            if self.numbers_closed[board] == len(CRICKET_NUMBERS):
+                self._set('boards_closed', self.boards_closed + 1)
+                if self.darts_to_close[player] is None:
+                    self._put(self.darts_to_close, player, self.board_close_dart_count[player] + 1)
+
+        if not self.is_board_closed(player):
+            self._add(self.board_close_dart_count, player)
+
+    def _hit_ko(self, player, target):
+        result = DartResult()
+        self._add(self.total_darts, player)
+        self._add(self.ko_hits_given, player)
+        self._add(self.ko_hits_received, target)
+
+        if self.in_elimination_phase() and self.is_board_closed(player):
+            self._add(self.ko_elimination_progress, target)
+            self._record(f"KO{self.ko_numbers[target]}", 0)
+            if self.ko_elimination_progress[target] >= KO_HITS_TO_ELIMINATE:
+                self._put(self.eliminated, target, True)
+                self._set('active_players', self.active_players - 1)
+                self._add(self.eliminations, player)
+                result.eliminated = target
+        else:
+            self._put(self.ko_skipped, target, True)
+            self._add(self.consecutive_skips, target)
+            self._record(f"KO{self.ko_numbers[target]}", 0)
+
+        # A KO dart never counts toward "darts back"
+        if self.dart_count >= DARTS_PER_TURN:
+            self._put(self.consecutive_skips, player, 0)
+            self._advance()
+            result.turn_over = True
+        return result
+
+    def _hit_pin(self, player):
+        self._add(self.total_darts, player)
+        self._add(self.pin_attempts, player)
+
+        # Tag team pins by team direction: T1 (P1+P2) = 0, T2 (P3+P4) = 1
+        direction = self.board_index(player) if self.is_tag_team else player
+        self._set('pin_count', update_pin_count(self.pin_count, direction, self.is_board_closed(player)))
+        self._record("PIN", 0)  # Doesn't count toward "darts back"
+        self._put(self.consecutive_skips, player, 0)
+
+        if abs(self.pin_count) >= PIN_TO_WIN:
+            self._set('game_over', True)
+            self._set('winner', player)
+        return self.game_over
+
+    def _miss(self, player):
+        self._add(self.total_darts, player)
+        if not self.is_board_closed(player):
+            self._add(self.board_close_dart_count, player)
+        self._record("MISS", 0)
+        self._put(self.consecutive_skips, player, 0)
+
+    def _after_dart(self, player):
+        if self.dart_count < DARTS_PER_TURN:
+            return DartResult()
+        if all(m > 0 for m in self.marks_per_dart):
+            # Darts back! Same player throws again
+            self._reset_turn()
+            return DartResult(perfect_turn=True)
+        self._put(self.consecutive_skips, player, 0)
+        self._advance()
+        return DartResult(turn_over=True)
+
+    # --- TURN ORDER ---
+    def _reset_turn(self):
+        self._set('dart_count', 0)
+        for i in range(DARTS_PER_TURN):
+            self._put(self.dart_hits, i, '')
+            self._put(self.marks_per_dart, i, 0)
+
+    def _advance(self):
+        """Unused darts count as misses, then rotate to the next player"""
+        player = self.current_player_idx
+        self._add(self.total_darts, player, DARTS_PER_TURN - self.dart_count)
+        self._reset_turn()
+
+        if self.is_tag_team:
+            # Alternate teams: P1 -> P3 -> P2 -> P4
+            self._set('current_player_idx', {0: 2, 2: 1, 1: 3, 3: 0}[player])
+        else:
+            next_idx = (player + 1) % self.num_players
+            while self.eliminated[next_idx]:
+                next_idx = (next_idx + 1) % self.num_players
+            self._set('current_player_idx', next_idx)
+
+    def next_player(self):
+        """'Next Player' button - remaining darts are misses and the turn passes"""
+        player = self.current_player_idx
+        self._begin(NEXT, player)
+        while self.dart_count < DARTS_PER_TURN:
+            self._record("MISS", 0)
+            self._add(self.total_darts, player)
+        self._advance()
+        self._put(self.consecutive_skips, player, 0)
+        self._commit()
+
+    def resolve_skip(self):
+        """The skipped player's countdown ran out - their turn is lost"""
+        player = self.current_player_idx
+        self._begin(SKIP, player)
+        self._put(self.ko_skipped, player, False)
+        self._advance()
+        self._commit()
+
+    # --- JOURNAL ---
+    # Every state change goes through _put/_add/_set, which log the old and new value into
+    # the event being built, so an event can be inverted (undo) or re-applied (redo) exactly.
+    def _begin(self, kind, player, target=None, multiplier=1):
+        self._event = DartEvent(kind, player, target, multiplier)
+
+    def _commit(self):
+        self.journal.append(self._event)
+        self.redo_stack.clear()
+        self._event = None
+
+    def _put(self, values, idx, value):
+        self._event.changes.append((values, idx, values[idx], value))
+        values[idx] = value
+
+    def _add(self, values, idx, amount=1):
+        self._put(values, idx, values[idx] + amount)
+
+    def _set(self, attr, value):
+        self._event.changes.append((None, attr, getattr(self, attr), value))
+        setattr(self, attr, value)
+
+    def _revert(self, event):
+        for values, idx, old, _ in reversed(event.changes):
+            if values is None:
+                setattr(self, idx, old)
+            else:
+                values[idx] = old
+
+    def _replay(self, event):
+        for values, idx, _, new in event.changes:
+            if values is None:
+                setattr(self, idx, new)
+            else:
+                values[idx] = new
+
+    def undo(self):
+        """Roll back the last dart (or Next Player). Returns False if there is nothing to undo.
+
+        A lost turn (SKIP) is undone together with the throw before it - otherwise the skip
+        countdown would just resolve it again.
+        """
+        if not any(event.kind != SKIP for event in reversed(self.journal)):
+            return False
+        while True:
+            event = self.journal.pop()
+            self._revert(event)
+            self.redo_stack.append(event)
+            if event.kind != SKIP:
+                return True
+
+    def redo(self):
+        """Re-apply the last undone dart, plus any lost turns that followed it"""
+        if not self.redo_stack:
+            return False
+        event = self.redo_stack.pop()
+        self._replay(event)
+        self.journal.append(event)
+        while self.redo_stack and self.redo_stack[-1].kind == SKIP:
+            event = self.redo_stack.pop()
+            self._replay(event)
+            self.journal.append(event)
+        return True
+
+    def can_undo(self):
+        return any(event.kind != SKIP for event in reversed(self.journal))
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    # --- RESULTS ---
+    def placements(self):
+        """Player indexes in finishing order"""
+        if self.winner is not None:
+            # Sort others by: not eliminated, then by marks, then by darts
+            others = [
+                (i, not self.eliminated[i], self.board_marks(i), -self.total_darts[i])
+                for i in range(self.num_players) if i != self.winner
+            ]
+            others.sort(key=lambda x: (x[1], x[2], x[3]), reverse=True)
+            return [self.winner] + [x[0] for x in others]
+
+        # Game not finished, rank by marks
+        rankings = [(i, self.board_marks(i), -self.total_darts[i]) for i in range(self.num_players)]
+        rankings.sort(key=lambda x: (x[1], x[2]), reverse=True)
+        return [x[0] for x in rankings]
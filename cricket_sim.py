@@ -0,0 +1,242 @@
+import argparse
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from cricket_engine import (
+    CricketKOGame, CRICKET_MODES, CRICKET_NUMBERS, MODE_PLAYERS, NUMBER, KO, PIN, MISS, update_pin_count
+)
+from match_history import prepare_cricket_history
+from match_store import MATCH_DB_FILE, SQLiteMatchStore
+
+MULTIPLIER_WEIGHTS = (0.7, 0.2, 0.1)  # Single / double / triple, given a dart lands on its number
+MEAN_MULTIPLIER = sum((i + 1) * w for i, w in enumerate(MULTIPLIER_WEIGHTS))
+DEFAULT_MARKS_PER_DART = 0.8
+SKILL_PRIOR_DARTS = 200  # Pseudo-darts pulling a player's marks per dart toward everyone's
+KO_LEAD = 3  # Bots KO an opponent whose board is this many marks ahead of theirs
+MAX_DARTS = 3000  # A game still going after this many darts is recorded as unfinished
+BATCH_GAMES = 500  # Games per worker task
+MAX_SEATS = 4
+
+
+@dataclass
+class BotSkill:
+    """How often a bot's dart lands where it was aimed (number, KO number or PIN alike)"""
+    name: str
+    hit: float
+
+
+# --- FITTING ---
+def fit_bot_skills(history, players=None):
+    """BotSkill per player from Cricket_Matches history (typed, see prepare_cricket_history).
+
+    Marks per dart is shrunk toward the pooled rate, then turned into a hit rate using the
+    multiplier mix in MULTIPLIER_WEIGHTS. Players with no history get the pooled rate.
+    """
+    if history.empty:
+        pooled = DEFAULT_MARKS_PER_DART
+        totals = pd.DataFrame(columns=['Total_Marks', 'Total_Darts'])
+    else:
+        totals = history.groupby('Player')[['Total_Marks', 'Total_Darts']].sum()
+        pooled = totals['Total_Marks'].sum() / max(totals['Total_Darts'].sum(), 1)
+    players = players if players is not None else list(totals.index)
+    skills = []
+    for name in players:
+        marks, darts = totals.loc[name] if name in totals.index else (0, 0)
+        mpd = (marks + SKILL_PRIOR_DARTS * pooled) / (darts + SKILL_PRIOR_DARTS)
+        skills.append(BotSkill(name, float(np.clip(mpd / MEAN_MULTIPLIER, 0.05, 0.95))))
+    return skills
+
+
+# --- BOT ---
+def _is_opponent(game, player, other):
+    return other != player and (not game.is_tag_team or game.board_index(other) != game.board_index(player))
+
+
+def choose_dart(game):
+    """(kind, target) a bot aims for with the current player's next dart - (MISS, None) if nothing helps"""
+    player = game.current_player_idx
+    closed = game.is_board_closed(player)
+
+    if game.can_pin():
+        direction = game.board_index(player) if game.is_tag_team else player
+        sign = 1 if direction == 0 else -1
+        if (update_pin_count(game.pin_count, direction, closed) - game.pin_count) * sign > 0:
+            return PIN, None
+
+    opponents = [i for i in range(game.num_players) if _is_opponent(game, player, i) and game.can_ko(i)]
+    if closed and game.in_elimination_phase() and opponents:
+        # Finish off whoever is closest to elimination
+        return KO, max(opponents, key=lambda i: game.ko_elimination_progress[i])
+    opponents = [i for i in opponents if not game.ko_skipped[i]]  # A second skip on the same turn is a wasted dart
+    if opponents:
+        leader = max(opponents, key=game.board_marks)
+        if game.board_marks(leader) - game.board_marks(player) >= KO_LEAD:
+            return KO, leader
+
+    for num in CRICKET_NUMBERS:
+        if game.can_hit(num):
+            return NUMBER, num
+    return MISS, None
+
+
+def play_game(game, skills, rng, max_darts=MAX_DARTS):
+    """Bots play the game out. Returns (darts, turns) thrown."""
+    darts = turns = 0
+    while not game.game_over and darts < max_darts:
+        if game.current_is_skipped():
+            game.resolve_skip()
+            turns += 1
+            continue
+        kind, target = choose_dart(game)
+        if kind == MISS or rng.random() >= skills[game.current_player_idx].hit:
+            result = game.apply_dart(MISS)
+        elif kind == NUMBER:
+            result = game.apply_dart(NUMBER, target, rng.choices((1, 2, 3), MULTIPLIER_WEIGHTS)[0])
+        else:
+            result = game.apply_dart(kind, target)
+        darts += 1
+        turns += result.turn_over or result.perfect_turn
+    return darts, turns
+
+
+# --- BATCHES ---
+def _play_batch(task):
+    """Worker: play `games` games of one mode and return columns (dict of numpy arrays)"""
+    mode, skills, games, seed = task
+    rng = random.Random(seed)
+    names = [s.name for s in skills]
+    cols = {
+        'winner': np.full(games, -1, dtype=np.int8),  # Seat index, -1 if unfinished
+        'darts': np.zeros(games, dtype=np.int32),
+        'turns': np.zeros(games, dtype=np.int32),
+        'ko_hits': np.zeros(games, dtype=np.int16),
+        'eliminations': np.zeros(games, dtype=np.int8),
+        'pin_attempts': np.zeros(games, dtype=np.int16),
+        'first_closer': np.full(games, -1, dtype=np.int8),
+    }
+    for seat in range(MAX_SEATS):
+        cols[f'ko_{seat + 1}'] = np.zeros(games, dtype=np.int8)  # 0 for an empty seat
+
+    for g in range(games):
+        game = CricketKOGame(names, mode, rng=rng)
+        cols['darts'][g], cols['turns'][g] = play_game(game, skills, rng)
+        if game.winner is not None:
+            cols['winner'][g] = game.winner
+        cols['ko_hits'][g] = sum(game.ko_hits_given)
+        cols['eliminations'][g] = sum(game.eliminations)
+        cols['pin_attempts'][g] = sum(game.pin_attempts)
+        closers = [i for i in range(game.num_players) if game.darts_to_close[i] is not None]
+        if closers:
+            cols['first_closer'][g] = min(closers, key=lambda i: game.darts_to_close[i])
+        for seat, number in enumerate(game.ko_numbers):
+            cols[f'ko_{seat + 1}'][g] = number
+    return mode, cols
+
+
+def simulate_games(games, modes=CRICKET_MODES, skills=None, workers=None, seed=0):
+    """Play `games` bot games of each mode across `workers` processes (default: every core).
+
+    skills is a list of BotSkill per seat (repeated/truncated to fit each mode), defaulting to
+    one pooled-average bot everywhere so results show the rules rather than the players.
+    Returns one row per game as a DataFrame built from columnar batches.
+    """
+    skills = skills or [BotSkill("Bot", DEFAULT_MARKS_PER_DART / MEAN_MULTIPLIER)]
+    tasks = []
+    for mode in modes:
+        seats = [skills[i % len(skills)] for i in range(MODE_PLAYERS[mode])]
+        for start in range(0, games, BATCH_GAMES):
+            tasks.append((mode, seats, min(BATCH_GAMES, games - start), seed + len(tasks)))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        batches = list(map(_play_batch, tasks))
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            batches = list(pool.map(_play_batch, tasks, chunksize=max(1, len(tasks) // (workers * 8))))
+
+    frames = []
+    for mode, cols in batches:
+        frame = pd.DataFrame(cols)
+        frame.insert(0, 'mode', mode)
+        frames.append(frame)
+    results = pd.concat(frames, ignore_index=True)
+    results['mode'] = results['mode'].astype('category')
+    return results
+
+
+# --- REPORT ---
+def balance_report(results):
+    """Per mode: game length, first-player edge and KO number fairness.
+
+    first_player_edge is P1's win rate minus a fair share (P1's team in tag team).
+    ko_number_chi2 is the chi-square per degree of freedom of win rate by KO number - around 1
+    when the number a player draws doesn't matter, well above 1 when it does.
+    """
+    rows = []
+    for mode, games in results.groupby('mode', observed=True):
+        seats = MODE_PLAYERS[mode]
+        finished = games[games['winner'] >= 0]
+        if "Tag Team" in mode:
+            # Teams share a board - P1+P2 vs P3+P4
+            p1_share, p1_wins = 0.5, finished['winner'].isin([0, 1]).mean()
+            closer_won = finished['winner'] // 2 == finished['first_closer'] // 2
+        else:
+            p1_share, p1_wins = 1 / seats, (finished['winner'] == 0).mean()
+            closer_won = finished['winner'] == finished['first_closer']
+
+        # Every (seat, KO number) in every finished game, and whether that seat won
+        numbers = np.concatenate([finished[f'ko_{s + 1}'].values for s in range(seats)])
+        won = np.concatenate([(finished['winner'] == s).values for s in range(seats)])
+        by_number = pd.DataFrame({'number': numbers, 'won': won}).groupby('number')['won'].agg(['sum', 'count'])
+        expected = by_number['count'] * won.mean()
+        chi2 = (((by_number['sum'] - expected) ** 2) / (expected * (1 - won.mean()))).sum() / max(len(by_number) - 1, 1)
+
+        rows.append({
+            'Mode': mode,
+            'Games': len(games),
+            'Finished_Pct': round(100 * len(finished) / len(games), 2),
+            'Mean_Darts': round(games['darts'].mean(), 1),
+            'Median_Turns': games['turns'].median(),
+            'P1_Win_Pct': round(100 * p1_wins, 2),
+            'First_Player_Edge': round(p1_wins - p1_share, 4),
+            'First_Closer_Win_Pct': round(100 * closer_won.mean(), 2),
+            'KO_Hits_Per_Game': round(games['ko_hits'].mean(), 2),
+            'KO_Number_Chi2': round(chi2, 2),
+        })
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play bot KO Cricket games in bulk and report on balance")
+    parser.add_argument("--games", type=int, default=10_000, help="games per mode")
+    parser.add_argument("--modes", nargs="+", choices=CRICKET_MODES, default=CRICKET_MODES)
+    parser.add_argument("--players", nargs="+", help="fit bots to these players' history (in seat order)")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: every core)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db", default=MATCH_DB_FILE, help="match history SQLite file")
+    parser.add_argument("--out", help="write the per-game table to this .csv or .parquet file")
+    args = parser.parse_args()
+
+    skills = None
+    if args.players:
+        history = prepare_cricket_history(SQLiteMatchStore(args.db).read("Cricket_Matches"))
+        skills = fit_bot_skills(history, args.players)
+        for skill in skills:
+            print(f"{skill.name}: hits {skill.hit:.0%} of darts")
+
+    start = datetime.now()
+    results = simulate_games(args.games, args.modes, skills, args.workers, args.seed)
+    elapsed = (datetime.now() - start).total_seconds()
+    print(balance_report(results).to_string(index=False))
+    print(f"{len(results):,} games in {elapsed:.1f}s ({len(results) / elapsed:,.0f} games/s)")
+    if args.out:
+        if args.out.endswith(".parquet"):
+            results.to_parquet(args.out, index=False)
+        else:
+            results.to_csv(args.out, index=False)
@@ -0,0 +1,72 @@
+import heapq
+import itertools
+import time
+
+
+class GameClock:
+    """Pausable game clock with a queue of events scheduled in game time.
+
+    Game time is seconds since the clock was created, not counting pauses. It is read from a
+    monotonic time source (time.monotonic unless another is passed in), so changing the
+    system clock can't skip or repeat events, and a fake time source can drive it in tests.
+    """
+
+    def __init__(self, time_source=time.monotonic):
+        self._time = time_source
+        self._start = time_source()
+        self._paused_for = 0.0  # Time source seconds spent paused
+        self.paused_at = None  # Game time the clock stopped at, while paused
+        self._events = []  # Heap of (due, seq, name) - seq keeps same-time events in schedule order
+        self._seq = itertools.count()
+
+    # --- TIME ---
+    def now(self):
+        """Current game time in seconds (frozen while paused)"""
+        if self.paused_at is not None:
+            return self.paused_at
+        return self._time() - self._start - self._paused_for
+
+    @property
+    def paused(self):
+        return self.paused_at is not None
+
+    def pause(self):
+        if self.paused_at is None:
+            self.paused_at = self.now()
+
+    def resume(self):
+        if self.paused_at is not None:
+            self._paused_for = self._time() - self._start - self.paused_at
+            self.paused_at = None
+
+    def wall_time(self, at):
+        """time.time() when game time `at` comes around - what the browser counts down to (None while paused)"""
+        if self.paused:
+            return None
+        return time.time() + (at - self.now())
+
+    # --- EVENTS ---
+    def schedule(self, name, at):
+        """Schedule `name` for game time `at`, replacing any pending event with that name"""
+        self.cancel(name)
+        heapq.heappush(self._events, (at, next(self._seq), name))
+
+    def cancel(self, name=None):
+        """Drop the pending event called `name` (or every pending event)"""
+        self._events = [e for e in self._events if name is not None and e[2] != name]
+        heapq.heapify(self._events)
+
+    def due_at(self, name):
+        """Game time `name` is scheduled for, or None"""
+        return next((at for at, _, pending in self._events if pending == name), None)
+
+    def next_due(self):
+        """Game time of the earliest pending event, or None"""
+        return self._events[0][0] if self._events else None
+
+    def pop_due(self):
+        """Take the earliest event that is due now as (at, name), or None. Never fires while paused."""
+        if self._events and not self.paused and self._events[0][0] <= self.now():
+            at, _, name = heapq.heappop(self._events)
+            return at, name
+        return None
@@ -0,0 +1,366 @@
+import uuid
+from collections import deque
+from dataclasses import dataclass
+
+GOLF_MODES = ["Stroke Play", "Match Play", "Skins"]
+MAX_PLAYERS = 6
+PAR = 4
+REGULATION_HOLES = 18
+TOTAL_HOLES = 20  # Holes 19-20 are the tie breaker
+UNDO_DEPTH = 500  # Plenty for a full round plus a long tie breaker
+CARDS = [(0, 9), (9, REGULATION_HOLES), (REGULATION_HOLES, TOTAL_HOLES)]  # OUT, IN, tie breaker
+HOLE_CARD = [next(c for c, (start, end) in enumerate(CARDS) if start <= h < end) for h in range(TOTAL_HOLES)]
+
+
+@dataclass
+class ScoreEdit:
+    """One submit() in the undo log - only the cells it changed and the turn state either side"""
+    cells: list  # [(player, hole, old, new)] in the order they were written
+    before: tuple  # _turn_state() before the submit
+    after: tuple  # ...and after
+
+
+def hole_result(scores, hole, num_players):
+    """(scores in, outright winner or None) for one hole - a winner needs 2+ scores and a unique best"""
+    hole_scores = [(scores[i][hole], i) for i in range(num_players) if scores[i][hole] is not None]
+    if len(hole_scores) < 2:
+        return len(hole_scores), None
+    best = min(hole_scores)
+    if sum(1 for score, _ in hole_scores if score == best[0]) > 1:
+        return len(hole_scores), None
+    return len(hole_scores), best[1]
+
+
+@dataclass
+class HolePayout:
+    """A finished regulation hole - who won it and how many skins were riding on it"""
+    hole: int
+    winner: int = None  # None if tied - the skins carry over to the next hole
+    skins: int = 1  # 1 + carryover
+
+
+class GolfStandings:
+    """Running totals and hole results for a GolfMatch, kept current one score at a time.
+
+    Every score written goes through update(), which adjusts that player's card totals and
+    re-checks just that hole - O(players). A hole only counts for Match Play and Skins once
+    every player has scored it. Holes finish in order, so each finished hole is pushed onto
+    payouts with the pot riding on it, and an undo pops it back off - O(1) per score either way.
+    """
+
+    def __init__(self, scores, num_players):
+        self.num_players = num_players
+        self.card_total = [[0] * len(CARDS) for _ in range(MAX_PLAYERS)]  # Strokes per card
+        self.card_played = [[0] * len(CARDS) for _ in range(MAX_PLAYERS)]  # Holes scored per card
+        self.hole_scored = [0] * REGULATION_HOLES
+        self.hole_winner = [None] * REGULATION_HOLES  # Outright winner once the hole is finished
+        self.finished = [False] * REGULATION_HOLES
+        self.match_wins = [0] * MAX_PLAYERS
+        self.skins = [0] * MAX_PLAYERS
+        self.payouts = []  # HolePayout per finished hole, in hole order
+        self.pot = 1  # Skins riding on the next hole to finish
+
+        for player, row in enumerate(scores):
+            for hole, score in enumerate(row):
+                self._count(player, hole, None, score)
+        for hole in range(REGULATION_HOLES):
+            self.hole_scored[hole], self.hole_winner[hole] = hole_result(scores, hole, num_players)
+            self.finished[hole] = self._is_finished(hole)
+            if self.finished[hole]:
+                self._push(hole)
+
+    def update(self, scores, player, hole, old, new):
+        """scores[player][hole] just changed from old to new"""
+        self._count(player, hole, old, new)
+        if hole >= REGULATION_HOLES or player >= self.num_players:
+            return
+        was_finished = self.finished[hole]
+        self.hole_scored[hole], self.hole_winner[hole] = hole_result(scores, hole, self.num_players)
+        self.finished[hole] = self._is_finished(hole)
+        if was_finished or self.finished[hole]:
+            self._reopen(hole)
+
+    def _is_finished(self, hole):
+        return self.num_players >= 2 and self.hole_scored[hole] == self.num_players
+
+    def _count(self, player, hole, old, new):
+        card = HOLE_CARD[hole]
+        self.card_total[player][card] += (new or 0) - (old or 0)
+        self.card_played[player][card] += (new is not None) - (old is not None)
+
+    def _reopen(self, hole):
+        """Re-settle from `hole` on. Normally it is the last hole to finish, so this pops/pushes one payout."""
+        later = []
+        while self.payouts and self.payouts[-1].hole >= hole:
+            later.append(self._pop().hole)
+        for h in sorted(set(later) | {hole}):
+            if self.finished[h]:
+                self._push(h)
+
+    def _push(self, hole):
+        winner = self.hole_winner[hole]
+        self.payouts.append(HolePayout(hole, winner, self.pot))
+        if winner is None:
+            self.pot += 1
+        else:
+            self.match_wins[winner] += 1
+            self.skins[winner] += self.pot
+            self.pot = 1
+
+    def _pop(self):
+        payout = self.payouts.pop()
+        if payout.winner is not None:
+            self.match_wins[payout.winner] -= 1
+            self.skins[payout.winner] -= payout.skins
+        self.pot = payout.skins
+        return payout
+
+
+class GolfMatch:
+    """Darts golf rules with no UI - Stroke Play, Match Play and Skins plus the 19-20 tie breaker.
+
+    Players are referred to by index (0 = P1). Score rows are kept for all six seats so
+    changing the player count mid-round (like the sidebar slider allows) keeps entered scores.
+    """
+
+    def __init__(self, num_players, mode="Stroke Play", tie_breaker=True, match_id=None, undo_depth=UNDO_DEPTH,
+                 skin_value=0):
+        if mode not in GOLF_MODES:
+            raise ValueError(f"Unknown golf mode: {mode}")
+        if not 1 <= num_players <= MAX_PLAYERS:
+            raise ValueError(f"Golf supports 1-{MAX_PLAYERS} players")
+        self.num_players = num_players
+        self.mode = mode
+        self.tie_breaker_enabled = tie_breaker
+        self.skin_value = skin_value  # Money per skin (0 = just count skins)
+        self.match_id = match_id or str(uuid.uuid4())[:8].upper()
+
+        self.scores = [[None] * TOTAL_HOLES for _ in range(MAX_PLAYERS)]
+        self.current_hole = 0
+        self.active_idx = 0
+        self.game_over = False
+        self.in_tie_breaker = False
+        self.tie_breaker_players = []
+
+        # Undo/redo logs - oldest edits fall off the undo log past undo_depth
+        self.undo_log = deque(maxlen=undo_depth)
+        self.redo_log = []
+        self._cells = None  # Cells written by the submit in progress
+
+        self.standings_cache = GolfStandings(self.scores, num_players)
+
+    # --- SETTINGS ---
+    def set_mode(self, mode):
+        if mode not in GOLF_MODES:
+            raise ValueError(f"Unknown golf mode: {mode}")
+        self.mode = mode
+
+    def set_num_players(self, num_players):
+        if not 1 <= num_players <= MAX_PLAYERS:
+            raise ValueError(f"Golf supports 1-{MAX_PLAYERS} players")
+        if num_players != self.num_players:
+            self.num_players = num_players
+            self.standings_cache = GolfStandings(self.scores, num_players)  # Who counts on each hole changed
+
+    # --- SCORING ---
+    def submit(self, score):
+        """Record a score for the active player on the current hole and move the turn along"""
+        if self.game_over:
+            raise ValueError("Match is over")
+        if score < 1:
+            raise ValueError("Score must be at least 1")
+
+        before = self._turn_state()
+        self._cells = []
+        self._set_score(self.active_idx, self.current_hole, score)
+
+        if self.in_tie_breaker:
+            self._advance_tie_breaker()
+        else:
+            self._advance_regulation()
+
+        self.undo_log.append(ScoreEdit(self._cells, before, self._turn_state()))
+        self._cells = None
+        self.redo_log.clear()
+
+    def undo(self):
+        """Roll back the last submitted score. Returns False if there is nothing to undo."""
+        if not self.undo_log:
+            return False
+        edit = self.undo_log.pop()
+        for player, hole, old, _ in reversed(edit.cells):
+            self._write(player, hole, old)
+        self._restore_turn_state(edit.before)
+        self.redo_log.append(edit)
+        return True
+
+    def redo(self):
+        """Re-apply the last undone score. Returns False if there is nothing to redo."""
+        if not self.redo_log:
+            return False
+        edit = self.redo_log.pop()
+        for player, hole, _, new in edit.cells:
+            self._write(player, hole, new)
+        self._restore_turn_state(edit.after)
+        self.undo_log.append(edit)
+        return True
+
+    def can_undo(self):
+        return bool(self.undo_log)
+
+    def can_redo(self):
+        return bool(self.redo_log)
+
+    def _set_score(self, player, hole, value):
+        self._cells.append((player, hole, self.scores[player][hole], value))
+        self._write(player, hole, value)
+
+    def _write(self, player, hole, value):
+        """The only place scores change, so the standings cache sees every edit"""
+        old = self.scores[player][hole]
+        self.scores[player][hole] = value
+        self.standings_cache.update(self.scores, player, hole, old, value)
+
+    def _turn_state(self):
+        # tie_breaker_players is always replaced, never mutated, so sharing the list is safe
+        return (self.current_hole, self.active_idx, self.game_over, self.in_tie_breaker, self.tie_breaker_players)
+
+    def _restore_turn_state(self, state):
+        self.current_hole, self.active_idx, self.game_over, self.in_tie_breaker, self.tie_breaker_players = state
+
+    # --- TURN ORDER ---
+    def _advance_regulation(self):
+        if self.active_idx < self.num_players - 1:
+            self.active_idx += 1
+        elif self.current_hole < REGULATION_HOLES - 1:
+            self.current_hole += 1
+            self.active_idx = 0
+        else:
+            self._finish_regulation()
+
+    def _finish_regulation(self):
+        """Finished hole 18 - go to the tie breaker if 2+ players share the lead"""
+        if not self.tie_breaker_enabled:
+            self.game_over = True
+            return
+        tied = self.leaders()
+        if len(tied) >= 2:
+            self.in_tie_breaker = True
+            self.tie_breaker_players = tied
+            self.current_hole = REGULATION_HOLES  # Hole 19
+            self.active_idx = tied[0]  # First-place player goes first
+        else:
+            self.game_over = True
+
+    def _advance_tie_breaker(self):
+        players = self.tie_breaker_players
+        pos = players.index(self.active_idx)
+
+        if self.current_hole == REGULATION_HOLES:  # Hole 19 - players go in order
+            if pos < len(players) - 1:
+                self.active_idx = players[pos + 1]
+            else:
+                self.current_hole = REGULATION_HOLES + 1
+                self.active_idx = players[-1]  # Hole 20 is reversed - last player goes first
+        else:  # Hole 20 - players go in reverse order
+            if pos > 0:
+                self.active_idx = players[pos - 1]
+            else:
+                self._finish_tie_breaker()
+
+    def _finish_tie_breaker(self):
+        """Best combined 19+20 wins, otherwise the still-tied players replay 19-20"""
+        tb_scores = {p: self.tie_breaker_total(p) for p in self.tie_breaker_players}
+        best = min(tb_scores.values())
+        still_tied = [p for p, s in tb_scores.items() if s == best]
+
+        if len(still_tied) == 1:
+            self.game_over = True
+            return
+        for p in still_tied:
+            self._set_score(p, REGULATION_HOLES, None)
+            self._set_score(p, REGULATION_HOLES + 1, None)
+        self.tie_breaker_players = still_tied
+        self.current_hole = REGULATION_HOLES
+        self.active_idx = still_tied[0]
+
+    # --- STANDINGS ---
+    # All read from standings_cache - nothing here rescans the scorecard
+    def hole_winners(self, hole):
+        """Players who won this hole outright (empty if tied, or - on holes 1-18 - until everyone has scored it)"""
+        if hole >= REGULATION_HOLES:
+            winner = hole_result(self.scores, hole, self.num_players)[1]
+        elif self.standings_cache.finished[hole]:
+            winner = self.standings_cache.hole_winner[hole]
+        else:
+            winner = None
+        return [] if winner is None else [winner]
+
+    def holes_won(self):
+        """Holes (Match Play) or skins (Skins, ties carry over) won on finished holes of the first 18"""
+        won = self.standings_cache.skins if self.mode == "Skins" else self.standings_cache.match_wins
+        return won[:self.num_players]
+
+    def skins_pot(self):
+        """(skins, money) riding on the next hole to finish"""
+        pot = self.standings_cache.pot
+        return pot, pot * self.skin_value
+
+    def payout_history(self):
+        """Finished holes in order - hole number, winner (None = carried over), skins and money"""
+        return [
+            {'hole': p.hole + 1, 'winner': p.winner, 'skins': p.skins, 'amount': p.skins * self.skin_value if p.winner is not None else 0}
+            for p in self.standings_cache.payouts
+        ]
+
+    def card_total(self, player, card):
+        """(strokes, holes scored) on one of CARDS"""
+        return self.standings_cache.card_total[player][card], self.standings_cache.card_played[player][card]
+
+    def regulation_total(self, player):
+        totals = self.standings_cache.card_total[player]
+        return totals[0] + totals[1]
+
+    def tie_breaker_total(self, player):
+        return self.standings_cache.card_total[player][2]
+
+    def leaders(self):
+        """Players sharing the lead after regulation: most holes/skins won, or lowest strokes"""
+        if self.mode == "Stroke Play":
+            totals = [self.regulation_total(i) for i in range(self.num_players)]
+            best = min(totals)
+        else:
+            totals = self.holes_won()
+            best = max(totals)
+        return [i for i, t in enumerate(totals) if t == best]
+
+    def winner(self):
+        """Index of the winner once the match is over (None while still playing)"""
+        if not self.game_over:
+            return None
+        if self.in_tie_breaker:
+            return min(self.tie_breaker_players, key=self.tie_breaker_total)
+        return self.leaders()[0]
+
+    def standings(self):
+        """Per-player summary used by the stat cards and scorecard totals"""
+        holes_won = self.holes_won() if self.mode != "Stroke Play" else None
+        rows = []
+        for i in range(self.num_players):
+            played = self.standings_cache.card_played[i][0] + self.standings_cache.card_played[i][1]
+            total = self.regulation_total(i)
+            rows.append({
+                'player': i,
+                'total': total,
+                'holes_played': played,
+                'rel_par': total - played * PAR,
+                'holes_won': holes_won[i] if holes_won else None,
+                'winnings': holes_won[i] * self.skin_value if self.mode == "Skins" else None,
+                'tie_breaker_total': self.tie_breaker_total(i),
+                'in_tie_breaker': self.in_tie_breaker and i in self.tie_breaker_players
+            })
+        return rows
+
+    def player_scores(self):
+        """Scores keyed P1..P6, the layout save_match_data expects"""
+        return {f"P{i+1}": list(row) for i, row in enumerate(self.scores)}
@@ -3,10 +3,28 @@ import os
 import pandas as pd
 from datetime import datetime
 import json
+import logging
+import threading
+import time
 import uuid
-import random
 import plotly.express as px
 from streamlit_gsheets import GSheetsConnection
+from match_journal import MatchJournal, JOURNAL_FILE
+from match_store import (
+    SQLiteMatchStore, GSheetsMatchStore, ReplicatedMatchStore, SheetWriter, seed_from_sheets,
+    MATCH_DB_FILE
+)
+from match_history import HistoryCache, prepare_golf_history, prepare_cricket_history
+from ratings import RatingStore, GAMES, golf_placements, cricket_placements
+from golf_engine import GolfMatch, CARDS, REGULATION_HOLES
+from golf_sim import score_counts, fit_skill_model, simulate_rounds, StrokePlayOdds
+from rumble_engine import RoyalRumbleGame, ELIMINATION_MARKS, ENTRY, NO_HEALING
+from music_store import MusicStore
+from cricket_engine import CricketKOGame, CRICKET_MODES, CRICKET_NUMBERS, NUMBER_INDEX, NUMBER, KO, PIN, MISS, players_for_mode
+from stats_tables import build_hole_table, head_to_head_pairs, head_to_head_summary, head_to_head_records, streak_table
+from section_timer import SectionTimer, TIMINGS_FILE
+
+log = logging.getLogger(__name__)
 
 # --- CUSTOM COLORS (High-Contrast for Darts) ---
 ULTRA_COLOR_MAP = {
@@ -203,8 +221,58 @@ def hide_header():
 
 hide_header()
 
+# --- TIMERS ---
+# Transient banners expire in the browser and state that has to change at a deadline gets
+# one scheduled rerun, so nothing sleeps and reruns the whole script while waiting.
+DARTS_BACK_SECONDS = 2
+KO_SKIP_SECONDS = 3
+ENTRY_BANNER_SECONDS = 5
+
+def expiring_html(html, seconds):
+    """Wrap html so the browser hides it after `seconds` (CSS animation - no rerun)"""
+    return f"""<style>@keyframes timer-expire {{ to {{ opacity: 0; max-height: 0; margin: 0; padding: 0; }} }}</style>
+    <div style='overflow: hidden; animation: timer-expire 0s linear {max(seconds, 0):.2f}s forwards;'>{html}</div>"""
+
+def countdown_html(seconds_left):
+    """Whole-second countdown (3, 2, 1) that ticks in the browser"""
+    seconds_left = max(seconds_left, 0.01)
+    start = int(seconds_left) + (0 if seconds_left == int(seconds_left) else 1)
+    name = f"timer-countdown-{int(seconds_left * 1000)}"
+    frames = [f"0% {{ content: '{start}'; }}"]
+    for value in range(start - 1, 0, -1):
+        frames.append(f"{(seconds_left - value) / seconds_left * 100:.2f}% {{ content: '{value}'; }}")
+    frames.append("100% { content: '0'; }")
+    return f"""<style>@keyframes {name} {{ {' '.join(frames)} }}
+    .{name}::after {{ content: '{start}'; animation: {name} {seconds_left:.2f}s step-end forwards; }}</style>
+    <span class='{name}'></span>"""
+
+def rerun_at(deadline):
+    """Rerun the app once when time.time() passes `deadline` - the browser's fragment timer does the waiting"""
+    @st.fragment(run_every=max(deadline - time.time(), 0.05))
+    def wait_for_deadline():
+        if time.time() >= deadline:
+            st.rerun()
+    wait_for_deadline()
+
+# --- INSTRUMENTATION ---
+# Per-session section timings for the Dev Timings panel. While it's off every timed section
+# costs a flag check, so hot paths can stay decorated.
+if 'section_timer' not in st.session_state:
+    st.session_state.section_timer = SectionTimer()
+perf = st.session_state.section_timer
+
+def dev_tools_enabled():
+    """The Dev Timings toggle is only shown with ?dev=1 in the URL or dev_tools = true in secrets"""
+    if st.query_params.get("dev") == "1":
+        return True
+    try:
+        return bool(st.secrets.get("dev_tools", False))
+    except Exception:
+        return False
+
 # --- CRICKET KO FUNCTIONS ---
-CRICKET_NUMBERS = [20, 19, 18, 17, 16, 15, 'B', 'T', 'D']
+# Header/mark columns (of 9) for each player count - the dart counter and number buttons sit in C5
+CRICKET_SLOTS = {2: [3, 5], 3: [2, 3, 5], 4: [2, 3, 5, 6]}
 
 def get_mark_symbol(marks):
     if marks == 0: return ""
@@ -212,15 +280,12 @@ def get_mark_symbol(marks):
     elif marks == 2: return "╳"
     elif marks >= 3: return "◉" + (f" +{marks-3}" if marks > 3 else "")
 
-def check_board_closed(board):
-    return all(marks >= 3 for marks in board.values())
-
+@perf.timed()
 def get_player_header_html(game, player_idx):
     """Generate HTML for a player's header box - now clickable for KO"""
-    p_key = f"P{player_idx + 1}"
-    is_active = player_idx == game['current_player_idx']
-    is_skipped = game['ko_skipped'][p_key]
-    is_eliminated = game['eliminated'][p_key]
+    is_active = player_idx == game.current_player_idx
+    is_skipped = game.ko_skipped[player_idx]
+    is_eliminated = game.eliminated[player_idx]
 
     # Border style based on status
     if is_active:
@@ -241,14 +306,14 @@ def get_player_header_html(game, player_idx):
 
     # Show elimination progress only in non-tag-team multi-player games
     elim_progress_html = ""
-    if any(game['board_closed'].values()) and not is_eliminated and not game['is_tag_team'] and game['num_players'] > 2:
+    if game.any_board_closed() and not is_eliminated and not game.is_tag_team and game.num_players > 2:
         # Elimination phase active
-        ko_hits = game['ko_elimination_progress'][p_key]
+        ko_hits = game.ko_elimination_progress[player_idx]
         dots = ["●" if i < ko_hits else "○" for i in range(3)]
         elim_progress_html = f"<div style='font-size: 10px; color: #888; margin-top: 3px;'>KO: {' '.join(dots)}</div>"
 
     # Calculate font size based on name length - using viewport height for scaling with larger sizes
-    name_length = len(game['player_names'][player_idx])
+    name_length = len(game.player_names[player_idx])
     if name_length <= 6:
         font_size = "clamp(14px, 2.8vh, 50px)"
     elif name_length <= 8:
@@ -275,137 +340,14 @@ def get_player_header_html(game, player_idx):
                     overflow: visible;
                     text-overflow: clip;
                     line-height: 1.3;
-                '>{game['player_names'][player_idx]}</span>
+                '>{game.player_names[player_idx]}</span>
             </div>
-            <div class="player-ko"><span style='font-size: {ko_font_size}; color: {text_color}; line-height: 1.3;'>KO: {game['ko_numbers'][p_key]}</span></div>
+            <div class="player-ko"><span style='font-size: {ko_font_size}; color: {text_color}; line-height: 1.3;'>KO: {game.ko_numbers[player_idx]}</span></div>
         </div>
         {elim_progress_html}
     </div>
     """
 
-def advance_to_next_player(game):
-    """
-    Forces all unused darts to be recorded as 'Miss' before 
-    moving to the next player.
-    """
-    p_key = f"P{game['current_player_idx'] + 1}"
-    
-    # 1. IDENTIFY REMAINING DARTS
-    # If dart_count is 1, we need to fill indices 1 and 2.
-    # If dart_count is 2, we need to fill index 2.
-    for i in range(game['dart_count'], 3):
-        # Fill the visual/stat list with a Miss
-        game['dart_hits'][i] = 'Miss'
-        
-        # Increment the total darts count for the player's career stats
-        game['total_darts'][p_key] += 1
-        
-        # Log 0 marks for these darts
-        game['marks_per_dart'][i] = 0
-
-    # 2. RESET TURN COUNTERS FOR THE NEXT PERSON
-    # Note: We reset these ONLY AFTER we've finished the logic above
-    game['dart_count'] = 0
-    # We clear the visual hits for the next player's UI
-    game['dart_hits'] = ['', '', '']
-    game['marks_per_dart'] = [0, 0, 0]
-
-    # 3. ROTATION LOGIC (Keep your existing code below)
-    if game['is_tag_team']:
-        current = game['current_player_idx']
-        if current == 0: next_idx = 2
-        elif current == 2: next_idx = 1
-        elif current == 1: next_idx = 3
-        else: next_idx = 0
-        game['current_player_idx'] = next_idx
-    else:
-        next_idx = (game['current_player_idx'] + 1) % game['num_players']
-        while game['eliminated'][f"P{next_idx + 1}"]:
-            next_idx = (next_idx + 1) % game['num_players']
-        game['current_player_idx'] = next_idx
-
-def update_pin_count(current_pin, player_idx, player_board_closed):
-    """
-    Update pin count when PIN button is pressed.
-    Player 0 (P1) moves in positive direction (+1, +2, +3)
-    Player 1 (P2) moves in negative direction (-1, -2, -3)
-    
-    Logic:
-    - Can always reverse opponent's pin (move toward 0)
-    - Can only advance in YOUR direction if YOUR board is closed
-    """
-    if player_idx == 0:  # Player 1 (positive direction)
-        if current_pin >= 0:
-            # Moving in our direction - need board closed
-            if player_board_closed:
-                return current_pin + 1
-            else:
-                return current_pin  # Can't advance without closed board
-        else:
-            # Reversing opponent's pin - always allowed
-            return current_pin + 1
-    else:  # Player 2 (negative direction)
-        if current_pin <= 0:
-            # Moving in our direction - need board closed
-            if player_board_closed:
-                return current_pin - 1
-            else:
-                return current_pin  # Can't advance without closed board
-        else:
-            # Reversing opponent's pin - always allowed
-            return current_pin - 1
-
-def initialize_cricket_game(num_players, player_names, game_mode):
-    available = list(range(1, 21))
-    random.shuffle(available)
-    ko_numbers = {f"P{i+1}": available[i] for i in range(num_players)}
-    
-    is_tag_team = "Tag Team" in game_mode
-    
-    # In tag team, Team 1 is P1+P2, Team 2 is P3+P4
-    # They share boards: Team 1 shares one board, Team 2 shares another
-    if is_tag_team:
-        cricket_boards = {
-            'T1': {num: 0 for num in CRICKET_NUMBERS},  # Team 1 shared board
-            'T2': {num: 0 for num in CRICKET_NUMBERS}   # Team 2 shared board
-        }
-        board_closed = {'T1': False, 'T2': False}
-    else:
-        cricket_boards = {f"P{i+1}": {num: 0 for num in CRICKET_NUMBERS} for i in range(num_players)}
-        board_closed = {f"P{i+1}": False for i in range(num_players)}
-    
-    return {
-        'num_players': num_players,
-        'player_names': player_names,
-        'game_mode': game_mode,
-        'is_tag_team': is_tag_team,
-        'cricket_boards': cricket_boards,
-        'ko_numbers': ko_numbers,
-        'ko_skipped': {f"P{i+1}": False for i in range(num_players)},
-        'consecutive_skips': {f"P{i+1}": 0 for i in range(num_players)},
-        'board_closed': board_closed,
-        'eliminated': {f"P{i+1}": False for i in range(num_players)},
-        'ko_elimination_progress': {f"P{i+1}": 0 for i in range(num_players)},
-        'pin_progress': {f"P{i+1}": [] for i in range(num_players)},
-        'current_player_idx': 0,
-        'dart_count': 0,
-        'marks_per_dart': [0, 0, 0],
-        'dart_hits': ['', '', ''],
-        'pin_count': 0,
-        'game_over': False,
-        'winner': None,
-        # Stats tracking
-        'total_darts': {f"P{i+1}": 0 for i in range(num_players)},
-        'total_marks': {f"P{i+1}": 0 for i in range(num_players)},
-        'ko_hits_given': {f"P{i+1}": 0 for i in range(num_players)},
-        'ko_hits_received': {f"P{i+1}": 0 for i in range(num_players)},
-        'pin_attempts': {f"P{i+1}": 0 for i in range(num_players)},
-        'darts_to_close': {f"P{i+1}": None for i in range(num_players)},
-        'board_close_dart_count': {f"P{i+1}": 0 for i in range(num_players)},
-        'start_time': datetime.now(),
-        'venue': 'Home'
-    }
-
 # --- 1. GOLF SETTINGS & DATA HELPERS ---
 PROFILE_FILE = "profiles.txt"
 VENUE_FILE = "venues.txt"
@@ -447,14 +389,117 @@ def save_venue(venue):
     if venue.strip() and venue.strip() != "Custom":
         with open(VENUE_FILE, "a") as f: f.write(f"\n{venue.strip()}")
 
-def save_match_data(match_id, player_names, player_scores, venue):
-    conn = st.connection("gsheets", type=GSheetsConnection)
-    
+@st.cache_resource
+def get_sheet_writer():
+    """Appends to the Sheets replica through gspread. The journal worker does its own backoff, so one attempt per send."""
+    return SheetWriter(dict(st.secrets["connections"]["gsheets"]), retries=1)
+
+@st.cache_resource
+def get_match_journal():
+    """One journal + flush worker per server process, shared by every session"""
+    journal = MatchJournal(JOURNAL_FILE, get_sheet_writer().append)
+    journal.start()
+    return journal
+
+def sheets_replica_configured():
+    """Google Sheets is optional - only replicate when a gsheets connection is set up in secrets"""
     try:
-        existing_df = conn.read(worksheet="Matches", ttl=0)
-    except:
-        existing_df = pd.DataFrame(columns=["Match_ID", "Date", "Venue", "Player", "Total", "Hole_Scores", "Opponents"])
+        return "gsheets" in st.secrets.get("connections", {})
+    except Exception:
+        return False
+
+SEED_RETRY_SECONDS = (5, 300)  # Backoff between attempts to seed local history from Sheets
 
+def seed_local_history(local, sheets, journal):
+    """Background worker: keep trying to seed the local store from Sheets until every worksheet is done"""
+    backoff = SEED_RETRY_SECONDS[0]
+    while True:
+        try:
+            imported = seed_from_sheets(local, sheets, journal)
+            break
+        except Exception as e:
+            log.warning("Seeding match history from Google Sheets failed, retrying in %ss: %s", backoff, e)
+            time.sleep(backoff)
+            backoff = min(backoff * 2, SEED_RETRY_SECONDS[1])
+    # Imported history can be older than matches already saved here - replay ratings from scratch
+    ratings = RatingStore(MATCH_DB_FILE)
+    for game, worksheet in GAMES.items():
+        if imported.get(worksheet):
+            ratings.rebuild(game)
+
+@st.cache_resource
+def get_match_store():
+    """Local SQLite history is the source of truth; Google Sheets (if configured) is a replica"""
+    local = SQLiteMatchStore(MATCH_DB_FILE)
+    if not sheets_replica_configured():
+        return ReplicatedMatchStore(local)
+
+    # Pull the sheet's history in the background (retried until it works) - it shows up on the next rerun after
+    journal = get_match_journal()
+    sheets = GSheetsMatchStore(st.connection("gsheets", type=GSheetsConnection), get_sheet_writer(), read_ttl=0)
+    threading.Thread(target=seed_local_history, args=(local, sheets, journal), name="sheets-seed", daemon=True).start()
+    return ReplicatedMatchStore(local, journal)
+
+@st.cache_resource
+def get_history_cache(worksheet):
+    """Parsed history for the Stats Dashboard - only new rows get parsed on later reruns"""
+    prepare = prepare_golf_history if worksheet == "Matches" else prepare_cricket_history
+    return HistoryCache(get_match_store(), worksheet, prepare)
+
+@st.cache_resource
+def get_rating_store():
+    """Player ratings, updated as each match is saved. Seeded by a full replay the first time."""
+    store = get_match_store()
+    ratings = RatingStore(MATCH_DB_FILE)
+    for game, worksheet in GAMES.items():
+        if ratings.is_empty(game) and store.data_version(worksheet) > 0:
+            ratings.rebuild(game)
+    return ratings
+
+@st.cache_resource
+def get_music_store():
+    return MusicStore()
+
+GOLF_ODDS_ROUNDS = 50_000  # Enough for Match Play/Skins odds to the nearest percent, ~50 ms
+
+@perf.timed()
+def golf_win_odds(names, match):
+    """Win odds for this lineup from each player's history, given the holes already played.
+    Stroke Play (and any tie breaker) is exact - the per-player distribution table is built once
+    per lineup and a score only convolves in one hole. Match Play and Skins are simulated.
+    Nothing is recomputed until the lineup, mode or scores change."""
+    history = get_history_cache("Matches")
+    hole_table = history.derived("hole_table", build_hole_table)
+    counts = history.derived("score_counts", lambda df: score_counts(hole_table))
+    lineup = (history.version, tuple(names), match.tie_breaker_enabled)
+    model = st.session_state.get('golf_odds_model')
+    if model is None or model[0] != lineup:
+        probs = fit_skill_model(counts, names)
+        model = st.session_state.golf_odds_model = (lineup, probs, StrokePlayOdds(probs, match.tie_breaker_enabled))
+    _, probs, stroke_odds = model
+
+    scores = tuple(tuple(row) for row in match.scores[:len(names)])
+    key = (lineup, match.mode, scores)
+    cached = st.session_state.get('golf_odds')
+    if cached is None or cached[0] != key:
+        if match.mode == "Stroke Play" or match.in_tie_breaker or match.game_over:
+            odds = stroke_odds.win(match)  # Tie breakers are stroke play in every mode
+        else:
+            played = [[float('nan') if x is None else x for x in row[:REGULATION_HOLES]] for row in scores]
+            odds = simulate_rounds(probs, match.mode, GOLF_ODDS_ROUNDS, match.tie_breaker_enabled, scores=played).win
+        cached = st.session_state.golf_odds = (key, odds)
+    return cached[1]
+
+def show_save_status(store):
+    if store.journal is None:
+        st.success("✅ Match saved!")
+        return
+    st.success(f"✅ Match saved! Syncing to Google Sheets in the background ({store.journal.pending_count()} waiting)")
+    if store.journal.last_error:
+        st.caption(f"Last sync attempt failed, will retry: {store.journal.last_error}")
+
+@perf.timed()
+def save_match_data(match_id, player_names, player_scores, venue):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
     new_rows = []
     for i, name in enumerate(player_names):
@@ -472,123 +517,70 @@ def save_match_data(match_id, player_names, player_scores, venue):
             "Opponents": opponents
         })
     
-    updated_df = pd.concat([existing_df, pd.DataFrame(new_rows)], ignore_index=True)
-    conn.update(worksheet="Matches", data=updated_df)
-    st.success("✅ Match Synced to Google Sheets!")
+    # Saved locally first - the Sheets replica is synced by the background journal worker
+    store = get_match_store()
+    store.append_golf_match(new_rows)
+    get_rating_store().apply_match("golf", match_id, golf_placements(new_rows))
+    show_save_status(store)
 
+@perf.timed()
 def save_cricket_match(game):
-    """Save Cricket KO match stats to Google Sheets"""
-    conn = st.connection("gsheets", type=GSheetsConnection)
-    match_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    try:
-        existing_df = conn.read(worksheet="Cricket_Matches", ttl=0)
-    except:
-        existing_df = pd.DataFrame(columns=[
-            "Match_ID", "Date", "Venue", "Game_Mode", "Player", "Placement",
-            "Total_Marks", "Total_Darts", "Marks_Per_Dart", "Accuracy_Pct",
-            "Darts_To_Close", "KO_Hits_Given", "KO_Hits_Received",
-            "Players_Eliminated", "Was_Eliminated", "PIN_Attempts",
-            "Won_Match", "Opponents"
-        ])
+    """Save Cricket KO match stats to the local store (journaled for the Sheets replica if configured)"""
+    # Timestamp keeps ids in save order, the suffix keeps two boards saving in the same second apart
+    match_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
     
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
     new_rows = []
     
     # Determine placements and winner
-    placements = determine_cricket_placements(game)
+    placements = game.placements()
     winner_idx = placements[0] if placements else 0
     
-    for i in range(game['num_players']):
-        player_name = game['player_names'][i]
-        p_key = f"P{i+1}"
+    for i in range(game.num_players):
+        player_name = game.player_names[i]
         
-        # Get player's board (handle tag team)
-        if game['is_tag_team']:
-            board_key = 'T1' if i < 2 else 'T2'
-            board = game['cricket_boards'][board_key]
-        else:
-            board = game['cricket_boards'][p_key]
-        
-        total_marks = sum(board.values())
-        total_darts = game['total_darts'][p_key]
+        # Marks on the player's board (shared by the team in tag team)
+        total_marks = game.board_marks(i)
+        total_darts = game.total_darts[i]
         mpd = round(total_marks / total_darts, 2) if total_darts > 0 else 0
         accuracy = round((total_marks / total_darts * 100), 1) if total_darts > 0 else 0
         
-        # Count eliminations (how many players this player eliminated)
-        eliminations = 0
-        for j in range(game['num_players']):
-            if i != j and game['eliminated'][f"P{j+1}"]:
-                # Check if this player got the final KO hit
-                if game['ko_elimination_progress'][f"P{j+1}"] >= 3:
-                    eliminations += 1
-        
-        opponents = ", ".join([game['player_names'][j] for j in range(game['num_players']) if j != i])
-        placement = placements.index(i) + 1 if i in placements else game['num_players']
+        opponents = ", ".join([game.player_names[j] for j in range(game.num_players) if j != i])
+        placement = placements.index(i) + 1 if i in placements else game.num_players
         
         new_rows.append({
             "Match_ID": match_id,
             "Date": timestamp,
-            "Venue": game.get('venue', 'Home'),
-            "Game_Mode": game['game_mode'],
+            "Venue": game.venue,
+            "Game_Mode": game.game_mode,
             "Player": player_name,
             "Placement": f"{placement}{'st' if placement==1 else 'nd' if placement==2 else 'rd' if placement==3 else 'th'}",
             "Total_Marks": total_marks,
             "Total_Darts": total_darts,
             "Marks_Per_Dart": mpd,
             "Accuracy_Pct": accuracy,
-            "Darts_To_Close": game['darts_to_close'][p_key] if game['darts_to_close'][p_key] else "",
-            "KO_Hits_Given": game['ko_hits_given'][p_key],
-            "KO_Hits_Received": game['ko_hits_received'][p_key],
-            "Players_Eliminated": eliminations,
-            "Was_Eliminated": game['eliminated'][p_key],
-            "PIN_Attempts": game['pin_attempts'][p_key],
+            "Darts_To_Close": game.darts_to_close[i] if game.darts_to_close[i] else "",
+            "KO_Hits_Given": game.ko_hits_given[i],
+            "KO_Hits_Received": game.ko_hits_received[i],
+            "Players_Eliminated": game.eliminations[i],
+            "Was_Eliminated": game.eliminated[i],
+            "PIN_Attempts": game.pin_attempts[i],
             "Won_Match": (i == winner_idx),
             "Opponents": opponents
         })
     
-    updated_df = pd.concat([existing_df, pd.DataFrame(new_rows)], ignore_index=True)
-    conn.update(worksheet="Cricket_Matches", data=updated_df)
-    st.success("✅ Cricket Match Synced to Google Sheets!")
-
-def determine_cricket_placements(game):
-    """Determine final placements for cricket match (returns list of player indices in order)"""
-    if game.get('winner') is not None:
-        # Game finished with a winner
-        winner = game['winner']
-        # Sort others by: not eliminated, then by marks, then by darts to close
-        others = []
-        for i in range(game['num_players']):
-            if i != winner:
-                p_key = f"P{i+1}"
-                if game['is_tag_team']:
-                    board_key = 'T1' if i < 2 else 'T2'
-                    marks = sum(game['cricket_boards'][board_key].values())
-                else:
-                    marks = sum(game['cricket_boards'][p_key].values())
-                
-                others.append((i, not game['eliminated'][p_key], marks, -game['total_darts'][p_key]))
-        
-        others.sort(key=lambda x: (x[1], x[2], x[3]), reverse=True)
-        return [winner] + [x[0] for x in others]
-    else:
-        # Game not finished, rank by marks
-        rankings = []
-        for i in range(game['num_players']):
-            p_key = f"P{i+1}"
-            if game['is_tag_team']:
-                board_key = 'T1' if i < 2 else 'T2'
-                marks = sum(game['cricket_boards'][board_key].values())
-            else:
-                marks = sum(game['cricket_boards'][p_key].values())
-            rankings.append((i, marks, -game['total_darts'][p_key]))
-        
-        rankings.sort(key=lambda x: (x[1], x[2]), reverse=True)
-        return [x[0] for x in rankings]
+    # All per-player rows are saved together and go up to Sheets in a single append request
+    store = get_match_store()
+    store.append_cricket_match(new_rows)
+    get_rating_store().apply_match("cricket", match_id, cricket_placements(new_rows))
+    show_save_status(store)
 
 # --- 2. NAVIGATION ---
 st.sidebar.title("🎮 Navigation")
 page = st.sidebar.radio("Navigation", ["Home", "Golf", "KO Cricket", "Royal Rumble", "Stats Dashboard", "Manage Profiles"], label_visibility="collapsed")
+perf.enabled = dev_tools_enabled() and st.sidebar.toggle("🛠️ Dev Timings", value=False, key="dev_timings")
+perf_panel = st.sidebar.container()  # Filled in at the bottom of the script, once this rerun is timed
+perf.start_rerun(page)
 
 # --- PAGE 0: HOME ---
 if page == "Home":
@@ -703,64 +695,6 @@ if page == "Home":
 
 # --- PAGE 1: GOLF ---
 elif page == "Golf":
-    def calculate_holes_won(player_scores, num_players, mode):
-        """Calculate holes won for Match Play or Skins modes"""
-        holes_won = {f"P{i+1}": 0 for i in range(num_players)}
-        
-        if mode == "Match Play":
-            # Head-to-head: compare each player against all others for each hole
-            for hole in range(18):
-                hole_scores = {}
-                for i in range(num_players):
-                    score = player_scores[f"P{i+1}"][hole]
-                    if score is not None:
-                        hole_scores[f"P{i+1}"] = score
-                
-                if len(hole_scores) >= 2:  # At least 2 players have scored
-                    min_score = min(hole_scores.values())
-                    winners = [p for p, s in hole_scores.items() if s == min_score]
-                    
-                    if len(winners) == 1:  # One winner (not a tie)
-                        holes_won[winners[0]] += 1
-        
-        elif mode == "Skins":
-            # Skins: win the hole outright (no ties), carries over
-            carryover = 1  # Number of skins worth for this hole
-            
-            for hole in range(18):
-                hole_scores = {}
-                for i in range(num_players):
-                    score = player_scores[f"P{i+1}"][hole]
-                    if score is not None:
-                        hole_scores[f"P{i+1}"] = score
-                
-                if len(hole_scores) >= 2:  # At least 2 players have scored
-                    min_score = min(hole_scores.values())
-                    winners = [p for p, s in hole_scores.items() if s == min_score]
-                    
-                    if len(winners) == 1:  # One winner (not a tie) - wins the skin(s)
-                        holes_won[winners[0]] += carryover
-                        carryover = 1  # Reset
-                    else:  # Tie - skin carries over
-                        carryover += 1
-        
-        return holes_won
-    
-    def calculate_hole_winner(player_scores, hole_idx, num_players):
-        """Returns list of player keys who won this hole (empty if tie or incomplete)"""
-        hole_scores = {}
-        for i in range(num_players):
-            score = player_scores[f"P{i+1}"][hole_idx]
-            if score is not None:
-                hole_scores[f"P{i+1}"] = score
-        
-        if len(hole_scores) >= 2:
-            min_score = min(hole_scores.values())
-            winners = [p for p, s in hole_scores.items() if s == min_score]
-            if len(winners) == 1:  # Clear winner
-                return winners
-        return []
-    
     def inject_custom_css(width_px):
         st.markdown(f"""
             <style>
@@ -798,18 +732,14 @@ elif page == "Golf":
             .hole-winner {{ background-color: #00ff88 !important; color: black !important; font-weight: bold; }}
             .active-hole-head {{ background-color: #00d4ff !important; color: black !important; font-weight: 900; }}
             .active-player-row {{ background-color: rgba(0, 212, 255, 0.04) !important; }}
-            div[data-testid="stHorizontalBlock"] > div:last-child button {{ background-color: #333 !important; color: #ff4b4b !important; border: 1px solid #ff4b4b !important; }}
+            .st-key-golf_undo button {{ background-color: #333 !important; color: #ff4b4b !important; border: 1px solid #ff4b4b !important; }}
             </style>
         """, unsafe_allow_html=True)
 
-    if 'player_scores' not in st.session_state:
-        st.session_state.update({
-            'player_scores': {f"P{i}": [None]*20 for i in range(1,7)},  # 20 holes for tie breaker
-            'current_hole': 0, 'active_idx': 0, 'game_over': False,
-            'history_stack': [], 'match_id': str(uuid.uuid4())[:8].upper(),
-            'game_mode': 'Stroke Play', 'tie_breaker_enabled': True,
-            'in_tie_breaker': False, 'tie_breaker_players': []
-        })
+    # All golf rules live in the GolfMatch engine - this page is just a view over it
+    if 'golf_match' not in st.session_state:
+        st.session_state.golf_match = GolfMatch(2)
+    match = st.session_state.golf_match
 
     with st.sidebar:
         st.title("⛳ Match Setup")
@@ -828,9 +758,9 @@ elif page == "Golf":
         game_mode = st.selectbox(
             "Select Mode",
             ["Stroke Play", "Match Play", "Skins"],
-            index=["Stroke Play", "Match Play", "Skins"].index(st.session_state.get('game_mode', 'Stroke Play'))
+            index=["Stroke Play", "Match Play", "Skins"].index(match.mode)
         )
-        st.session_state.game_mode = game_mode
+        match.set_mode(game_mode)
         
         if game_mode == "Stroke Play":
             st.caption("Traditional scoring - lowest total score wins")
@@ -838,10 +768,11 @@ elif page == "Golf":
             st.caption("Head-to-head - win the most holes")
         else:  # Skins
             st.caption("Win holes outright - ties carry over")
+            match.skin_value = st.number_input("Skin Value ($)", min_value=0.0, max_value=1000.0, value=float(match.skin_value), step=0.5)
         
         # Tie Breaker Toggle
-        tie_breaker_enabled = st.checkbox("Enable Tie Breaker (Holes 19-20)", value=st.session_state.get('tie_breaker_enabled', True))
-        st.session_state.tie_breaker_enabled = tie_breaker_enabled
+        tie_breaker_enabled = st.checkbox("Enable Tie Breaker (Holes 19-20)", value=match.tie_breaker_enabled)
+        match.tie_breaker_enabled = tie_breaker_enabled
         if tie_breaker_enabled:
             st.caption("If tied after 18 holes, play holes 19-20")
         
@@ -849,6 +780,7 @@ elif page == "Golf":
         
         # Player Setup
         num_players = st.slider("Players", 1, 6, 2)
+        match.set_num_players(num_players)
         names = []
         profiles = get_profiles()
         for i in range(1, num_players + 1):
@@ -875,6 +807,7 @@ elif page == "Golf":
             st.session_state.golf_camera_y_val = 0
 
         # Camera Controls
+        show_odds = st.toggle("🎲 Win Odds", value=False, key="golf_odds_toggle")
         camera_on = st.toggle("📹 Camera Feed", value=False, key="golf_camera_toggle")
         if camera_on:
             camera_size = st.slider("Box Size", 200, 2000, value=st.session_state.golf_camera_size_val, step=50, key="golf_camera_size")
@@ -895,13 +828,7 @@ elif page == "Golf":
             camera_y = st.session_state.golf_camera_y_val
 
         if st.button("🔄 Reset Match"):
-            st.session_state.update({
-                'player_scores': {f"P{i}": [None]*20 for i in range(1,7)}, 
-                'current_hole': 0, 'active_idx': 0, 'game_over': False, 
-                'history_stack': [], 'match_id': str(uuid.uuid4())[:8].upper(),
-                'game_mode': game_mode, 'tie_breaker_enabled': tie_breaker_enabled,
-                'in_tie_breaker': False, 'tie_breaker_players': []
-            })
+            st.session_state.golf_match = GolfMatch(num_players, game_mode, tie_breaker_enabled, skin_value=match.skin_value)
             st.rerun()
 
     inject_custom_css(camera_size)
@@ -978,58 +905,40 @@ elif page == "Golf":
     with game_container:
         cols = st.columns(num_players)
 
-        # Calculate holes won if in Match Play or Skins mode (only first 18 holes)
-        game_mode = st.session_state.game_mode
-        if game_mode in ["Match Play", "Skins"]:
-            holes_won_dict = calculate_holes_won(st.session_state.player_scores, num_players, game_mode)
+        game_mode = match.mode
+        standings = match.standings()
         
-        # Check if we're in tie breaker mode
-        in_tie_breaker = st.session_state.get('in_tie_breaker', False)
-        
-        for i in range(num_players):
-            p_sc = st.session_state.player_scores[f"P{i+1}"]
-            
+        for i, row in enumerate(standings):
             # Display different totals based on game mode (only first 18 holes for regular scoring)
             if game_mode in ["Match Play", "Skins"]:
                 # Show holes won (from first 18 holes)
-                display_total = holes_won_dict[f"P{i+1}"]
+                display_total = row['holes_won']
                 display_label = "Holes Won" if game_mode == "Match Play" else "Skins Won"
-                par_str = ""
+                par_str = f"${row['winnings']:,.2f}" if game_mode == "Skins" and match.skin_value else ""
                 par_class = "par-even"
                 
                 # Add tie breaker scores if applicable
-                if in_tie_breaker and f"P{i+1}" in st.session_state.get('tie_breaker_players', []):
-                    tb_score = sum(x for x in p_sc[18:20] if x is not None)
-                    if tb_score > 0:
-                        par_str = f"TB: {tb_score}"
+                if row['in_tie_breaker'] and row['tie_breaker_total'] > 0:
+                    par_str += f"{' | ' if par_str else ''}TB: {row['tie_breaker_total']}"
             else:
                 # Stroke Play - show traditional score (first 18 holes)
-                total = sum(x for x in p_sc[:18] if x is not None)
-                display_total = total
+                display_total = row['total']
                 display_label = "Total Score"
-                holes_played = sum(1 for x in p_sc[:18] if x is not None)
-                rel_par = total - (holes_played * 4)
+                rel_par = row['rel_par']
                 par_str = f"{rel_par:+}" if rel_par != 0 else "E"
                 par_class = "par-under" if rel_par < 0 else "par-over" if rel_par > 0 else "par-even"
                 
                 # Add tie breaker scores if applicable
-                if in_tie_breaker and f"P{i+1}" in st.session_state.get('tie_breaker_players', []):
-                    tb_score = sum(x for x in p_sc[18:20] if x is not None)
-                    if tb_score > 0:
-                        par_str += f" | TB: {tb_score}"
-            active = "active" if i == st.session_state.active_idx and not st.session_state.game_over else ""
+                if row['in_tie_breaker'] and row['tie_breaker_total'] > 0:
+                    par_str += f" | TB: {row['tie_breaker_total']}"
+            active = "active" if i == match.active_idx and not match.game_over else ""
             
             # Determine score color class for Stroke Play mode
-            if game_mode == "Stroke Play":
-                holes_played = sum(1 for x in p_sc[:18] if x is not None)
-                if holes_played > 0:
-                    rel_par = display_total - (holes_played * 4)
-                    if rel_par < 0:
-                        score_color_class = "under-par"
-                    elif rel_par > 0:
-                        score_color_class = "over-par"
-                    else:
-                        score_color_class = "even-par"
+            if game_mode == "Stroke Play" and row['holes_played'] > 0:
+                if row['rel_par'] < 0:
+                    score_color_class = "under-par"
+                elif row['rel_par'] > 0:
+                    score_color_class = "over-par"
                 else:
                     score_color_class = "even-par"
             else:
@@ -1040,20 +949,50 @@ elif page == "Golf":
             else:
                 cols[i].markdown(f"<div class='stat-card {active}'><div class='stat-name'>{names[i]}</div><div class='stat-score {score_color_class}'>{display_total}</div><div style='font-size: 14px; color: #888; margin-top: 5px;'>{display_label}</div></div>", unsafe_allow_html=True)
     
+        # Win odds from each player's history - pre-match until a score goes in, then live
+        if show_odds and num_players >= 2 and not match.game_over:
+            odds = golf_win_odds(names, match)
+            odds_cols = st.columns(num_players)
+            for i in range(num_players):
+                odds_cols[i].markdown(f"<div style='text-align: center; color: #00d4ff; font-size: 14px;'>🎲 {odds[i]:.0%} to win</div>", unsafe_allow_html=True)
+            started = any(x is not None for row in match.scores[:num_players] for x in row)
+            exact = game_mode == "Stroke Play" or match.in_tie_breaker
+            st.caption(f"{'Live' if started else 'Pre-match'} odds from each player's history"
+                       + (" (exact)" if exact else f" ({GOLF_ODDS_ROUNDS:,} simulated rounds)"))
+
+        # Skins pot and hole-by-hole payouts (a hole only pays out once everyone has scored it)
+        if game_mode == "Skins" and num_players >= 2:
+            pot_skins, pot_value = match.skins_pot()
+            pot_str = f"{pot_skins} skin{'s' if pot_skins != 1 else ''}" + (f" (${pot_value:,.2f})" if match.skin_value else "")
+            st.caption(f"💰 Riding on the next hole: {pot_str}")
+            payouts = match.payout_history()
+            if payouts:
+                with st.expander("Skins Payouts"):
+                    st.dataframe(pd.DataFrame([{
+                        'Hole': p['hole'],
+                        'Winner': names[p['winner']] if p['winner'] is not None else "Carried over",
+                        'Skins': p['skins'],
+                        'Payout': f"${p['amount']:,.2f}"
+                    } for p in payouts]), hide_index=True, use_container_width=True)
+
+        @perf.timed()
         def draw_card(start, end, label):
+            # Only reads the match's standings cache - hole winners and card totals are kept up to date as scores go in
+            card = CARDS.index((start, end))
+            hole_winner = {h: match.hole_winners(h) for h in range(start, min(end, 18))} if game_mode in ["Match Play", "Skins"] else {}
             html = f"<table class='golf-table'><tr><td class='golf-header' style='width:100px;'>{label}</td>"
             for h in range(start, end): 
-                active_h = "active-hole-head" if h == st.session_state.current_hole and not st.session_state.game_over else ""
+                active_h = "active-hole-head" if h == match.current_hole and not match.game_over else ""
                 html += f"<td class='golf-header {active_h}'>{h+1}</td>"
             html += "<td class='golf-header' style='background:#00d4ff; color:black;'>TOT</td></tr>"
             
             for i in range(num_players):
-                p_s = st.session_state.player_scores[f"P{i+1}"]
+                p_s = match.scores[i]
                 
                 # Check if this player is active AND current hole is in this card's range
-                is_active_player = (i == st.session_state.active_idx and 
-                                  not st.session_state.game_over and
-                                  start <= st.session_state.current_hole < end)
+                is_active_player = (i == match.active_idx and 
+                                  not match.game_over and
+                                  start <= match.current_hole < end)
                 row_class = "active-player-row" if is_active_player else ""
                 
                 html += f"<tr class='{row_class}'><td class='golf-cell' style='text-align:left;'>{names[i]}</td>"
@@ -1061,26 +1000,22 @@ elif page == "Golf":
                 for h in range(start, end):
                     score_val = p_s[h] if p_s[h] is not None else '-'
                     
-                    # Check if this player won this hole (for Match Play/Skins)
-                    winner_class = ""
-                    if game_mode in ["Match Play", "Skins"] and p_s[h] is not None and h < 18:  # Only first 18 holes
-                        winners = calculate_hole_winner(st.session_state.player_scores, h, num_players)
-                        if f"P{i+1}" in winners:
-                            winner_class = "hole-winner"
+                    # Highlight hole winners (Match Play/Skins, first 18 holes only)
+                    winner_class = "hole-winner" if i in hole_winner.get(h, ()) else ""
                     
                     html += f"<td class='golf-cell {winner_class}'>{score_val}</td>"
                 
                 # Total column - show appropriate total (only first 18 or tie breaker range)
+                card_strokes, holes_in_range = match.card_total(i, card)
                 if game_mode in ["Match Play", "Skins"]:
                     if start >= 18:  # Tie breaker card
-                        tot_display = sum(x for x in p_s[start:end] if x is not None)
+                        tot_display = card_strokes
                     else:
-                        tot_display = holes_won_dict[f"P{i+1}"]
+                        tot_display = standings[i]['holes_won']
                     tot_color = "white"  # No par coloring for Match Play/Skins
                 else:
-                    # Stroke Play - calculate total and par
-                    tot_display = sum(x for x in p_s[start:end] if x is not None)
-                    holes_in_range = sum(1 for x in p_s[start:end] if x is not None)
+                    # Stroke Play - total and par
+                    tot_display = card_strokes
                     par_for_range = holes_in_range * 4
                     rel_par = tot_display - par_for_range
                     
@@ -1096,11 +1031,10 @@ elif page == "Golf":
             st.markdown(html + "</table>", unsafe_allow_html=True)
     
         # Show tie breaker card ABOVE regular scorecards if in tie breaker mode
-        if st.session_state.get('in_tie_breaker', False):
+        if match.in_tie_breaker:
             st.markdown("### 🏆 TIE BREAKER")
-            tie_players = st.session_state.get('tie_breaker_players', [])
-            if tie_players:
-                player_names_in_tie = ', '.join([names[int(p[1:])-1] for p in tie_players])
+            if match.tie_breaker_players:
+                player_names_in_tie = ', '.join([names[p] for p in match.tie_breaker_players])
                 st.caption(f"Players in tie breaker: {player_names_in_tie}")
             draw_card(18, 20, "TB")
             st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)
@@ -1108,144 +1042,20 @@ elif page == "Golf":
         draw_card(0, 9, "OUT")
         draw_card(9, 18, "IN")
     
-        if not st.session_state.game_over:
-            btn_cols = st.columns([1,1,1,1,1,1,1.5])
-            def submit(val):
-                st.session_state.history_stack.append({
-                    'player_scores': {k: list(v) for k, v in st.session_state.player_scores.items()}, 
-                    'current_hole': st.session_state.current_hole, 
-                    'active_idx': st.session_state.active_idx,
-                    'in_tie_breaker': st.session_state.get('in_tie_breaker', False),
-                    'tie_breaker_players': st.session_state.get('tie_breaker_players', [])
-                })
-                
-                # Record score for current player
-                st.session_state.player_scores[f"P{st.session_state.active_idx + 1}"][st.session_state.current_hole] = val
-                
-                # Handle tie breaker mode separately
-                in_tie_breaker = st.session_state.get('in_tie_breaker', False)
-                
-                if in_tie_breaker:
-                    # Tie breaker player rotation logic
-                    tie_players = st.session_state.tie_breaker_players
-                    current_player_key = f"P{st.session_state.active_idx + 1}"
-                    current_tb_idx = tie_players.index(current_player_key)
-                    
-                    if st.session_state.current_hole == 18:  # Hole 19
-                        # Players go in order
-                        if current_tb_idx < len(tie_players) - 1:
-                            # Move to next tie breaker player
-                            next_player_key = tie_players[current_tb_idx + 1]
-                            st.session_state.active_idx = int(next_player_key[1:]) - 1
-                        else:
-                            # All players done with hole 19, move to hole 20
-                            st.session_state.current_hole = 19
-                            # Reverse order for hole 20 - last player goes first
-                            st.session_state.active_idx = int(tie_players[-1][1:]) - 1
-                            
-                    elif st.session_state.current_hole == 19:  # Hole 20
-                        # Players go in reverse order
-                        if current_tb_idx > 0:  # Not the first player in original order
-                            # Move to previous player in tie_players list
-                            next_player_key = tie_players[current_tb_idx - 1]
-                            st.session_state.active_idx = int(next_player_key[1:]) - 1
-                        else:
-                            # All players done with hole 20 - check for winner
-                            # Calculate tie breaker scores (holes 19-20 combined)
-                            tb_scores = {}
-                            for p in tie_players:
-                                p_idx = int(p[1:]) - 1
-                                tb_total = sum(x for x in st.session_state.player_scores[p][18:20] if x is not None)
-                                tb_scores[p] = tb_total
-                            
-                            # Find best tie breaker score
-                            if game_mode in ["Match Play", "Skins"]:
-                                best_tb = max(tb_scores.values())  # Most holes won
-                            else:
-                                best_tb = min(tb_scores.values())  # Lowest score
-                            
-                            # Check if still tied
-                            still_tied = [p for p, s in tb_scores.items() if s == best_tb]
-                            
-                            if len(still_tied) == 1:
-                                # We have a winner!
-                                st.session_state.game_over = True
-                            else:
-                                # Still tied - replay holes 19-20
-                                # Clear holes 19-20 scores for tied players
-                                for p in still_tied:
-                                    st.session_state.player_scores[p][18] = None
-                                    st.session_state.player_scores[p][19] = None
-                                
-                                # Update tie breaker players to only those still tied
-                                st.session_state.tie_breaker_players = still_tied
-                                tie_players = still_tied
-                                
-                                # Restart at hole 19 with first tied player
-                                st.session_state.current_hole = 18
-                                st.session_state.active_idx = int(tie_players[0][1:]) - 1
-                else:
-                    # Normal game flow
-                    if st.session_state.active_idx < num_players - 1:
-                        st.session_state.active_idx += 1
-                    elif st.session_state.current_hole < 17:
-                        st.session_state.current_hole += 1
-                        st.session_state.active_idx = 0
-                    else:
-                        # Finished hole 18 - check for tie
-                        if st.session_state.tie_breaker_enabled:
-                            # Calculate scores/holes won for first 18 holes
-                            if game_mode in ["Match Play", "Skins"]:
-                                scores = holes_won_dict
-                            else:
-                                scores = {f"P{i+1}": sum(x for x in st.session_state.player_scores[f"P{i+1}"][:18] if x is not None) for i in range(num_players)}
-                            
-                            # Find the best score
-                            if game_mode in ["Match Play", "Skins"]:
-                                best_score = max(scores.values())  # Most holes/skins won
-                            else:
-                                best_score = min(scores.values())  # Lowest score
-                            
-                            # Find all players with best score
-                            tied_players = [p for p, s in scores.items() if s == best_score]
-                            
-                            if len(tied_players) >= 2:  # 2 or more players tied for first
-                                # Enter tie breaker mode
-                                st.session_state.in_tie_breaker = True
-                                st.session_state.tie_breaker_players = tied_players
-                                st.session_state.current_hole = 18  # Start hole 19
-                                # First-place player goes first
-                                st.session_state.active_idx = int(tied_players[0][1:]) - 1
-                            else:
-                                # No tie - end game
-                                st.session_state.game_over = True
-                        else:
-                            st.session_state.game_over = True
-                
-                st.rerun()
-    
+        if not match.game_over:
+            btn_cols = st.columns([1,1,1,1,1,1,1.5,1.5])
             for i in range(1, 7):
-                if btn_cols[i-1].button(str(i), use_container_width=True): submit(i)
-            if btn_cols[6].button("UNDO", use_container_width=True) and st.session_state.history_stack:
-                prev = st.session_state.history_stack.pop()
-                st.session_state.update({
-                    'player_scores': prev['player_scores'], 
-                    'current_hole': prev['current_hole'], 
-                    'active_idx': prev['active_idx'],
-                    'in_tie_breaker': prev.get('in_tie_breaker', False),
-                    'tie_breaker_players': prev.get('tie_breaker_players', [])
-                })
+                if btn_cols[i-1].button(str(i), use_container_width=True):
+                    match.submit(i)
+                    st.rerun()
+            if btn_cols[6].button("UNDO", key="golf_undo", use_container_width=True, disabled=not match.can_undo()) and match.undo():
+                st.rerun()
+            if btn_cols[7].button("REDO", use_container_width=True, disabled=not match.can_redo()) and match.redo():
                 st.rerun()
         else:
             if st.button(f"🏆 SAVE MATCH AT {final_venue.upper()}", use_container_width=True, type="primary"):
-                save_match_data(st.session_state.match_id, names, st.session_state.player_scores, final_venue)
-                st.session_state.update({
-                    'player_scores': {f"P{i}": [None]*20 for i in range(1,7)}, 
-                    'current_hole': 0, 'active_idx': 0, 'game_over': False, 
-                    'history_stack': [], 'match_id': str(uuid.uuid4())[:8].upper(),
-                    'game_mode': game_mode, 'tie_breaker_enabled': st.session_state.tie_breaker_enabled,
-                    'in_tie_breaker': False, 'tie_breaker_players': []
-                })
+                save_match_data(match.match_id, names, match.player_scores(), final_venue)
+                st.session_state.golf_match = GolfMatch(num_players, game_mode, match.tie_breaker_enabled, skin_value=match.skin_value)
                 st.rerun()
     
 # --- PAGE 2: STATS DASHBOARD ---
@@ -1255,21 +1065,16 @@ elif page == "Stats Dashboard":
     
     if stats_type == "Golf":
         st.title("📊 Elite Darts Golf Analytics")
-        conn = st.connection("gsheets", type=GSheetsConnection)
         
         try:
-            df = conn.read(worksheet="Matches", ttl="1m")
+            perf.lap()
+            # Already typed with decoded Hole_Scores, Rank and Is_Winner (shared - don't modify in place)
+            df, _ = get_history_cache("Matches").get()
+            perf.lap("history read")
             
             if df.empty:
-                st.info("No match history found in Google Sheets.")
+                st.info("No match history found.")
             else:
-                # --- PRE-PROCESSING ---
-                df['Hole_Scores'] = df['Hole_Scores'].apply(lambda x: json.loads(x) if isinstance(x, str) else x)
-                df['Date'] = pd.to_datetime(df['Date']).dt.date
-                df['Total'] = pd.to_numeric(df['Total'])
-                df['Rank'] = df.groupby('Match_ID')['Total'].rank(method='min', ascending=True)
-                df['Is_Winner'] = df['Rank'] == 1
-
                 # --- SIDEBAR FILTERS ---
                 st.sidebar.header("Filter Statistics")
                 all_players = sorted(df['Player'].unique())
@@ -1288,19 +1093,10 @@ elif page == "Stats Dashboard":
                     st.warning("No matches found for this specific selection.")
                 else:
                     # --- DATA PROCESSING (Build h_df) ---
-                    all_hole_data = []
-                    for _, row in filtered_df.iterrows():
-                        scores = row['Hole_Scores']
-                        if isinstance(scores, list) and len(scores) == 18:
-                            for h_idx, score in enumerate(scores):
-                                all_hole_data.append({
-                                    'Player': row['Player'],
-                                    'Hole': h_idx + 1,
-                                    'Score': score,
-                                    'Is_Ace': 1 if score == 1 else 0,
-                                    'Is_Bogey': 1 if score >= 5 else 0
-                                })
-                    h_df = pd.DataFrame(all_hole_data)
+                    # Hole-level table is built once per data version, here we only filter it
+                    hole_table = get_history_cache("Matches").derived("hole_table", build_hole_table)
+                    h_df = hole_table[hole_table['Row'].isin(filtered_df.index)]
+                    perf.lap("filters + hole table")
 
                     # --- 1. VENUE RECORDS ---
                     st.subheader("📍 Venue Course Records")
@@ -1312,6 +1108,7 @@ elif page == "Stats Dashboard":
                         cols = st.columns(num_cols)
                         for idx, row in enumerate(v_recs.itertuples()):
                             cols[idx % num_cols].metric(row.Venue, f"{row.Total} pts", f"By {row.Player}")
+                    perf.lap("venue records")
 
                     # --- 2. PERFORMANCE TRENDS & POTENTIAL ---
                     st.divider()
@@ -1352,6 +1149,7 @@ elif page == "Stats Dashboard":
                     
                     st.plotly_chart(fig_trend, use_container_width=True)
                     st.caption("This chart shows your progress over time. Lower is better.")
+                    perf.lap("trends")
 
                     # --- 3. ACCURACY & NEMESIS TRACKER ---
                     st.divider()
@@ -1379,6 +1177,7 @@ elif page == "Stats Dashboard":
                         fig_ev_bar.add_hline(y=4.0, line_dash="dot", line_color="white")
                         fig_ev_bar.update_layout(template="plotly_dark", yaxis_title="EV (Avg Score)", xaxis=dict(dtick=1))
                         st.plotly_chart(fig_ev_bar, use_container_width=True)
+                    perf.lap("accuracy + nemesis")
 
                     # --- 4. PROBABILITY & EV HEATMAP ---
                     st.divider()
@@ -1398,38 +1197,63 @@ elif page == "Stats Dashboard":
                             cmap="RdYlGn_r", axis=1, subset=pd.IndexSlice[["EXPECTED VALUE"], :]
                         ), use_container_width=True
                     )
+                    perf.lap("heatmap")
+
+                    # --- 5. RATINGS ---
+                    st.divider()
+                    st.subheader("🏅 Elo Ratings")
+                    golf_ratings = get_rating_store().table("golf")
+                    st.dataframe(golf_ratings[golf_ratings['Player'].isin(selected_players)], use_container_width=True, hide_index=True)
+                    st.caption("Every match counts, at any venue. Each player is scored against every opponent in the match.")
+                    perf.lap("ratings")
+
+                    # --- 6. STREAKS ---
+                    st.divider()
+                    st.subheader("🔥 Streaks")
+                    golf_streaks = get_history_cache("Matches").derived(
+                        "streaks", lambda frame: streak_table(frame, 'Is_Winner')
+                    )
+                    st.dataframe(golf_streaks[golf_streaks.index.isin(selected_players)], use_container_width=True)
+                    st.caption("Streaks count every match played at any venue. Ties for low round count as wins.")
+                    perf.lap("streaks")
+
+                    # --- 7. HEAD TO HEAD ---
+                    st.divider()
+                    st.subheader("⚔️ Head-to-Head Records")
+                    h2h_pairs = head_to_head_pairs(filtered_df, 'Is_Winner')
+                    if not h2h_pairs.empty:
+                        h2h_col1, h2h_col2 = st.columns(2)
+                        with h2h_col1:
+                            st.dataframe(head_to_head_summary(h2h_pairs), use_container_width=True, hide_index=True)
+                        with h2h_col2:
+                            st.dataframe(head_to_head_records(h2h_pairs), use_container_width=True, hide_index=True)
+                        st.caption("Ties for low round share the win.")
+                    else:
+                        st.info("Not enough data for head-to-head records.")
+                    perf.lap("head to head")
 
-                    # --- 5. DETAILED HISTORY ---
+                    # --- 8. DETAILED HISTORY ---
                     st.divider()
                     st.subheader("📜 Detailed Match History")
                     history_df = filtered_df[['Date', 'Venue', 'Player', 'Total', 'Opponents']].sort_values('Date', ascending=False)
                     st.dataframe(history_df, use_container_width=True, hide_index=True)
+                    perf.lap("match history")
 
         except Exception as e:
             st.error(f"Error generating stats: {e}")
     
     elif stats_type == "Cricket KO":  # Cricket KO stats
         st.title("🥊 Cricket KO Analytics")
-        conn = st.connection("gsheets", type=GSheetsConnection)
         
         try:
-            df = conn.read(worksheet="Cricket_Matches", ttl="1m")
+            perf.lap()
+            # Already typed (shared across reruns - don't modify in place)
+            df, _ = get_history_cache("Cricket_Matches").get()
+            perf.lap("history read")
             
             if df.empty:
                 st.info("No Cricket KO match history found. Play some matches and save them to see stats!")
             else:
-                # Convert data types
-                df['Date'] = pd.to_datetime(df['Date']).dt.date
-                df['Total_Marks'] = pd.to_numeric(df['Total_Marks'])
-                df['Total_Darts'] = pd.to_numeric(df['Total_Darts'])
-                df['Marks_Per_Dart'] = pd.to_numeric(df['Marks_Per_Dart'])
-                df['Accuracy_Pct'] = pd.to_numeric(df['Accuracy_Pct'])
-                df['KO_Hits_Given'] = pd.to_numeric(df['KO_Hits_Given'])
-                df['KO_Hits_Received'] = pd.to_numeric(df['KO_Hits_Received'])
-                df['PIN_Attempts'] = pd.to_numeric(df['PIN_Attempts'])
-                df['Won_Match'] = df['Won_Match'].astype(bool)
-                df['Was_Eliminated'] = df['Was_Eliminated'].astype(bool)
-                
                 # Sidebar filters with Select All / Clear All
                 st.sidebar.header("Filter Statistics")
                 all_players = sorted(df['Player'].unique())
@@ -1512,18 +1336,11 @@ elif page == "Stats Dashboard":
                     
                     player_full_stats['Win_Rate'] = ((player_full_stats['Won_Match'] / player_full_stats['Match_ID']) * 100).round(1)
                     
-                    # Calculate win streaks
-                    def calculate_win_streak(player_name):
-                        player_df = df[df['Player'] == player_name].sort_values('Date')
-                        max_streak = 0
-                        current_streak = 0
-                        for won in player_df['Won_Match']:
-                            if won:
-                                current_streak += 1
-                                max_streak = max(max_streak, current_streak)
-                            else:
-                                current_streak = 0
-                        return max_streak
+                    # Win/loss streaks for every player in one pass (cached until new matches arrive)
+                    streaks = get_history_cache("Cricket_Matches").derived(
+                        "streaks", lambda frame: streak_table(frame, 'Won_Match')
+                    )
+                    perf.lap("filters + player totals")
                     
                     # Top Player Metrics
                     st.header("🏆 Top Player Stats")
@@ -1550,13 +1367,12 @@ elif page == "Stats Dashboard":
                         st.metric("Best Accuracy", f"{best_acc:.1f}%", f"{best_acc_player}")
                     
                     with col5:
-                        # Calculate win streaks for all players
-                        streaks = {player: calculate_win_streak(player) for player in df['Player'].unique()}
-                        best_streak_player = max(streaks, key=streaks.get)
-                        best_streak = streaks[best_streak_player]
+                        best_streak_player = streaks['Longest_Win_Streak'].idxmax()
+                        best_streak = streaks.loc[best_streak_player, 'Longest_Win_Streak']
                         st.metric("Best Streak", f"{best_streak}", f"{best_streak_player}")
                     
                     st.divider()
+                    perf.lap("top player stats")
                     
                     # Overview metrics (filtered data)
                     st.header("📈 Filtered Overview")
@@ -1578,6 +1394,7 @@ elif page == "Stats Dashboard":
                     with col4:
                         avg_mpd = filtered_df['Marks_Per_Dart'].mean()
                         st.metric("Avg MPD", f"{avg_mpd:.2f}")
+                    perf.lap("overview")
                     
                     # Player Performance
                     st.header("🎯 Player Performance")
@@ -1605,6 +1422,7 @@ elif page == "Stats Dashboard":
                                                 'KO Hits Taken', 'KO Ratio', 'Times Eliminated', 'PIN Attempts']]
                     
                     st.dataframe(player_stats, use_container_width=True)
+                    perf.lap("player performance")
                     
                     # Performance Trends Over Time (by game number)
                     st.header("📈 Performance Trends Over Time")
@@ -1652,6 +1470,7 @@ elif page == "Stats Dashboard":
                         st.caption("📊 Hover over points to see details. Use filters to compare specific players.")
                     
                     st.divider()
+                    perf.lap("trends")
                     
                     # Game Mode Breakdown
                     st.header("🎮 Performance by Game Mode")
@@ -1663,32 +1482,33 @@ elif page == "Stats Dashboard":
                     mode_stats.columns = ['Games', 'Wins', 'Avg MPD']
                     mode_stats['Win Rate %'] = ((mode_stats['Wins'] / mode_stats['Games']) * 100).round(1)
                     st.dataframe(mode_stats, use_container_width=True)
+                    perf.lap("game modes")
+                    
+                    # Ratings
+                    st.header("🏅 Elo Ratings")
+                    cricket_ratings = get_rating_store().table("cricket")
+                    st.dataframe(cricket_ratings[cricket_ratings['Player'].isin(selected_players)], use_container_width=True, hide_index=True)
+                    perf.lap("ratings")
+                    
+                    # Streaks
+                    st.header("🔥 Streaks")
+                    st.dataframe(streaks[streaks.index.isin(selected_players)], use_container_width=True)
+                    perf.lap("streaks")
                     
                     # Head to Head
                     st.header("⚔️ Head-to-Head Records")
                     
-                    # Create matchup records
-                    h2h_data = []
-                    for match_id in filtered_df['Match_ID'].unique():
-                        match_df = filtered_df[filtered_df['Match_ID'] == match_id]
-                        winner = match_df[match_df['Won_Match'] == True]['Player'].values
-                        if len(winner) > 0:
-                            winner = winner[0]
-                            for _, row in match_df.iterrows():
-                                if row['Player'] != winner:
-                                    h2h_data.append({
-                                        'Winner': winner,
-                                        'Loser': row['Player'],
-                                        'Mode': row['Game_Mode']
-                                    })
+                    # Winner/loser pairs for every match in one grouped pass
+                    h2h_pairs = head_to_head_pairs(filtered_df, 'Won_Match', mode_col='Game_Mode')
                     
-                    if h2h_data:
-                        h2h_df = pd.DataFrame(h2h_data)
-                        h2h_summary = h2h_df.groupby(['Winner', 'Loser']).size().reset_index(name='Wins')
-                        h2h_summary = h2h_summary.sort_values('Wins', ascending=False)
-                        st.dataframe(h2h_summary, use_container_width=True, hide_index=True)
+                    if not h2h_pairs.empty:
+                        st.dataframe(head_to_head_summary(h2h_pairs), use_container_width=True, hide_index=True)
+                        with st.expander("Win % by matchup and game mode"):
+                            st.dataframe(head_to_head_records(h2h_pairs), use_container_width=True, hide_index=True)
+                            st.dataframe(head_to_head_records(h2h_pairs, by_mode=True), use_container_width=True, hide_index=True)
                     else:
                         st.info("Not enough data for head-to-head records.")
+                    perf.lap("head to head")
                     
                     # Recent Matches
                     st.header("📜 Match History")
@@ -1698,6 +1518,7 @@ elif page == "Stats Dashboard":
                     history_df['Won_Match'] = history_df['Won_Match'].map({True: '✅', False: '❌'})
                     history_df.columns = ['Date', 'Venue', 'Mode', 'Player', 'Place', 'Marks', 'MPD', 'KOs', 'Won']
                     st.dataframe(history_df, use_container_width=True, hide_index=True)
+                    perf.lap("match history")
         
         except Exception as e:
             st.error(f"Error loading Cricket stats: {e}")
@@ -1708,7 +1529,6 @@ elif page == "KO Cricket":
     if 'cricket_game' not in st.session_state:
         st.session_state.cricket_game = None
         st.session_state.current_multiplier = 1
-        st.session_state.game_history = []
     
     with st.sidebar:
         st.header("⚙️ Cricket KO Setup")
@@ -1716,7 +1536,7 @@ elif page == "KO Cricket":
         # Game mode selection
         game_mode = st.selectbox(
             "Game Mode",
-            ["Singles Match (1v1)", "Tag Team (2v2)", "Triple Threat (1v1v1)", "Fatal 4 Way (1v1v1v1)"],
+            CRICKET_MODES,
             key="cricket_mode"
         )
         
@@ -1732,14 +1552,7 @@ elif page == "KO Cricket":
             cricket_venue = cricket_venue_sel
         
         # Determine number of players based on mode
-        if "Singles" in game_mode:
-            num_cricket_players = 2
-        elif "Tag Team" in game_mode:
-            num_cricket_players = 4
-        elif "Triple Threat" in game_mode:
-            num_cricket_players = 3
-        else:  # Fatal 4 Way
-            num_cricket_players = 4
+        num_cricket_players = players_for_mode(game_mode)
         
         cricket_names = []
         profiles = get_profiles()
@@ -1759,10 +1572,8 @@ elif page == "KO Cricket":
         st.divider()
         
         if st.button("🎲 Start New Game", type="primary"):
-            st.session_state.cricket_game = initialize_cricket_game(num_cricket_players, cricket_names, game_mode)
-            st.session_state.cricket_game['venue'] = cricket_venue  # Store venue in game state
+            st.session_state.cricket_game = CricketKOGame(cricket_names, game_mode, venue=cricket_venue)
             st.session_state.current_multiplier = 1
-            st.session_state.game_history = []
             st.rerun()
         
         if st.session_state.cricket_game:
@@ -1782,8 +1593,7 @@ elif page == "KO Cricket":
     
     else:
         game = st.session_state.cricket_game
-        current_player = game['player_names'][game['current_player_idx']]
-        player_key = f"P{game['current_player_idx'] + 1}"
+        current_player = game.player_names[game.current_player_idx]
         
         # Initialize camera settings in session state
         if 'cricket_camera_size_val' not in st.session_state:
@@ -1924,138 +1734,55 @@ elif page == "KO Cricket":
         with game_container:
             # Player headers and dart counter - 9 column layout
             header_cols = st.columns([1, 1, 1, 1, 1, 1, 1, 1, 1])
-            
-            # C1-C2: Empty
-            
-            # C3: Player 1 (or Team 1 Player 1 in tag team) - only for 3-4 players
-            with header_cols[2]:
-                if game['num_players'] >= 3:
-                    player_idx = 0
-                    p_key = f"P{player_idx + 1}"
-                    is_self = player_idx == game['current_player_idx']
-                    already_skipped = game['ko_skipped'][p_key]
-                    at_skip_limit = game['consecutive_skips'][p_key] >= 1
-                    is_eliminated = game['eliminated'][p_key]
-                    
-                    # Check elimination phase
-                    active_players = sum(1 for p in range(game['num_players']) if not game['eliminated'][f"P{p+1}"])
-                    in_elimination_phase = any(game['board_closed'].values()) and active_players > 2 and not game['is_tag_team']
-                    current_player_key = f"P{game['current_player_idx'] + 1}"
-                    current_player_board_closed = game['board_closed'].get(current_player_key, False)
-                    
+
+            # C1-C2 and C8-C9 empty. Players sit either side of the dart counter (C5):
+            # 1v1 = C4/C6, Triple Threat = C3/C4/C6, Tag Team and Fatal 4 Way = C3/C4/C6/C7
+            header_slots = CRICKET_SLOTS[game.num_players]
+            for player_idx, col in enumerate(header_slots):
+                with header_cols[col]:
                     # Display header HTML
                     st.markdown(get_player_header_html(game, player_idx), unsafe_allow_html=True)
-                    
+
                     # Clickable KO button
-                    if st.button(f"💀 KO", disabled=(is_self or is_eliminated or (already_skipped and not in_elimination_phase) or (at_skip_limit and not in_elimination_phase)), use_container_width=True, key=f"ko_header_{player_idx}"):
-                        # Track stats
-                        game['total_darts'][current_player_key] += 1
-                        game['ko_hits_given'][current_player_key] += 1
-                        game['ko_hits_received'][p_key] += 1
-                        
-                        if in_elimination_phase and current_player_board_closed:
-                            game['ko_elimination_progress'][p_key] += 1
-                            game['dart_hits'][game['dart_count']] = f"KO{game['ko_numbers'][p_key]}"
-                            game['marks_per_dart'][game['dart_count']] = 0
-                            game['dart_count'] += 1
-                            if game['ko_elimination_progress'][p_key] >= 3:
-                                game['eliminated'][p_key] = True
-                        else:
-                            game['ko_skipped'][p_key] = True
-                            game['consecutive_skips'][p_key] += 1
-                            game['marks_per_dart'][game['dart_count']] = 0
-                            game['dart_hits'][game['dart_count']] = f"KO{game['ko_numbers'][p_key]}"
-                            game['dart_count'] += 1
-                        if game['dart_count'] >= 3:
-                            game['consecutive_skips'][current_player_key] = 0
-                            advance_to_next_player(game)
-                            game['dart_count'] = 0
-                            game['marks_per_dart'] = [0, 0, 0]
-                            game['dart_hits'] = ['', '', '']
+                    if st.button(f"💀 KO", disabled=not game.can_ko(player_idx), use_container_width=True, key=f"ko_header_{player_idx}"):
+                        game.apply_dart(KO, player_idx)
                         st.session_state.current_multiplier = 1
                         st.rerun()
-            
-            # C4: Player 2 (or Team 1 Player 2 in tag team) - always used
-            with header_cols[3]:
-                player_idx = 1 if game['num_players'] >= 3 else 0
-                p_key = f"P{player_idx + 1}"
-                is_self = player_idx == game['current_player_idx']
-                already_skipped = game['ko_skipped'][p_key]
-                at_skip_limit = game['consecutive_skips'][p_key] >= 1
-                is_eliminated = game['eliminated'][p_key]
-                
-                # Check elimination phase
-                active_players = sum(1 for p in range(game['num_players']) if not game['eliminated'][f"P{p+1}"])
-                in_elimination_phase = any(game['board_closed'].values()) and active_players > 2 and not game['is_tag_team']
-                current_player_key = f"P{game['current_player_idx'] + 1}"
-                current_player_board_closed = game['board_closed'].get(current_player_key, False)
-                
-                # Display header HTML
-                st.markdown(get_player_header_html(game, player_idx), unsafe_allow_html=True)
-                
-                # Clickable KO button
-                if st.button(f"💀 KO", disabled=(is_self or is_eliminated or (already_skipped and not in_elimination_phase) or (at_skip_limit and not in_elimination_phase)), use_container_width=True, key=f"ko_header_{player_idx}"):
-                    # Track stats
-                    game['total_darts'][current_player_key] += 1
-                    game['ko_hits_given'][current_player_key] += 1
-                    game['ko_hits_received'][p_key] += 1
-                    
-                    if in_elimination_phase and current_player_board_closed:
-                        game['ko_elimination_progress'][p_key] += 1
-                        game['dart_hits'][game['dart_count']] = f"KO{game['ko_numbers'][p_key]}"
-                        game['marks_per_dart'][game['dart_count']] = 0
-                        game['dart_count'] += 1
-                        if game['ko_elimination_progress'][p_key] >= 3:
-                            game['eliminated'][p_key] = True
-                    else:
-                        game['ko_skipped'][p_key] = True
-                        game['consecutive_skips'][p_key] += 1
-                        game['marks_per_dart'][game['dart_count']] = 0
-                        game['dart_hits'][game['dart_count']] = f"KO{game['ko_numbers'][p_key]}"
-                        game['dart_count'] += 1
-                    if game['dart_count'] >= 3:
-                        game['consecutive_skips'][current_player_key] = 0
-                        advance_to_next_player(game)
-                        game['dart_count'] = 0
-                        game['marks_per_dart'] = [0, 0, 0]
-                        game['dart_hits'] = ['', '', '']
-                    st.session_state.current_multiplier = 1
-                    st.rerun()
-            
+
             # C5: Dart counter and pin meter (center)
             with header_cols[4]:
                 dart_display = []
                 for i in range(3):
-                    if i < game['dart_count']:
-                        hit = game['dart_hits'][i]
+                    if i < game.dart_count:
+                        hit = game.dart_hits[i]
                         if hit:
                             dart_display.append(hit)
                         else:
                             dart_display.append("???")
                     else:
                         dart_display.append("-")
-                
+
                 # Build pin meter if any board is closed
                 pin_meter_html = ""
-                if any(game['board_closed'].values()):
-                    pin = game['pin_count']
+                if game.any_board_closed():
+                    pin = game.pin_count
                     p1_dots = []
                     p2_dots = []
-                    
+
                     # Player 1 side (positive)
                     for i in range(3, 0, -1):
                         if pin >= i:
                             p1_dots.append("●")
                         else:
                             p1_dots.append("○")
-                    
+
                     # Player 2 side (negative)
                     for i in range(1, 4):
                         if pin <= -i:
                             p2_dots.append("●")
                         else:
                             p2_dots.append("○")
-                    
+
                     meter = " ".join(p1_dots) + " ━ " + " ".join(p2_dots)
                     pin_meter_html = f"""<div style='margin-top: clamp(3px, 0.6vh, 12px); padding-top: clamp(3px, 0.6vh, 12px); border-top: 1px solid #333;'>
                         <div style='font-size: clamp(9px, 1.5vh, 22px); color: #888; margin-bottom: 2px; line-height: 1.3;'>PIN</div>
@@ -2069,414 +1796,93 @@ elif page == "KO Cricket":
                     {pin_meter_html}
                 </div>
                 """, unsafe_allow_html=True)
-            
-            # C6: Player 3 (or Team 2 Player 1) - always used (at least for player 2 in 1v1)
-            with header_cols[5]:
-                if game['num_players'] == 2:
-                    player_idx = 1
-                elif game['num_players'] == 3:
-                    player_idx = 2
-                else:  # 4 players
-                    player_idx = 2
-                
-                p_key = f"P{player_idx + 1}"
-                is_self = player_idx == game['current_player_idx']
-                already_skipped = game['ko_skipped'][p_key]
-                at_skip_limit = game['consecutive_skips'][p_key] >= 1
-                is_eliminated = game['eliminated'][p_key]
-                
-                # Check elimination phase
-                active_players = sum(1 for p in range(game['num_players']) if not game['eliminated'][f"P{p+1}"])
-                in_elimination_phase = any(game['board_closed'].values()) and active_players > 2 and not game['is_tag_team']
-                current_player_key = f"P{game['current_player_idx'] + 1}"
-                current_player_board_closed = game['board_closed'].get(current_player_key, False)
-                
-                # Display header HTML
-                st.markdown(get_player_header_html(game, player_idx), unsafe_allow_html=True)
-                
-                # Clickable KO button
-                if st.button(f"💀 KO", disabled=(is_self or is_eliminated or (already_skipped and not in_elimination_phase) or (at_skip_limit and not in_elimination_phase)), use_container_width=True, key=f"ko_header_{player_idx}"):
-                    # Track stats
-                    game['total_darts'][current_player_key] += 1
-                    game['ko_hits_given'][current_player_key] += 1
-                    game['ko_hits_received'][p_key] += 1
-                    
-                    if in_elimination_phase and current_player_board_closed:
-                        game['ko_elimination_progress'][p_key] += 1
-                        game['dart_hits'][game['dart_count']] = f"KO{game['ko_numbers'][p_key]}"
-                        game['marks_per_dart'][game['dart_count']] = 0
-                        game['dart_count'] += 1
-                        if game['ko_elimination_progress'][p_key] >= 3:
-                            game['eliminated'][p_key] = True
-                    else:
-                        game['ko_skipped'][p_key] = True
-                        game['consecutive_skips'][p_key] += 1
-                        game['marks_per_dart'][game['dart_count']] = 0
-                        game['dart_hits'][game['dart_count']] = f"KO{game['ko_numbers'][p_key]}"
-                        game['dart_count'] += 1
-                    if game['dart_count'] >= 3:
-                        game['consecutive_skips'][current_player_key] = 0
-                        advance_to_next_player(game)
-                        game['dart_count'] = 0
-                        game['marks_per_dart'] = [0, 0, 0]
-                        game['dart_hits'] = ['', '', '']
-                    st.session_state.current_multiplier = 1
-                    st.rerun()
-            
-            # C7: Player 4 (or Team 2 Player 2) - only for 4 players
-            with header_cols[6]:
-                if game['num_players'] == 4:
-                    player_idx = 3
-                    p_key = f"P{player_idx + 1}"
-                    is_self = player_idx == game['current_player_idx']
-                    already_skipped = game['ko_skipped'][p_key]
-                    at_skip_limit = game['consecutive_skips'][p_key] >= 1
-                    is_eliminated = game['eliminated'][p_key]
-                    
-                    # Check elimination phase
-                    active_players = sum(1 for p in range(game['num_players']) if not game['eliminated'][f"P{p+1}"])
-                    in_elimination_phase = any(game['board_closed'].values()) and active_players > 2 and not game['is_tag_team']
-                    current_player_key = f"P{game['current_player_idx'] + 1}"
-                    current_player_board_closed = game['board_closed'].get(current_player_key, False)
-                    
-                    # Display header HTML
-                    st.markdown(get_player_header_html(game, player_idx), unsafe_allow_html=True)
-                    
-                    # Clickable KO button
-                    if st.button(f"💀 KO", disabled=(is_self or is_eliminated or (already_skipped and not in_elimination_phase) or (at_skip_limit and not in_elimination_phase)), use_container_width=True, key=f"ko_header_{player_idx}"):
-                        # Track stats
-                        game['total_darts'][current_player_key] += 1
-                        game['ko_hits_given'][current_player_key] += 1
-                        game['ko_hits_received'][p_key] += 1
-                        
-                        if in_elimination_phase and current_player_board_closed:
-                            game['ko_elimination_progress'][p_key] += 1
-                            game['dart_hits'][game['dart_count']] = f"KO{game['ko_numbers'][p_key]}"
-                            game['marks_per_dart'][game['dart_count']] = 0
-                            game['dart_count'] += 1
-                            if game['ko_elimination_progress'][p_key] >= 3:
-                                game['eliminated'][p_key] = True
-                        else:
-                            game['ko_skipped'][p_key] = True
-                            game['consecutive_skips'][p_key] += 1
-                            game['marks_per_dart'][game['dart_count']] = 0
-                            game['dart_hits'][game['dart_count']] = f"KO{game['ko_numbers'][p_key]}"
-                            game['dart_count'] += 1
-                        if game['dart_count'] >= 3:
-                            game['consecutive_skips'][current_player_key] = 0
-                            advance_to_next_player(game)
-                            game['dart_count'] = 0
-                            game['marks_per_dart'] = [0, 0, 0]
-                            game['dart_hits'] = ['', '', '']
-                        st.session_state.current_multiplier = 1
-                        st.rerun()
-            
-            # C8-C9: Empty
-            
-            # Perfect turn celebration banner
-            if 'perfect_turn' in st.session_state and st.session_state.perfect_turn:
-                import time
-                current_time = time.time()
-                
-                if st.session_state.perfect_turn_start is None:
-                    st.session_state.perfect_turn_start = current_time
-                
-                elapsed = current_time - st.session_state.perfect_turn_start
-                
-                if elapsed < 2:  # Show for 2 seconds
-                    st.markdown(f"""
-                    <div style='background: #00ff88; padding: clamp(5px, 1.5vh, 20px); text-align: center; border-radius: 5px; margin: clamp(3px, 0.8vh, 12px) 0;'>
-                        <h3 style='color: #000; margin: 0; font-size: clamp(13px, 2.8vh, 36px); line-height: 1.3;'>🎯 DARTS BACK! 🎯</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    time.sleep(0.1)
-                    st.rerun()
-                else:
-                    # Clear celebration
-                    del st.session_state.perfect_turn
-                    del st.session_state.perfect_turn_start
-                    st.rerun()
-            
+
+            # Perfect turn celebration banner - hides itself in the browser after 2 seconds
+            banner_left = st.session_state.get('perfect_turn_until', 0) - time.time()
+            if banner_left > 0:
+                st.markdown(expiring_html(f"""
+                <div style='background: #00ff88; padding: clamp(5px, 1.5vh, 20px); text-align: center; border-radius: 5px; margin: clamp(3px, 0.8vh, 12px) 0;'>
+                    <h3 style='color: #000; margin: 0; font-size: clamp(13px, 2.8vh, 36px); line-height: 1.3;'>🎯 DARTS BACK! 🎯</h3>
+                </div>
+                """, banner_left), unsafe_allow_html=True)
+
             # Check if game is over (someone won via pin)
-            if game['game_over']:
-                winner_name = game['player_names'][game['winner']]
+            if game.game_over:
+                winner_name = game.player_names[game.winner]
                 st.markdown(f"""
                 <div style='background: #00ff88; padding: clamp(8px, 2.2vh, 35px); text-align: center; border-radius: 8px; margin: clamp(5px, 1.5vh, 25px) 0;'>
                     <h1 style='color: #000; margin: 0; font-size: clamp(18px, 5vh, 60px); line-height: 1.3;'>🏆 {winner_name} WINS! 🏆</h1>
                     <div style='color: #000; font-size: clamp(13px, 3vh, 36px); margin-top: clamp(4px, 1.2vh, 20px); line-height: 1.3;'>Victory by PIN!</div>
                 </div>
                 """, unsafe_allow_html=True)
-                
+
                 # Save Match button
                 if st.button("💾 Save Match to Sheets", type="primary", use_container_width=True):
                     save_cricket_match(game)
                     st.session_state.cricket_game = None
                     st.rerun()
-                
+
                 # Start New Game button
                 if st.button("🎮 Start New Game", use_container_width=True):
                     st.session_state.cricket_game = None
                     st.rerun()
-            
+
             # Check if current player skipped
-            elif game['ko_skipped'][player_key]:
-                # Initialize countdown if not set
-                if 'skip_countdown' not in st.session_state:
-                    st.session_state.skip_countdown = 3
-                    st.session_state.skip_start_time = None
-                
-                # Use time-based countdown instead of sleep
-                import time
-                current_time = time.time()
-                
-                if st.session_state.skip_start_time is None:
-                    st.session_state.skip_start_time = current_time
-                
-                elapsed = current_time - st.session_state.skip_start_time
-                remaining = max(0, 3 - int(elapsed))
-                
+            elif game.current_is_skipped():
+                # Countdown ticks in the browser; one rerun at the deadline takes the turn away.
+                # The deadline belongs to this particular skip, so one left behind by a new game
+                # (or an undo/redo mid-countdown) can't make the next skip resolve instantly.
+                skip_key = (game, game.current_player_idx, len(game.journal))
+                if st.session_state.get('skip_deadline', (None,))[0] != skip_key:
+                    st.session_state.skip_deadline = (skip_key, time.time() + KO_SKIP_SECONDS)
+                deadline = st.session_state.skip_deadline[1]
+                remaining = deadline - time.time()
+
+                if remaining <= 0:
+                    # Time's up - advance to next player
+                    game.resolve_skip()
+                    del st.session_state.skip_deadline
+                    st.rerun()
+
                 st.markdown(f"""
                 <div style='background: #ff4444; padding: clamp(6px, 1.5vh, 22px); text-align: center; border-radius: 5px; margin: clamp(4px, 1vh, 18px) 0;'>
                     <h2 style='color: white; margin: 0; font-size: clamp(13px, 2.8vh, 36px); line-height: 1.3;'>💀 {current_player} SKIPPED! 💀</h2>
-                    <div style='color: white; font-size: clamp(12px, 2.2vh, 30px); margin-top: clamp(3px, 0.7vh, 12px); line-height: 1.3;'>{remaining}</div>
+                    <div style='color: white; font-size: clamp(12px, 2.2vh, 30px); margin-top: clamp(3px, 0.7vh, 12px); line-height: 1.3;'>{countdown_html(remaining)}</div>
                 </div>
                 """, unsafe_allow_html=True)
-                
-                if remaining == 0:
-                    # Time's up - advance to next player
-                    game['ko_skipped'][player_key] = False
-                    advance_to_next_player(game)
-                    game['dart_count'] = 0
-                    game['marks_per_dart'] = [0, 0, 0]
-                    game['dart_hits'] = ['', '', '']
-                    # Clear countdown
-                    del st.session_state.skip_countdown
-                    del st.session_state.skip_start_time
-                    st.rerun()
-                else:
-                    # Keep counting down
-                    time.sleep(0.1)
-                    st.rerun()
-            
+                rerun_at(deadline)
+
             else:
-                # Cricket board - rebuild for all game modes
+                # Cricket board - one mark column per board (tag teams share T1 in C4 and T2 in C6)
+                board_slots = [3, 5] if game.is_tag_team else header_slots
                 for idx, num in enumerate(CRICKET_NUMBERS):
                     num_label = "B" if num == 'B' else ("T" if num == 'T' else ("D" if num == 'D' else str(num)))
-                    
-                    # Get marks for each position based on game mode
-                    if game['is_tag_team']:
-                        # Tag team: T1 in C4, T2 in C6
-                        marks_c3 = ""
-                        marks_c4 = get_mark_symbol(game['cricket_boards']['T1'][num])
-                        marks_c6 = get_mark_symbol(game['cricket_boards']['T2'][num])
-                        marks_c7 = ""
-                    elif game['num_players'] == 2:
-                        # Singles: P1 in C4, P2 in C6
-                        marks_c3 = ""
-                        marks_c4 = get_mark_symbol(game['cricket_boards']['P1'][num])
-                        marks_c6 = get_mark_symbol(game['cricket_boards']['P2'][num])
-                        marks_c7 = ""
-                    elif game['num_players'] == 3:
-                        # Triple Threat: P1 in C3, P2 in C4, P3 in C6
-                        marks_c3 = get_mark_symbol(game['cricket_boards']['P1'][num])
-                        marks_c4 = get_mark_symbol(game['cricket_boards']['P2'][num])
-                        marks_c6 = get_mark_symbol(game['cricket_boards']['P3'][num])
-                        marks_c7 = ""
-                    else:  # 4 players
-                        # Fatal 4 Way: P1 in C3, P2 in C4, P3 in C6, P4 in C7
-                        marks_c3 = get_mark_symbol(game['cricket_boards']['P1'][num])
-                        marks_c4 = get_mark_symbol(game['cricket_boards']['P2'][num])
-                        marks_c6 = get_mark_symbol(game['cricket_boards']['P3'][num])
-                        marks_c7 = get_mark_symbol(game['cricket_boards']['P4'][num])
-                    
+                    num_pos = NUMBER_INDEX[num]
+
                     cols = st.columns([1, 1, 1, 1, 1, 1, 1, 1, 1])
-                    
-                    # C1-C2: Empty
-                    
-                    # C3: Marks (if applicable)
-                    with cols[2]:
-                        if marks_c3:
-                            st.markdown(f"<div class='cricket-mark' style='text-align: center; font-size: clamp(20px, 4.5vh, 90px); height: clamp(28px, 5.5vh, 100px); display: flex; align-items: center; justify-content: center; font-weight: bold; line-height: 1;'>{marks_c3}</div>", unsafe_allow_html=True)
-
-                    # C4: Marks (always used)
-                    with cols[3]:
-                        st.markdown(f"<div class='cricket-mark' style='text-align: center; font-size: clamp(20px, 4.5vh, 90px); height: clamp(28px, 5.5vh, 100px); display: flex; align-items: center; justify-content: center; font-weight: bold; line-height: 1;'>{marks_c4}</div>", unsafe_allow_html=True)
-                    
-                    # C5: Number button
+
+                    # Marks either side of the number button
+                    for board_idx, col in enumerate(board_slots):
+                        with cols[col]:
+                            st.markdown(f"<div class='cricket-mark' style='text-align: center; font-size: clamp(20px, 4.5vh, 90px); height: clamp(28px, 5.5vh, 100px); display: flex; align-items: center; justify-content: center; font-weight: bold; line-height: 1;'>{get_mark_symbol(game.boards[board_idx][num_pos])}</div>", unsafe_allow_html=True)
+
+                    # C5: Number button - disabled if eliminated, skipped, board closed, OR this number is already closed
                     with cols[4]:
-                        # Determine which board to use
-                        current_player_key = f"P{game['current_player_idx'] + 1}"
-                        
-                        if game['is_tag_team']:
-                            # Tag team: P1/P2 use T1 board, P3/P4 use T2 board
-                            board_key = 'T1' if game['current_player_idx'] in [0, 1] else 'T2'
-                        else:
-                            board_key = current_player_key
-                        
-                        current_player_marks = game['cricket_boards'][board_key][num]
-                        is_eliminated = game['eliminated'][current_player_key]
-                        
-                        # Disable if: eliminated, skipped, board closed, OR this number is already closed (3+ marks)
-                        current_player_disabled = (
-                            is_eliminated or
-                            game['ko_skipped'][current_player_key] or
-                            game['board_closed'].get(board_key, False) or
-                            current_player_marks >= 3
-                        )
-
-                        if st.button(num_label, key=f"num_{num}", disabled=current_player_disabled, use_container_width=True):
-                            st.session_state.game_history.append(json.dumps({
-                                'boards': {k: dict(v) for k, v in game['cricket_boards'].items()},
-                                'dart': game['dart_count'],
-                                'marks_per_dart': game['marks_per_dart'][:],
-                                'player': game['current_player_idx'],
-                                'skipped': dict(game['ko_skipped']),
-                                'consecutive_skips': dict(game['consecutive_skips']),
-                                'pin_count': game['pin_count']
-                            }))
-                            
-                            # Track stats
-                            game['total_darts'][current_player_key] += 1
-                            marks_added = st.session_state.current_multiplier
-                            game['total_marks'][current_player_key] += marks_added
-                            
-                            # Apply to correct board (team or individual)
-                            # Cap marks at 3 - no extra points in Cricket KO
-                            new_marks = game['cricket_boards'][board_key][num] + marks_added
-                            game['cricket_boards'][board_key][num] = min(new_marks, 3)
-                            game['marks_per_dart'][game['dart_count']] = marks_added
-                            
-                            # Record what was hit
-                            num_display = "BULL" if num == 'B' else ("TRIP" if num == 'T' else ("DBL" if num == 'D' else str(num)))
-                            if st.session_state.current_multiplier == 1:
-                                game['dart_hits'][game['dart_count']] = num_display
-                            elif st.session_state.current_multiplier == 2:
-                                game['dart_hits'][game['dart_count']] = f"D{num_display}"
-                            else:
-                                game['dart_hits'][game['dart_count']] = f"T{num_display}"
-                            
-                            game['dart_count'] += 1
+                        if st.button(num_label, key=f"num_{num}", disabled=not game.can_hit(num), use_container_width=True):
+                            result = game.apply_dart(NUMBER, num, st.session_state.current_multiplier)
                             st.session_state.current_multiplier = 1
-                            
-                            # Reset consecutive skips - player has thrown a dart
-                            game['consecutive_skips'][current_player_key] = 0
-                            
-                            # Check if board is closed
-                            was_closed_before = game['board_closed'][board_key]
-                            if check_board_closed(game['cricket_boards'][board_key]):
-                                game['board_closed'][board_key] = True
-                                # Track darts to close if this is the first time closing
-                                if not was_closed_before and game['darts_to_close'][current_player_key] is None:
-                                    game['darts_to_close'][current_player_key] = game['board_close_dart_count'][current_player_key] + 1
-                            
-                            # Increment board close dart counter (if not closed yet)
-                            if not game['board_closed'][board_key]:
-                                game['board_close_dart_count'][current_player_key] += 1
-                            
-                            # Check if turn is over
-                            if game['dart_count'] >= 3:
-                                all_darts_scored = all(m > 0 for m in game['marks_per_dart'])
-                                
-                                if all_darts_scored:
-                                    # Trigger celebration banner
-                                    st.session_state.perfect_turn = True
-                                    st.session_state.perfect_turn_start = None
-                                    game['dart_count'] = 0
-                                    game['marks_per_dart'] = [0, 0, 0]
-                                    game['dart_hits'] = ['', '', '']
-                                else:
-                                    advance_to_next_player(game)
-                                    game['dart_count'] = 0
-                                    game['marks_per_dart'] = [0, 0, 0]
-                                    game['dart_hits'] = ['', '', '']
-                                    game['consecutive_skips'][current_player_key] = 0
+                            if result.perfect_turn:
+                                # Trigger celebration banner
+                                st.session_state.perfect_turn_until = time.time() + DARTS_BACK_SECONDS
                             st.rerun()
 
-                    # C6: Marks (always used - at least P2 in 1v1)
-                    with cols[5]:
-                        st.markdown(f"<div class='cricket-mark' style='text-align: center; font-size: clamp(20px, 4.5vh, 90px); height: clamp(28px, 5.5vh, 100px); display: flex; align-items: center; justify-content: center; font-weight: bold; line-height: 1;'>{marks_c6}</div>", unsafe_allow_html=True)
-
-                    # C7: Marks (if applicable)
-                    with cols[6]:
-                        if marks_c7:
-                            st.markdown(f"<div class='cricket-mark' style='text-align: center; font-size: clamp(20px, 4.5vh, 90px); height: clamp(28px, 5.5vh, 100px); display: flex; align-items: center; justify-content: center; font-weight: bold; line-height: 1;'>{marks_c7}</div>", unsafe_allow_html=True)
-                    
-                    # C8-C9: Empty
-            
             # PIN button - only show when down to 2 active players (or tag team with boards closed)
-            active_players = sum(1 for p in range(game['num_players']) if not game['eliminated'][f"P{p+1}"])
-            show_pin = (active_players == 2 or game['is_tag_team']) and any(game['board_closed'].values())
-            
-            if show_pin:
+            if game.pin_available():
                 cols = st.columns([1, 1, 1, 1, 1, 1, 1, 1, 1])
                 with cols[4]:
-                    # Determine if PIN button should be enabled
-                    current_player_key = f"P{game['current_player_idx'] + 1}"
-                    pin_disabled = game['ko_skipped'][current_player_key]
-
-                    if st.button("PIN", key="pin_button", disabled=pin_disabled, use_container_width=True):
-                        # Track stats
-                        game['total_darts'][current_player_key] += 1
-                        game['pin_attempts'][current_player_key] += 1
-                        
-                        st.session_state.game_history.append(json.dumps({
-                            'boards': {k: dict(v) for k, v in game['cricket_boards'].items()},
-                            'dart': game['dart_count'],
-                            'marks_per_dart': game['marks_per_dart'][:],
-                            'player': game['current_player_idx'],
-                            'skipped': dict(game['ko_skipped']),
-                            'consecutive_skips': dict(game['consecutive_skips']),
-                            'pin_count': game['pin_count']
-                        }))
-                        
-                        # Determine correct board
-                        if game['is_tag_team']:
-                            board_key = 'T1' if game['current_player_idx'] in [0, 1] else 'T2'
-                            # Map tag team players to team direction: T1 (P1+P2) = 0, T2 (P3+P4) = 1
-                            team_idx = 0 if game['current_player_idx'] in [0, 1] else 1
-                        else:
-                            board_key = current_player_key
-                            team_idx = game['current_player_idx']
-
-                        # Update pin count
-                        game['pin_count'] = update_pin_count(
-                            game['pin_count'],
-                            team_idx,
-                            game['board_closed'][board_key]
-                        )
-                        
-                        # Record the dart
-                        game['dart_hits'][game['dart_count']] = "PIN"
-                        game['marks_per_dart'][game['dart_count']] = 0  # Doesn't count toward "darts back"
-                        game['dart_count'] += 1
+                    if st.button("PIN", key="pin_button", disabled=not game.can_pin(), use_container_width=True):
+                        game.apply_dart(PIN)
                         st.session_state.current_multiplier = 1
-                        
-                        # Reset consecutive skips - player has thrown a dart
-                        game['consecutive_skips'][current_player_key] = 0
-                        
-                        # Check for win condition
-                        if abs(game['pin_count']) >= 3:
-                            game['game_over'] = True
-                            game['winner'] = game['current_player_idx']  # Store index, not name
-                            st.rerun()
-                        
-                        # Check if turn is over
-                        if game['dart_count'] >= 3:
-                            all_darts_scored = all(m > 0 for m in game['marks_per_dart'])
-                            
-                            if all_darts_scored:
-                                # Trigger celebration banner
-                                st.session_state.perfect_turn = True
-                                st.session_state.perfect_turn_start = None
-                                game['dart_count'] = 0
-                                game['marks_per_dart'] = [0, 0, 0]
-                                game['dart_hits'] = ['', '', '']
-                            else:
-                                advance_to_next_player(game)
-                                game['dart_count'] = 0
-                                game['marks_per_dart'] = [0, 0, 0]
-                                game['dart_hits'] = ['', '', '']
-                                game['consecutive_skips'][current_player_key] = 0
                         st.rerun()
 
             # Container for bottom buttons - constrained width
@@ -2493,9 +1899,9 @@ elif page == "KO Cricket":
             }
             </style>
             """, unsafe_allow_html=True)
-            
+
             st.markdown("<div class='bottom-buttons-container'>", unsafe_allow_html=True)
-            
+
             # Multipliers and Miss - 9 column layout
             st.markdown("""
             <style>
@@ -2510,114 +1916,55 @@ elif page == "KO Cricket":
             }
             </style>
             """, unsafe_allow_html=True)
-            
-            # Row 1: Multipliers, Miss, Next Player, Undo (shifted left by 1 for centering)
+
+            # Row 1: Multipliers, Miss, Next Player, Undo, Redo (shifted left by 1 for centering)
             mult_cols = st.columns([1, 1, 1, 1, 1, 1, 1, 1, 1])
-            
+
             # C3: 2x
             with mult_cols[2]:
                 if st.button("2x", type="primary" if st.session_state.current_multiplier==2 else "secondary", use_container_width=True, key="mult2"):
                     st.session_state.current_multiplier = 2
                     st.rerun()
-            
+
             # C4: 3x
             with mult_cols[3]:
                 if st.button("3x", type="primary" if st.session_state.current_multiplier==3 else "secondary", use_container_width=True, key="mult3"):
                     st.session_state.current_multiplier = 3
                     st.rerun()
-            
+
             # C5: Miss
             with mult_cols[4]:
-                if st.button("Miss", use_container_width=True, key="miss"):
-                    current_player_key = f"P{game['current_player_idx'] + 1}"
-                    
-                    # Track stats
-                    game['total_darts'][current_player_key] += 1
-                    if not game['board_closed'].get(f"P{game['current_player_idx'] + 1}" if not game['is_tag_team'] else ('T1' if game['current_player_idx'] < 2 else 'T2'), False):
-                        game['board_close_dart_count'][current_player_key] += 1
-                    
-                    game['marks_per_dart'][game['dart_count']] = 0
-                    game['dart_hits'][game['dart_count']] = "MISS"
-                    game['dart_count'] += 1
+                if st.button("Miss", disabled=game.game_over, use_container_width=True, key="miss"):
+                    game.apply_dart(MISS)
                     st.session_state.current_multiplier = 1
-                    
-                    # Reset consecutive skips - player has thrown a dart
-                    game['consecutive_skips'][current_player_key] = 0
-                    
-                    if game['dart_count'] >= 3:
-                        all_darts_scored = all(m > 0 for m in game['marks_per_dart'])
-                        
-                        if all_darts_scored:
-                            game['dart_count'] = 0
-                            game['marks_per_dart'] = [0, 0, 0]
-                            game['dart_hits'] = ['', '', '']
-                        else:
-                            player_key = f"P{game['current_player_idx'] + 1}"
-                            game['consecutive_skips'][player_key] = 0
-                            advance_to_next_player(game)
-                            game['dart_count'] = 0
-                            game['marks_per_dart'] = [0, 0, 0]
-                            game['dart_hits'] = ['', '', '']
                     st.rerun()
-            
-            
-            # C6: Next Player
-        with mult_cols[5]:
-            if st.button("Next Player", use_container_width=True, key="next_player"):
-                current_player_key = f"P{game['current_player_idx'] + 1}"
-                
-                # --- CRITICAL FIX: Increment the actual total_darts counter ---
-                while game['dart_count'] < 3:
-                    # Update the round-specific lists
-                    game['marks_per_dart'][game['dart_count']] = 0
-                    game['dart_hits'][game['dart_count']] = "MISS"
-                    
-                    # Update the PERMANENT stats counter for the player
-                    game['total_darts'][current_player_key] += 1
-                    
-                    # Move to the next dart slot in the round
-                    game['dart_count'] += 1
-                
-                # Move to next non-eliminated player
-                advance_to_next_player(game)
-                
-                # Reset turn-based UI states
-                game['dart_count'] = 0
-                game['marks_per_dart'] = [0, 0, 0]
-                game['dart_hits'] = ['', '', '']
-                game['consecutive_skips'][current_player_key] = 0
-                st.session_state.current_multiplier = 1
-                st.rerun()
-            
+
+            # C6: Next Player - unused darts are recorded as misses
+            with mult_cols[5]:
+                if st.button("Next Player", disabled=game.game_over, use_container_width=True, key="next_player"):
+                    game.next_player()
+                    st.session_state.current_multiplier = 1
+                    st.rerun()
+
             # C7: Undo
             with mult_cols[6]:
-                if st.button("Undo", disabled=len(st.session_state.game_history)==0, use_container_width=True, key="undo"):
-                    if len(st.session_state.game_history) > 0:
-                        prev = json.loads(st.session_state.game_history.pop())
-                        # Properly restore the boards - convert string keys back to int where needed
-                        for p_key, board in prev['boards'].items():
-                            game['cricket_boards'][p_key] = {}
-                            for k, v in board.items():
-                                # Convert numeric string keys back to integers
-                                try:
-                                    key = int(k)
-                                except ValueError:
-                                    key = k
-                                game['cricket_boards'][p_key][key] = v
-                        game['dart_count'] = prev['dart']
-                        game['marks_per_dart'] = prev['marks_per_dart']
-                        game['current_player_idx'] = prev['player']
-                        game['ko_skipped'] = prev['skipped']
-                        game['consecutive_skips'] = prev['consecutive_skips']
-                        if 'pin_count' in prev:
-                            game['pin_count'] = prev['pin_count']
-                        st.session_state.current_multiplier = 1
-                        st.rerun()
+                if st.button("Undo", disabled=not game.can_undo(), use_container_width=True, key="undo"):
+                    game.undo()
+                    st.session_state.pop('skip_deadline', None)
+                    st.session_state.current_multiplier = 1
+                    st.rerun()
+
+            # C8: Redo
+            with mult_cols[7]:
+                if st.button("Redo", disabled=not game.can_redo(), use_container_width=True, key="redo"):
+                    game.redo()
+                    st.session_state.pop('skip_deadline', None)
+                    st.session_state.current_multiplier = 1
+                    st.rerun()
 
 # --- PAGE 4: ROYAL RUMBLE ---
 elif page == "Royal Rumble":
     import time
-    import base64
 
     # Royal Rumble specific button styling
     st.markdown("""
@@ -2711,69 +2058,44 @@ elif page == "Royal Rumble":
                             name = st.text_input("Guest Name", f"Guest {player_idx + 1}", key=f"rumble_guest_{player_idx}")
 
                         # Music file upload (only if entrances enabled)
+                        saved_track = None
                         if enable_entrances:
                             music_file = st.file_uploader(f"Entrance Music (MP3)", type=['mp3', 'wav', 'ogg'], key=f"rumble_music_{player_idx}")
+                            # Profiles keep their last entrance track between sessions
+                            if music_file is None and name in profiles and name != "Guest":
+                                saved_track = get_music_store().profile_track(name)
+                                if saved_track:
+                                    st.caption("🎵 Using saved entrance track")
                         else:
                             music_file = None
 
                         players.append({
                             'name': name,
                             'music_file': music_file,
-                            'music_data': None
+                            'track': saved_track
                         })
 
         st.divider()
 
         if st.button("START ROYAL RUMBLE!", type="primary", use_container_width=True):
-            # Assign random numbers (1-20)
-            import random
-            available_numbers = list(range(1, 21))
-            random.shuffle(available_numbers)
-
-            # Randomize entry order
-            entry_order = list(range(num_players))
-            random.shuffle(entry_order)
-
-            # Process music files
-            for idx, player in enumerate(players):
+            # Store uploads in the music cache - the game only keeps track ids
+            music_store = get_music_store()
+            music = []
+            for player in players:
                 if player['music_file'] is not None:
-                    # Read and encode music file
-                    music_bytes = player['music_file'].read()
-                    player['music_data'] = base64.b64encode(music_bytes).decode()
-                    player['music_type'] = player['music_file'].type
-
-            # Initialize game state
-            st.session_state.rumble_game = {
-                'players': [
-                    {
-                        'name': players[entry_order[i]]['name'],
-                        'number': available_numbers[i],
-                        'music_data': players[entry_order[i]]['music_data'],
-                        'music_type': players[entry_order[i]].get('music_type'),
-                        'marks': 0,
-                        'eliminated': False,
-                        'entry_position': i,
-                        'has_entered': i < 2,  # First 2 start immediately
-                        'eliminated_by': None
-                    }
-                    for i in range(num_players)
-                ],
-                'active_player_indices': [0, 1],  # Indices into players array
-                'current_turn_idx': 0,  # Index into active_player_indices
-                'entry_interval': entry_interval,
-                'no_healing_delay': no_healing_delay,
-                'game_start_time': time.time(),
-                'last_entry_time': time.time(),
-                'next_entry_idx': 2,  # Next player to enter
-                'no_healing_active': False,
-                'no_healing_start': None,
-                'game_over': False,
-                'winner': None,
-                'current_entry_player': None,  # For showing entry animation
-                'paused': False,
-                'pause_time': None,
-                'total_pause_duration': 0,
-                'game_history': [],  # For undo functionality
+                    track = music_store.put(player['music_file'].getvalue(), player['music_file'].type, player['music_file'].name)
+                    if player['name'] in profiles and player['name'] != "Guest":
+                        music_store.set_profile_track(player['name'], track)
+                    music.append(track)
+                else:
+                    music.append(player['track'])
+
+            # Numbers (1-20) and entry order are randomized by the engine
+            st.session_state.rumble_game = RoyalRumbleGame(
+                [player['name'] for player in players],
+                entry_interval=entry_interval, no_healing_delay=no_healing_delay, music=music
+            )
+            st.session_state.rumble_settings = {
                 'enable_entrances': enable_entrances,
                 'music_duration': music_duration
             }
@@ -2781,46 +2103,37 @@ elif page == "Royal Rumble":
 
     else:
         # Active Game
+        settings = st.session_state.get('rumble_settings', {})
 
         # Sidebar controls
         with st.sidebar:
             st.divider()
-            if st.button("Pause" if not game.get('paused', False) else "Resume", use_container_width=True):
-                if not game.get('paused', False):
-                    # Pause the game
-                    game['paused'] = True
-                    game['pause_time'] = time.time()
+            if st.button("Pause" if not game.paused else "Resume", use_container_width=True):
+                if not game.paused:
+                    game.pause()
                 else:
-                    # Resume the game
-                    pause_duration = time.time() - game['pause_time']
-                    game['total_pause_duration'] += pause_duration
-                    game['paused'] = False
-                    game['pause_time'] = None
+                    game.resume()
                 st.rerun()
 
             if st.button("Reset Game", use_container_width=True):
                 st.session_state.rumble_game = None
+                st.session_state.pop('rumble_banner', None)
                 st.rerun()
 
-        current_time = time.time()
-
-        # Adjust current time if paused
-        if game.get('paused', False):
-            current_time = game['pause_time']
-
-        # Account for total pause duration
-        adjusted_time = current_time - game['total_pause_duration']
+        # Entries and no healing fire on the game clock, whoever is throwing
+        game.tick()
+        wake_at = []  # time.time() deadlines this screen needs a rerun at
 
         # Show player entry animation
-        if game['current_entry_player'] is not None:
-            entering_player = game['players'][game['current_entry_player']]
+        if game.entering is not None:
+            entering_player = game.entering
 
             # Auto-close after 5 seconds
             import streamlit.components.v1 as components
             components.html(f"""
             <div id="entry-banner" style='background: linear-gradient(90deg, #ff0000, #ffaa00); padding: 30px; text-align: center; border-radius: 10px; margin: 20px 0;'>
-                <h1 style='color: #000; margin: 0; font-size: clamp(2rem, 5vh, 3rem);'>{entering_player['name']} IS ENTERING!</h1>
-                <h2 style='color: #000; margin: 10px 0; font-size: clamp(1.2rem, 3vh, 2rem);'>Number: {entering_player['number']}</h2>
+                <h1 style='color: #000; margin: 0; font-size: clamp(2rem, 5vh, 3rem);'>{game.names[entering_player]} IS ENTERING!</h1>
+                <h2 style='color: #000; margin: 10px 0; font-size: clamp(1.2rem, 3vh, 2rem);'>Number: {game.numbers[entering_player]}</h2>
             </div>
             <script>
                 setTimeout(function() {{
@@ -2830,67 +2143,65 @@ elif page == "Royal Rumble":
             """, height=150)
 
             # Play music (only if entrances are enabled and music exists)
-            if game.get('enable_entrances', True) and entering_player['music_data'] is not None:
-                music_duration_ms = game.get('music_duration', 45) * 1000
-                audio_html = f"""
-                <audio id="entrance-music" autoplay loop volume="1.0">
-                    <source src="data:{entering_player['music_type']};base64,{entering_player['music_data']}" type="{entering_player['music_type']}">
-                </audio>
-                <script>
-                    // Ensure music plays immediately and loudly
-                    var audio = document.getElementById('entrance-music');
-                    audio.volume = 1.0;
-                    audio.play().catch(function(error) {{
-                        console.log('Audio autoplay blocked:', error);
-                    }});
-
-                    // Stop after configured duration
-                    setTimeout(function() {{
-                        audio.pause();
-                        audio.currentTime = 0;
-                    }}, {music_duration_ms});
-                </script>
-                """
-                st.markdown(audio_html, unsafe_allow_html=True)
-
-            # Auto-close entry banner after 5 seconds
-            if 'entry_banner_time' not in game:
-                game['entry_banner_time'] = time.time()
-
-            elapsed_banner_time = time.time() - game['entry_banner_time']
-            if elapsed_banner_time >= 5:
-                game['current_entry_player'] = None
-                if 'entry_banner_time' in game:
-                    del game['entry_banner_time']
-                st.rerun()
-            else:
-                # Force refresh to check timer
-                time.sleep(0.5)
+            # Served from the music cache by URL instead of inlining the file into the page
+            track = game.music[entering_player]
+            music_store = get_music_store()
+            if settings.get('enable_entrances', True) and music_store.exists(track):
+                st.markdown("<style>[data-testid='stAudio'] { display: none; }</style>", unsafe_allow_html=True)
+                st.audio(music_store.path(track), format=music_store.mime(track), autoplay=True, loop=True,
+                         end_time=settings.get('music_duration', 45))
+
+            # Auto-close entry banner after 5 seconds (restarts if another entry fires meanwhile).
+            # Keyed by game and entry count so a banner left over from a reset game never carries over.
+            banner_key = (game, entering_player, game.next_entry_idx)
+            banner = st.session_state.get('rumble_banner')
+            if banner is None or banner[0] != banner_key:
+                banner = st.session_state.rumble_banner = (banner_key, time.time() + ENTRY_BANNER_SECONDS)
+
+            if time.time() >= banner[1]:
+                game.finish_entry()
+                del st.session_state.rumble_banner
                 st.rerun()
+            wake_at.append(banner[1])
 
         else:
             # Normal game display
 
             # Show winner banner at the top if game is over
-            if game['game_over']:
+            if game.game_over:
                 st.markdown(f"""
                 <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 40px; text-align: center; border-radius: 15px; margin: 30px 0;'>
-                    <h1 style='color: #fff; margin: 0; font-size: clamp(2rem, 6vh, 4rem);'>{game['winner']} WINS!</h1>
+                    <h1 style='color: #fff; margin: 0; font-size: clamp(2rem, 6vh, 4rem);'>{game.names[game.winner]} WINS!</h1>
                     <h2 style='color: #fff; margin: 20px 0; font-size: clamp(1.2rem, 3vh, 2rem);'>ROYAL RUMBLE CHAMPION!</h2>
                 </div>
                 """, unsafe_allow_html=True)
 
-            # Live updating timers with JavaScript (no auto-reload)
+            # Live timers - the server sends deadlines (time.time() seconds) and the browser counts
+            # down to them, correcting for its own clock being off from the server's
             import streamlit.components.v1 as components
 
-            # Calculate initial values
-            time_until_next = game['entry_interval'] - (adjusted_time - game['last_entry_time']) if game['next_entry_idx'] < len(game['players']) else 0
-            elapsed = adjusted_time - game['game_start_time']
-            time_until_no_healing = game['no_healing_delay'] - (adjusted_time - game['no_healing_start']) if (game['no_healing_start'] is not None and not game['no_healing_active']) else 0
+            now = time.time()
+            elapsed = game.elapsed()
+            if game.no_healing_active:
+                timer1_label, timer1_deadline, timer1_left = "No Healing", None, None
+            elif game.no_healing_start is not None:
+                timer1_label, timer1_left = "Healing Ends", game.time_until_no_healing()
+                timer1_deadline = game.clock.wall_time(game.clock.due_at(NO_HEALING))
+            elif not game.all_entered():
+                timer1_label, timer1_left = "Next Entry", game.time_until_next_entry()
+                timer1_deadline = game.clock.wall_time(game.clock.due_at(ENTRY))
+            else:
+                timer1_label, timer1_deadline, timer1_left = "All Players In", None, None
+
+            def clock_text(seconds):
+                return f"{int(seconds // 60)}:{int(seconds % 60):02d}"
 
-            is_paused = game.get('paused', False)
-            all_players_in = game['next_entry_idx'] >= len(game['players'])
-            show_healing_timer = game['no_healing_start'] is not None
+            if game.no_healing_active:
+                timer1_text, timer1_style = "ACTIVE", "color: #ff0000; font-size: clamp(1.5rem, 4vh, 3rem);"
+            elif timer1_left is None:
+                timer1_text, timer1_style = "--:--", ""
+            else:
+                timer1_text, timer1_style = clock_text(timer1_left), ""
 
             components.html(f"""
             <style>
@@ -2898,126 +2209,81 @@ elif page == "Royal Rumble":
             </style>
             <div id="timers" style="display: flex; justify-content: space-around; text-align: center; color: white; font-family: 'Source Sans Pro', sans-serif;">
                 <div style="flex: 1;">
-                    <div id="timer1-label" style="font-size: clamp(0.8rem, 1.5vh, 1.2rem); margin-bottom: 5px; color: white;">{'Healing Ends' if all_players_in and show_healing_timer else 'Next Entry'}</div>
-                    <div id="timer1" style="font-size: clamp(2rem, 5vh, 4rem); font-weight: bold; color: white; font-family: 'Source Sans Pro', sans-serif;">{int(time_until_no_healing // 60) if all_players_in and show_healing_timer else int(time_until_next // 60)}:{int(time_until_no_healing % 60) if all_players_in and show_healing_timer else int(time_until_next % 60):02d}</div>
+                    <div id="timer1-label" style="font-size: clamp(0.8rem, 1.5vh, 1.2rem); margin-bottom: 5px; color: white;">{timer1_label}</div>
+                    <div id="timer1" style="font-size: clamp(2rem, 5vh, 4rem); font-weight: bold; color: white; font-family: 'Source Sans Pro', sans-serif; {timer1_style}">{timer1_text}</div>
                 </div>
                 <div style="flex: 1;">
                     <div style="font-size: clamp(0.8rem, 1.5vh, 1.2rem); margin-bottom: 5px; color: white;">Time</div>
-                    <div id="timer2" style="font-size: clamp(2rem, 5vh, 4rem); font-weight: bold; color: white; font-family: 'Source Sans Pro', sans-serif;">{int(elapsed // 60)}:{int(elapsed % 60):02d}</div>
+                    <div id="timer2" style="font-size: clamp(2rem, 5vh, 4rem); font-weight: bold; color: white; font-family: 'Source Sans Pro', sans-serif;">{clock_text(elapsed)}</div>
                 </div>
             </div>
             <script>
-                let nextEntry = {time_until_next};
-                let gameTime = {elapsed};
-                let healingEnds = {time_until_no_healing};
-                let isPaused = {str(is_paused).lower()};
-                let allPlayersIn = {str(all_players_in).lower()};
-                let noHealingActive = {str(game.get('no_healing_active', False)).lower()};
-                let showHealingTimer = {str(show_healing_timer).lower()};
-
-                setInterval(function() {{
-                    if (!isPaused) {{
-                        // Update Timer 1 (Next Entry or Healing Ends)
-                        if (allPlayersIn && showHealingTimer) {{
-                            // Show Healing Ends timer
-                            if (!noHealingActive && healingEnds > 0) {{
-                                healingEnds--;
-                                let mins = Math.floor(healingEnds / 60);
-                                let secs = Math.floor(healingEnds % 60);
-                                document.getElementById('timer1').innerText = mins + ':' + (secs < 10 ? '0' : '') + secs;
-                                document.getElementById('timer1').style.color = 'white';
-                                document.getElementById('timer1').style.fontSize = 'clamp(2rem, 5vh, 4rem)';
-                                // Timer hit zero - events will trigger on next button press
-                            }} else if (noHealingActive) {{
-                                document.getElementById('timer1-label').innerText = 'No Healing';
-                                document.getElementById('timer1').innerText = 'ACTIVE';
-                                document.getElementById('timer1').style.color = '#ff0000';
-                                document.getElementById('timer1').style.fontSize = 'clamp(1.5rem, 4vh, 3rem)';
-                            }}
-                        }} else if (!allPlayersIn) {{
-                            // Show Next Entry timer
-                            if (nextEntry > 0) {{
-                                nextEntry--;
-                                let mins = Math.floor(nextEntry / 60);
-                                let secs = Math.floor(nextEntry % 60);
-                                document.getElementById('timer1').innerText = mins + ':' + (secs < 10 ? '0' : '') + secs;
-                            }} else {{
-                                // Timer at zero, show 0:00
-                                document.getElementById('timer1').innerText = '0:00';
-                            }}
-                        }} else {{
-                            // All players in, waiting for healing timer to start
-                            document.getElementById('timer1-label').innerText = 'All Players In';
-                            document.getElementById('timer1').innerText = '--:--';
-                        }}
-
-                        // Update Timer 2 (Game Time)
-                        gameTime++;
-                        let mins2 = Math.floor(gameTime / 60);
-                        let secs2 = Math.floor(gameTime % 60);
-                        document.getElementById('timer2').innerText = mins2 + ':' + (secs2 < 10 ? '0' : '') + secs2;
+                // Paused or game over: the server-rendered values stand
+                const running = {str(not game.paused and not game.game_over).lower()};
+                const offset = {now * 1000} - Date.now();  // Server clock minus browser clock
+                const startedAt = {(now - elapsed) * 1000};
+                const timer1Deadline = {'null' if timer1_deadline is None else timer1_deadline * 1000};
+
+                function clockText(ms) {{
+                    const secs = Math.max(0, Math.floor(ms / 1000));
+                    return Math.floor(secs / 60) + ':' + String(secs % 60).padStart(2, '0');
+                }}
+                function tick() {{
+                    const serverNow = Date.now() + offset;
+                    // Counts down to the deadline and holds at 0:00 - the server reruns right on it
+                    if (timer1Deadline !== null) {{
+                        document.getElementById('timer1').innerText = clockText(timer1Deadline - serverNow);
                     }}
-                }}, 1000);
+                    document.getElementById('timer2').innerText = clockText(serverNow - startedAt);
+                }}
+                if (running) {{
+                    setInterval(tick, 250);
+                }}
             </script>
             """, height=80)
 
             st.divider()
 
-            current_player_game_idx = game['active_player_indices'][game['current_turn_idx']] if game['active_player_indices'] else None
+            current_player_game_idx = game.current
 
             # All Players Display - 2 columns (compact header) - shows active and eliminated
             st.markdown("<h3 style='font-size: clamp(1rem, 2vh, 1.5rem); margin-bottom: 5px;'>Players</h3>", unsafe_allow_html=True)
 
-            # Display all players in turn order (active_player_indices order), then eliminated
+            # Display all players in turn order, then eliminated
             player_cols = st.columns(2)
 
-            # Build display order: active players in turn order, then eliminated players
-            display_order = []
-
-            # First, add all active players in their turn order
-            for player_idx in game['active_player_indices']:
-                if game['players'][player_idx]['has_entered'] and not game['players'][player_idx]['eliminated']:
-                    display_order.append(player_idx)
-
-            # Then add eliminated players (in entry order)
-            for i, player in enumerate(game['players']):
-                if player['has_entered'] and player['eliminated']:
-                    display_order.append(i)
-
-            for idx, i in enumerate(display_order):
-                player = game['players'][i]
-                if player['has_entered']:  # Only show players who have entered
-                    is_current = (i == current_player_game_idx)
-                    is_eliminated = player['eliminated']
-                    arrow = "➡️ " if is_current else ""
-
-                    if is_eliminated:
-                        # Grey out eliminated players
-                        border = "border-left: 5px solid #555;"
-                        opacity = "opacity: 0.4;"
-                        bar_color = "#666"
-                    else:
-                        border = "border-left: 5px solid #ffaa00;" if is_current else "border-left: 5px solid transparent;"
-                        opacity = ""
-                        # Progress bar
-                        progress_pct = (player['marks'] / 10) * 100
-                        bar_color = "#00ff00" if player['marks'] < 5 else ("#ffaa00" if player['marks'] < 8 else "#ff0000")
+            for idx, i in enumerate(game.display_order()):
+                is_current = (i == current_player_game_idx)
+                is_eliminated = game.eliminated[i]
+                marks = game.marks[i]
+                arrow = "➡️ " if is_current else ""
+
+                if is_eliminated:
+                    # Grey out eliminated players
+                    border = "border-left: 5px solid #555;"
+                    opacity = "opacity: 0.4;"
+                    bar_color = "#666"
+                else:
+                    border = "border-left: 5px solid #ffaa00;" if is_current else "border-left: 5px solid transparent;"
+                    opacity = ""
+                    bar_color = "#00ff00" if marks < 5 else ("#ffaa00" if marks < 8 else "#ff0000")
 
-                    progress_pct = (player['marks'] / 10) * 100
+                # Progress bar
+                progress_pct = (marks / ELIMINATION_MARKS) * 100
 
-                    with player_cols[idx % 2]:
-                        st.markdown(f"""
-                        <div style='{border} background: rgba(255,255,255,0.05); padding: 6px 8px; margin: 2px 0; border-radius: 6px; {opacity}'>
-                            <div style='font-size: clamp(0.85rem, 1.8vh, 1.3rem); font-weight: bold;'>{arrow}{player['name']} (#{player['number']}){' - ELIMINATED' if is_eliminated else ''}</div>
-                            <div style='background: #333; border-radius: 8px; height: clamp(16px, 2.5vh, 24px); margin-top: 4px; position: relative;'>
-                                <div style='background: {bar_color}; width: {progress_pct}%; height: 100%; border-radius: 8px; transition: width 0.3s;'></div>
-                                <div style='position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); color: white; font-weight: bold; font-size: clamp(0.65rem, 1.2vh, 0.9rem);'>{player['marks']}/10</div>
-                            </div>
+                with player_cols[idx % 2]:
+                    st.markdown(f"""
+                    <div style='{border} background: rgba(255,255,255,0.05); padding: 6px 8px; margin: 2px 0; border-radius: 6px; {opacity}'>
+                        <div style='font-size: clamp(0.85rem, 1.8vh, 1.3rem); font-weight: bold;'>{arrow}{game.names[i]} (#{game.numbers[i]}){' - ELIMINATED' if is_eliminated else ''}</div>
+                        <div style='background: #333; border-radius: 8px; height: clamp(16px, 2.5vh, 24px); margin-top: 4px; position: relative;'>
+                            <div style='background: {bar_color}; width: {progress_pct}%; height: 100%; border-radius: 8px; transition: width 0.3s;'></div>
+                            <div style='position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%); color: white; font-weight: bold; font-size: clamp(0.65rem, 1.2vh, 0.9rem);'>{marks}/{ELIMINATION_MARKS}</div>
                         </div>
-                        """, unsafe_allow_html=True)
+                    </div>
+                    """, unsafe_allow_html=True)
 
             # Number Pad for Scoring
-            st.markdown(f"<h3 style='font-size: clamp(1rem, 2vh, 1.5rem); margin: 10px 0 5px 0;'>➡️ {game['players'][current_player_game_idx]['name']}'s Turn</h3>", unsafe_allow_html=True)
+            st.markdown(f"<h3 style='font-size: clamp(1rem, 2vh, 1.5rem); margin: 10px 0 5px 0;'>➡️ {game.names[current_player_game_idx]}'s Turn</h3>", unsafe_allow_html=True)
             st.markdown("<p style='font-size: clamp(0.7rem, 1.3vh, 0.9rem); opacity: 0.7; margin-bottom: 8px;'>Click a number that was hit</p>", unsafe_allow_html=True)
 
             # Create number pad (1-20) in a 4x5 grid
@@ -3026,115 +2292,35 @@ elif page == "Royal Rumble":
                 cols = st.columns(nums_per_row)
                 for col_idx in range(nums_per_row):
                     num = row * nums_per_row + col_idx + 1
-                    if num <= 20:
-                        with cols[col_idx]:
-                            # Check if this number belongs to an active player
-                            number_owner = None
-                            for i in game['active_player_indices']:
-                                if game['players'][i]['number'] == num and not game['players'][i]['eliminated']:
-                                    number_owner = i
-                                    break
-
-                            disabled = (number_owner is None)
-
-                            # All numbers are buttons, disabled ones just can't be clicked
-                            button_type = "primary" if (not disabled and number_owner == current_player_game_idx) else "secondary"
-                            button_clicked = st.button(str(num), use_container_width=True, key=f"num_{num}", type=button_type, disabled=disabled)
-
-                            if button_clicked and not disabled:
-                                # Save state for undo
-                                import copy
-                                game['game_history'].append(copy.deepcopy({
-                                    'players': game['players'],
-                                    'active_player_indices': game['active_player_indices'],
-                                    'current_turn_idx': game['current_turn_idx']
-                                }))
-
-                                # Hit this number
-                                target_player = game['players'][number_owner]
-                                current_player = game['players'][current_player_game_idx]
-
-                                if number_owner == current_player_game_idx:
-                                    # Hit own number - can only heal if not in no-healing phase
-                                    if not game['no_healing_active']:
-                                        target_player['marks'] = max(0, target_player['marks'] - 1)
-                                else:
-                                    # Hit opponent - give them a mark
-                                    target_player['marks'] += 1
-
-                                    # Check for elimination
-                                    if target_player['marks'] >= 10:
-                                        target_player['eliminated'] = True
-                                        target_player['eliminated_by'] = current_player['name']
-
-                                        # Remove from active players
-                                        game['active_player_indices'].remove(number_owner)
-
-                                        # Adjust current_turn_idx if needed
-                                        if game['current_turn_idx'] >= len(game['active_player_indices']):
-                                            game['current_turn_idx'] = 0
-
-                                        # Check for winner (only if all players have entered)
-                                        all_players_entered = game['next_entry_idx'] >= len(game['players'])
-                                        if len(game['active_player_indices']) == 1 and all_players_entered:
-                                            game['game_over'] = True
-                                            game['winner'] = game['players'][game['active_player_indices'][0]]['name']
-
-                                st.rerun()
+                    with cols[col_idx]:
+                        # Numbers only work if they belong to someone in the ring
+                        number_owner = game.owner_of(num)
+                        disabled = number_owner is None or game.game_over
+
+                        # All numbers are buttons, disabled ones just can't be clicked
+                        button_type = "primary" if (not disabled and number_owner == current_player_game_idx) else "secondary"
+                        if st.button(str(num), use_container_width=True, key=f"num_{num}", type=button_type, disabled=disabled):
+                            game.hit(num)
+                            st.rerun()
 
             # Control Buttons - Undo and Next Player
             col1, col2 = st.columns(2)
             with col1:
-                if st.button("Undo", use_container_width=True, disabled=len(game['game_history']) == 0):
-                    if game['game_history']:
-                        # Restore previous state
-                        prev_state = game['game_history'].pop()
-                        game['players'] = prev_state['players']
-                        game['active_player_indices'] = prev_state['active_player_indices']
-                        game['current_turn_idx'] = prev_state['current_turn_idx']
-                        st.rerun()
+                if st.button("Undo", use_container_width=True, disabled=not game.can_undo()):
+                    game.undo()
+                    st.rerun()
             with col2:
                 if st.button("Next Player", use_container_width=True):
-                    # Check if it's time for a new player to enter
-                    current_time = time.time()
-                    adjusted_time = current_time - game['total_pause_duration']
-
-                    if not game.get('paused', False) and game['next_entry_idx'] < len(game['players']) and game.get('current_entry_player') is None:
-                        time_since_last_entry = adjusted_time - game['last_entry_time']
-                        if time_since_last_entry >= game['entry_interval']:
-                            # Timer hit zero - new player enters!
-                            new_player_idx = game['next_entry_idx']
-
-                            # Insert the new player right after the current player in active_player_indices
-                            insert_position = game['current_turn_idx'] + 1
-                            game['active_player_indices'].insert(insert_position, new_player_idx)
-
-                            # Mark player as entered
-                            game['players'][new_player_idx]['has_entered'] = True
-
-                            game['last_entry_time'] = adjusted_time
-                            game['next_entry_idx'] += 1
-                            game['current_entry_player'] = new_player_idx
-
-                            # Make the new player the current turn (they go immediately)
-                            game['current_turn_idx'] = insert_position
-
-                            # Check if this was the last player
-                            if game['next_entry_idx'] >= len(game['players']):
-                                game['no_healing_start'] = adjusted_time
-
-                            st.rerun()
-
-                    # Check if no-healing should activate (timer hit zero and Next Player pressed)
-                    if not game.get('paused', False) and game['no_healing_start'] is not None and not game['no_healing_active']:
-                        time_since_no_healing_start = adjusted_time - game['no_healing_start']
-                        if time_since_no_healing_start >= game['no_healing_delay']:
-                            game['no_healing_active'] = True
-
-                    # Advance to next player (only if no entry happened)
-                    game['current_turn_idx'] = (game['current_turn_idx'] + 1) % len(game['active_player_indices'])
+                    game.next_player()
                     st.rerun()
 
+        # One rerun when the banner closes or the next entry / no healing is due - nothing polls
+        deadline = game.next_deadline()
+        if deadline is not None and not game.paused:
+            wake_at.append(game.clock.wall_time(deadline))
+        if wake_at:
+            rerun_at(min(wake_at))
+
 
 # --- PAGE 5: MANAGE PROFILES ---
 elif page == "Manage Profiles":
@@ -3201,3 +2387,21 @@ elif page == "Manage Profiles":
         st.markdown(f"**{len(profiles)} profile(s):** {', '.join(profiles)}")
     else:
         st.info("No profiles saved yet")
+
+# --- DEV TIMINGS PANEL ---
+perf.end_rerun()
+if perf.enabled:
+    with perf_panel.expander("⏱️ Section Timings", expanded=True):
+        summary = perf.summary()
+        pages = list(summary['Page'].unique())
+        shown_page = st.selectbox("Page", pages, index=pages.index(page) if page in pages else 0, key="dev_timings_page")
+        st.dataframe(summary[summary['Page'] == shown_page].drop(columns="Page"), hide_index=True, use_container_width=True)
+        st.caption(f"Last {len(perf.samples):,} timed sections this session (ms)")
+        col1, col2, col3 = st.columns(3)
+        col1.download_button("JSON", perf.export_json(), file_name=TIMINGS_FILE + ".json", mime="application/json",
+                             key="dev_timings_json", on_click="ignore", use_container_width=True)
+        col2.download_button("CSV", perf.export_csv(), file_name=TIMINGS_FILE + ".csv", mime="text/csv",
+                             key="dev_timings_csv", on_click="ignore", use_container_width=True)
+        if col3.button("Clear", key="dev_timings_clear", use_container_width=True):
+            perf.clear()
+            st.rerun()
@@ -0,0 +1,246 @@
+from dataclasses import dataclass
+from itertools import combinations
+
+import numpy as np
+
+from golf_engine import REGULATION_HOLES, TOTAL_HOLES
+
+MAX_SCORE = 6  # Score buttons go 1-6; anything higher in old history counts as a 6
+HOLE_PRIOR = 10  # Pseudo-holes pulling a player's per-hole distribution toward their overall one
+PLAYER_PRIOR = 20  # ...and their overall distribution toward everyone's
+BATCH = 50_000  # Rounds simulated per chunk - keeps the working arrays around 10-30 MB
+MAX_TIE_BREAKS = 50  # Replays of 19-20 before a still-tied round is split evenly
+
+
+@dataclass
+class SimResult:
+    """Outcome of a batch of simulated rounds, per player in lineup order"""
+    rounds: int
+    win: np.ndarray  # Win probability (a tie with no tie breaker splits the win)
+    tie_breaker: float  # Probability the round goes to holes 19-20
+    expected: np.ndarray  # Mean strokes (Stroke Play), holes won (Match Play) or skins (Skins) over 18
+
+
+# --- FITTING ---
+def score_counts(hole_table):
+    """Per-player score counts on each hole: {player: (18, MAX_SCORE) array}, from build_hole_table output"""
+    if hole_table.empty:
+        return {}
+    players, player_idx = np.unique(hole_table['Player'].values, return_inverse=True)
+    hole_idx = hole_table['Hole'].values - 1
+    score_idx = np.clip(hole_table['Score'].values, 1, MAX_SCORE) - 1
+    counts = np.zeros((len(players), REGULATION_HOLES, MAX_SCORE))
+    np.add.at(counts, (player_idx, hole_idx, score_idx), 1)
+    return dict(zip(players, counts))
+
+
+def fit_skill_model(counts, players, hole_prior=HOLE_PRIOR, player_prior=PLAYER_PRIOR):
+    """Score distribution per player per hole: (players, 20, MAX_SCORE) probabilities.
+
+    Each hole is shrunk toward the player's overall distribution and that toward the pooled
+    distribution of everyone in history, so a player with a few rounds (or a guest with none)
+    still gets sensible odds. Tie breaker holes 19-20 use the player's overall distribution.
+    """
+    if counts:
+        pooled = sum(c.sum(axis=0) for c in counts.values()) + 1  # +1 so no score is impossible
+    else:
+        pooled = np.ones(MAX_SCORE)
+    pooled = pooled / pooled.sum()
+
+    probs = np.empty((len(players), TOTAL_HOLES, MAX_SCORE))
+    for i, name in enumerate(players):
+        player_counts = counts.get(name, np.zeros((REGULATION_HOLES, MAX_SCORE)))
+        overall = player_counts.sum(axis=0) + player_prior * pooled
+        overall /= overall.sum()
+        per_hole = player_counts + hole_prior * overall
+        probs[i, :REGULATION_HOLES] = per_hole / per_hole.sum(axis=1, keepdims=True)
+        probs[i, REGULATION_HOLES:] = overall
+    return probs
+
+
+# --- SIMULATION ---
+def _sample(rng, cdf, n):
+    """Scores for n rounds from per-(player, hole) CDFs of shape (P, H, MAX_SCORE-1) -> (n, P, H) int8"""
+    u = rng.random((n,) + cdf.shape[:2], dtype=np.float32)
+    scores = np.ones(u.shape, dtype=np.int8)
+    for k in range(cdf.shape[2]):
+        scores += u > cdf[:, :, k]
+    return scores
+
+
+def _hole_results(scores):
+    """(is_best, outright) for (n, P, H) scores - outright is False on holes where the best score is shared"""
+    is_best = scores == scores.min(axis=1, keepdims=True)
+    outright = is_best.sum(axis=1) == 1
+    return is_best, outright
+
+
+def _regulation(scores, mode):
+    """Per-round standings after 18 holes, (n, P) - strokes are negated so bigger is always better"""
+    if mode == "Stroke Play":
+        return -scores.sum(axis=2, dtype=np.int16)
+    is_best, outright = _hole_results(scores)
+    won = is_best & outright[:, None, :]
+    if mode == "Match Play":
+        return won.sum(axis=2, dtype=np.int16)
+    # Skins - ties carry the pot to the next hole
+    n, num_players, holes = scores.shape
+    skins = np.zeros((n, num_players), dtype=np.int16)
+    carry = np.ones(n, dtype=np.int16)
+    for h in range(holes):
+        skins += won[:, :, h] * carry[:, None]
+        carry = np.where(outright[:, h], 1, carry + 1)
+    return skins
+
+
+def simulate_rounds(probs, mode="Stroke Play", n_rounds=100_000, tie_breaker=True, scores=None, rng=None):
+    """Monte Carlo win odds for a lineup with fitted probs (see fit_skill_model).
+
+    scores is an optional (players, 18) array of holes already played (NaN for the rest), for
+    live odds part way through a round. Rounds are simulated in chunks of BATCH, all players
+    and holes at once; only skins carryover and tie breaker replays loop in Python.
+    """
+    rng = rng or np.random.default_rng()
+    probs = np.asarray(probs, dtype=np.float32)
+    num_players = len(probs)
+    cdf = probs.cumsum(axis=2)[:, :, :-1]
+    reg_cdf, tb_cdf = cdf[:, :REGULATION_HOLES], cdf[:, REGULATION_HOLES:]
+    if scores is not None:
+        scores = np.asarray(scores, dtype=float)[:num_players, :REGULATION_HOLES]
+        played = ~np.isnan(scores)
+        known = np.nan_to_num(scores).astype(np.int8)
+
+    win = np.zeros(num_players)
+    expected = np.zeros(num_players)
+    tie_rounds = 0
+    done = 0
+    while done < n_rounds:
+        n = min(BATCH, n_rounds - done)
+        sim = _sample(rng, reg_cdf, n)
+        if scores is not None:
+            sim = np.where(played, known, sim)
+        standing = _regulation(sim, mode)
+        expected += np.abs(standing).sum(axis=0)
+        tied = standing == standing.max(axis=1, keepdims=True)
+
+        if tie_breaker and num_players > 1:
+            # Tied leaders replay 19-20 (best combined score) until one is left
+            tie_rounds += int((tied.sum(axis=1) > 1).sum())
+            for _ in range(MAX_TIE_BREAKS):
+                open_rounds = np.flatnonzero(tied.sum(axis=1) > 1)
+                if not len(open_rounds):
+                    break
+                tb = _sample(rng, tb_cdf, len(open_rounds)).sum(axis=2, dtype=np.int16)
+                tb[~tied[open_rounds]] = np.iinfo(np.int16).max
+                tied[open_rounds] = tb == tb.min(axis=1, keepdims=True)
+        win += (tied / tied.sum(axis=1, keepdims=True)).sum(axis=0)
+        done += n
+
+    return SimResult(n_rounds, win / n_rounds, tie_rounds / n_rounds, expected / n_rounds)
+
+
+# --- EXACT STROKE PLAY ODDS ---
+def _win_odds(final, resolve):
+    """Exact win odds for independent final-total distributions, lowest total wins.
+
+    final is (k, L) - P(player ends on t strokes). resolve(group) gives the odds within a tied
+    group (positions into final) - or None for the whole field, meaning the tie is replayed
+    from scratch, which is solved for directly instead of recursing.
+    """
+    k = len(final)
+    above = 1 - np.cumsum(final, axis=1)  # P(total > t)
+    odds = np.zeros(k)
+    replay = 0.0  # P(everyone ties) when a full-field tie is replayed
+    for i in range(k):
+        others = [j for j in range(k) if j != i]
+        for size in range(len(others) + 1):
+            for tied in combinations(others, size):
+                weight = final[i].copy()
+                for j in others:
+                    weight *= final[j] if j in tied else above[j]
+                p = weight.sum()
+                if not size:
+                    odds[i] += p
+                    continue
+                group = tuple(sorted((i,) + tied))
+                split = resolve(group)
+                if split is None:
+                    replay = p
+                else:
+                    odds[i] += p * split[group.index(i)]
+    return odds / (1 - replay) if replay else odds
+
+
+class StrokePlayOdds:
+    """Exact live win odds for Stroke Play by convolving each player's remaining holes.
+
+    suffix[p, h] is the distribution of player p's strokes over holes h..18, built once per
+    lineup, so after a score only the current hole has to be convolved in - a few ms per update.
+    Ties after 18 are settled with exact 19-20 replay odds (memoized per tied group), or split
+    evenly when the tie breaker is off.
+    """
+
+    def __init__(self, probs, tie_breaker=True):
+        self.num_players = len(probs)
+        self.probs = np.concatenate([np.zeros((self.num_players, TOTAL_HOLES, 1)), probs], axis=2)  # Index = strokes
+        self.tie_breaker = tie_breaker
+        max_total = REGULATION_HOLES * MAX_SCORE
+        self.suffix = np.zeros((self.num_players, REGULATION_HOLES + 1, max_total + 1))
+        self.suffix[:, REGULATION_HOLES, 0] = 1
+        for p in range(self.num_players):
+            for h in range(REGULATION_HOLES - 1, -1, -1):
+                self.suffix[p, h] = np.convolve(self.suffix[p, h + 1], self.probs[p, h])[:max_total + 1]
+        self.tb_total = np.array([np.convolve(self.probs[p, REGULATION_HOLES], self.probs[p, REGULATION_HOLES + 1])
+                                  for p in range(self.num_players)])
+        self._tb_odds = {}
+
+    def _final(self, rest, per_hole, known):
+        """Distribution of a final total: known strokes so far, plus each hole in per_hole, plus rest (a suffix row)"""
+        dist = rest if rest is not None else np.ones(1)
+        for hole_probs in per_hole:
+            dist = np.convolve(dist, hole_probs)
+        return np.concatenate([np.zeros(known), dist])
+
+    def tie_breaker_odds(self, players):
+        """Odds of each player in `players` winning the 19-20 replays, in that order"""
+        players = tuple(players)
+        if len(players) == 1:
+            return np.ones(1)
+        if players not in self._tb_odds:
+            final = self.tb_total[list(players)]
+            self._tb_odds[players] = _win_odds(
+                final, lambda group: None if len(group) == len(players) else self.tie_breaker_odds([players[g] for g in group]))
+        return self._tb_odds[players]
+
+    def win(self, match):
+        """Win probability per player for a GolfMatch in progress"""
+        odds = np.zeros(self.num_players)
+        if match.game_over:
+            odds[match.winner()] = 1
+            return odds
+        hole = match.current_hole
+
+        if match.in_tie_breaker:
+            # Only the tied players are left - whatever's still to play of 19-20 decides it
+            players = match.tie_breaker_players
+            final = []
+            for p in players:
+                left = [self.probs[p, h] for h in range(REGULATION_HOLES, TOTAL_HOLES) if match.scores[p][h] is None]
+                final.append(self._final(None, left, match.tie_breaker_total(p)))
+            odds[players] = _win_odds(self._pad(final), lambda group: self.tie_breaker_odds([players[g] for g in group]))
+            return odds
+
+        final = []
+        for p in range(self.num_players):
+            left = [self.probs[p, hole]] if match.scores[p][hole] is None else []
+            final.append(self._final(self.suffix[p, hole + 1], left, match.regulation_total(p)))
+        if self.tie_breaker:
+            resolve = self.tie_breaker_odds
+        else:
+            resolve = lambda group: np.full(len(group), 1 / len(group))
+        return _win_odds(self._pad(final), resolve)
+
+    @staticmethod
+    def _pad(final):
+        length = max(len(f) for f in final)
+        return np.array([np.pad(f, (0, length - len(f))) for f in final])
@@ -0,0 +1,83 @@
+import json
+import threading
+import pandas as pd
+
+CRICKET_NUMERIC_COLUMNS = [
+    "Total_Marks", "Total_Darts", "Marks_Per_Dart", "Accuracy_Pct", "Darts_To_Close",
+    "KO_Hits_Given", "KO_Hits_Received", "Players_Eliminated", "PIN_Attempts"
+]
+
+
+def decode_hole_scores(value):
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def prepare_golf_history(df):
+    """Parse raw Matches rows into typed columns with decoded hole scores"""
+    df = df.copy()
+    df['Hole_Scores'] = df['Hole_Scores'].map(decode_hole_scores)
+    df['Date'] = pd.to_datetime(df['Date']).dt.date
+    df['Total'] = pd.to_numeric(df['Total'])
+    # A match's rows are always saved together, so ranking within a batch of new rows is safe
+    df['Rank'] = df.groupby('Match_ID')['Total'].rank(method='min', ascending=True)
+    df['Is_Winner'] = df['Rank'] == 1
+    return df
+
+
+def prepare_cricket_history(df):
+    """Parse raw Cricket_Matches rows into typed columns"""
+    df = df.copy()
+    df['Date'] = pd.to_datetime(df['Date']).dt.date
+    for col in CRICKET_NUMERIC_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df['Won_Match'] = df['Won_Match'].astype(bool)
+    df['Was_Eliminated'] = df['Was_Eliminated'].astype(bool)
+    return df
+
+
+class HistoryCache:
+    """Preprocessed copy of one worksheet, keyed by the store's data version.
+
+    Reruns with no new matches return the same frame without touching it. When matches
+    are added only the new rows are read and parsed, then appended to the cached frame.
+    Tables derived from the frame (hole tables, streaks, ...) are memoized per version too.
+    """
+
+    def __init__(self, store, worksheet, prepare):
+        self.store = store
+        self.worksheet = worksheet
+        self.prepare = prepare
+        self.version = 0
+        self.frame = None
+        self._derived = {}
+        self._lock = threading.Lock()
+
+    def get(self):
+        """Returns (frame, version). Treat the frame as read-only - it is shared across reruns."""
+        with self._lock:
+            version = self.store.data_version(self.worksheet)
+            if self.frame is not None and version == self.version:
+                return self.frame, self.version
+
+            if self.frame is None or version < self.version:
+                # First load (or the local DB was replaced) - parse everything
+                new_rows = self.store.read_since(self.worksheet, 0)
+                self.frame = self.prepare(new_rows).drop(columns="row_id").reset_index(drop=True)
+            else:
+                new_rows = self.store.read_since(self.worksheet, self.version)
+                if not new_rows.empty:
+                    prepared = self.prepare(new_rows).drop(columns="row_id")
+                    self.frame = pd.concat([self.frame, prepared], ignore_index=True)
+
+            self.version = version
+            self._derived = {}
+            return self.frame, self.version
+
+    def derived(self, name, build):
+        """build(frame) once per data version, shared by every rerun until new matches arrive"""
+        frame, version = self.get()
+        with self._lock:
+            key = (name, version)
+            if key not in self._derived:
+                self._derived[key] = build(frame)
+            return self._derived[key]
@@ -0,0 +1,151 @@
+import json
+import os
+import threading
+import time
+import uuid
+
+JOURNAL_FILE = "match_journal.jsonl"
+
+
+class MatchJournal:
+    """Append-only local journal of finished matches, flushed to Google Sheets by a background worker.
+
+    Each finished match is written to disk (and fsync'd) before the save button returns,
+    so a dropped connection or an app restart never loses a match. Lines are either
+    {"op": "match", ...} records or {"op": "ack", "ids": [...]} records written once
+    the rows made it to the sheet.
+
+    Delivery is at-least-once: if the app dies after a send but before its ack is written, the
+    batch is sent again on restart. The sender has to be idempotent per Match_ID (SheetWriter
+    skips matches already in the sheet) so a re-sent batch doesn't double count in stats/ratings.
+    """
+
+    def __init__(self, path, sender, batch_size=25, min_backoff=2.0, max_backoff=300.0):
+        # sender(worksheet, rows, columns) must raise if the rows were not written, and skip rows already sent
+        self.path = path
+        self.sender = sender
+        self.batch_size = batch_size
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.last_error = None
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._pending = {}  # entry id -> entry, in insertion order
+        self._load()
+
+    # --- DISK ---
+    def _load(self):
+        """Replay the journal to rebuild the list of matches not yet synced"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Torn last line from a crash mid-write
+                if record.get("op") == "match":
+                    self._pending[record["id"]] = record
+                elif record.get("op") == "ack":
+                    for entry_id in record["ids"]:
+                        self._pending.pop(entry_id, None)
+
+    def _write(self, record):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _compact(self):
+        """Everything is synced - start the journal over so it doesn't grow forever"""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    # --- PUBLIC API ---
+    def enqueue(self, worksheet, rows, columns):
+        """Durably record a match's rows and wake the flush worker. Returns the entry id."""
+        record = {
+            "op": "match",
+            "id": uuid.uuid4().hex,
+            "worksheet": worksheet,
+            "columns": list(columns),
+            "rows": rows,
+            "queued_at": time.time()
+        }
+        with self._lock:
+            self._write(record)
+            self._pending[record["id"]] = record
+        self._wake.set()
+        return record["id"]
+
+    def pending_rows(self, worksheet):
+        """Rows of every match for `worksheet` not yet synced, oldest first"""
+        with self._lock:
+            return [row for entry in self._pending.values() if entry["worksheet"] == worksheet for row in entry["rows"]]
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+
+    def flush_once(self):
+        """Send pending rows to the sheet in batches. Returns number of matches flushed, raises on failure."""
+        with self._lock:
+            entries = list(self._pending.values())
+
+        # Group matches going to the same worksheet so each batch is one append request
+        groups = {}
+        for entry in entries:
+            groups.setdefault((entry["worksheet"], tuple(entry["columns"])), []).append(entry)
+
+        flushed = 0
+        for (worksheet, columns), group in groups.items():
+            for start in range(0, len(group), self.batch_size):
+                batch = group[start:start + self.batch_size]
+                rows = [row for entry in batch for row in entry["rows"]]
+                self.sender(worksheet, rows, list(columns))
+
+                ids = [entry["id"] for entry in batch]
+                with self._lock:
+                    self._write({"op": "ack", "ids": ids})
+                    for entry_id in ids:
+                        self._pending.pop(entry_id, None)
+                flushed += len(batch)
+
+        with self._lock:
+            if not self._pending:
+                self._compact()
+        return flushed
+
+    # --- BACKGROUND WORKER ---
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="match-journal-flush", daemon=True)
+        self._thread.start()
+        self._wake.set()  # Flush anything left over from a previous run
+
+    def _run(self):
+        backoff = self.min_backoff
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if not self.pending_count():
+                continue
+            try:
+                self.flush_once()
+                self.last_error = None
+                backoff = self.min_backoff
+            except Exception as e:
+                # Network hiccup - keep the rows on disk and try again later
+                self.last_error = str(e)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+                self._wake.set()
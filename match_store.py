@@ -0,0 +1,256 @@
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+import gspread
+import pandas as pd
+import requests
+
+MATCH_DB_FILE = "match_history.db"
+
+GOLF_MATCH_COLUMNS = ["Match_ID", "Date", "Venue", "Player", "Total", "Hole_Scores", "Opponents"]
+CRICKET_MATCH_COLUMNS = [
+    "Match_ID", "Date", "Venue", "Game_Mode", "Player", "Placement",
+    "Total_Marks", "Total_Darts", "Marks_Per_Dart", "Accuracy_Pct",
+    "Darts_To_Close", "KO_Hits_Given", "KO_Hits_Received",
+    "Players_Eliminated", "Was_Eliminated", "PIN_Attempts",
+    "Won_Match", "Opponents"
+]
+
+# Worksheet name -> column layout (same names as the Google Sheets tabs)
+WORKSHEETS = {
+    "Matches": GOLF_MATCH_COLUMNS,
+    "Cricket_Matches": CRICKET_MATCH_COLUMNS
+}
+
+SHEETS_APPEND_RETRIES = 3
+
+
+def open_spreadsheet(settings):
+    """gspread Spreadsheet for the [connections.gsheets] secrets - a service account plus the spreadsheet URL or name"""
+    settings = dict(settings)
+    spreadsheet = settings.pop("spreadsheet")
+    settings.pop("worksheet", None)
+    client = gspread.service_account_from_dict(settings)
+    return client.open_by_url(spreadsheet) if spreadsheet.startswith("http") else client.open(spreadsheet)
+
+
+def is_transient_error(error):
+    """Worth retrying: dropped connections, timeouts, rate limiting (429) and server errors (5xx)"""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, gspread.exceptions.APIError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def match_id_key(value):
+    """Match_ID as text, however it was read back (Sheets can turn an all-digit id into a number)"""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+class SheetWriter:
+    """Appends match rows to the bottom of a worksheet in one request - never downloads existing history.
+
+    The spreadsheet is opened on first use, and each worksheet once per process, reading just
+    its Match_ID column (which also shows whether the header row is there). Rows whose Match_ID
+    is already in the sheet are skipped, so sends are idempotent: a retry after a lost response,
+    or a journal batch re-sent because the app died before its ack, never writes a match twice.
+    Only transient errors are retried.
+    """
+
+    def __init__(self, settings, retries=SHEETS_APPEND_RETRIES):
+        self.settings = settings
+        self.retries = retries
+        self._spreadsheet = None
+        self._worksheets = {}  # name -> gspread Worksheet
+        self._match_ids = {}  # name -> Match_IDs known to be in that worksheet
+
+    def _worksheet(self, worksheet, columns):
+        if worksheet not in self._worksheets:
+            if self._spreadsheet is None:
+                self._spreadsheet = open_spreadsheet(self.settings)
+            ws = self._spreadsheet.worksheet(worksheet)
+            ids = ws.col_values(columns.index("Match_ID") + 1)
+            if not ids:
+                # Brand new (empty) sheet needs its header row first
+                ws.append_row(list(columns), value_input_option="USER_ENTERED")
+            self._match_ids[worksheet] = {match_id_key(v) for v in ids[1:]}
+            self._worksheets[worksheet] = ws
+        return self._worksheets[worksheet]
+
+    def append(self, worksheet, rows, columns):
+        """Append the rows of matches not already in the sheet. Returns the number of rows written."""
+        for attempt in range(self.retries):
+            try:
+                ws = self._worksheet(worksheet, columns)
+                known = self._match_ids[worksheet]
+                new_rows = [row for row in rows if match_id_key(row.get("Match_ID")) not in known]
+                if new_rows:
+                    ws.append_rows([[row.get(col, "") for col in columns] for row in new_rows],
+                                   value_input_option="USER_ENTERED")
+                    known.update(match_id_key(row.get("Match_ID")) for row in new_rows)
+                return len(new_rows)
+            except Exception as e:
+                if attempt == self.retries - 1 or not is_transient_error(e):
+                    raise
+                # The append may have landed before the response was lost - reread the Match_IDs before resending
+                self._worksheets.pop(worksheet, None)
+                time.sleep(0.5 * (2 ** attempt))  # Back off 0.5s, 1s, ... before retrying
+
+
+class MatchStore(ABC):
+    """Operations the app needs from match history, whatever is storing it"""
+
+    @abstractmethod
+    def append(self, worksheet, rows):
+        ...
+
+    @abstractmethod
+    def read(self, worksheet):
+        ...
+
+    def append_golf_match(self, rows):
+        self.append("Matches", rows)
+
+    def append_cricket_match(self, rows):
+        self.append("Cricket_Matches", rows)
+
+    def read_matches(self):
+        return self.read("Matches")
+
+    def read_cricket_matches(self):
+        return self.read("Cricket_Matches")
+
+
+class SQLiteMatchStore(MatchStore):
+    """Local match history in a single SQLite file - works with no network at all"""
+
+    def __init__(self, path=MATCH_DB_FILE):
+        self.path = path
+        with self._connect() as db:
+            for worksheet, columns in WORKSHEETS.items():
+                # No declared column types so ints/floats/text round-trip as-is
+                cols_sql = ", ".join(f'"{col}"' for col in columns)
+                db.execute(f'CREATE TABLE IF NOT EXISTS "{worksheet}" (row_id INTEGER PRIMARY KEY, {cols_sql})')
+            # Bookkeeping, e.g. which worksheets have been seeded from Google Sheets
+            db.execute('CREATE TABLE IF NOT EXISTS "Meta" (key TEXT PRIMARY KEY, value TEXT)')
+
+    def _connect(self):
+        # New connection per call keeps the store safe to share across sessions/threads
+        return sqlite3.connect(self.path, timeout=10)
+
+    def append(self, worksheet, rows):
+        columns = WORKSHEETS[worksheet]
+        cols_sql = ", ".join(f'"{col}"' for col in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        # Blank cells are stored as NULL so they read back as NaN, same as they do from Sheets
+        values = [[None if row.get(col) == "" else row.get(col) for col in columns] for row in rows]
+        with self._connect() as db:
+            db.executemany(f'INSERT INTO "{worksheet}" ({cols_sql}) VALUES ({placeholders})', values)
+
+    def read(self, worksheet):
+        return self.read_since(worksheet, 0).drop(columns="row_id")
+
+    def read_since(self, worksheet, after_row_id):
+        """Only the rows added after after_row_id (row_id column included)"""
+        columns = WORKSHEETS[worksheet]
+        cols_sql = ", ".join(f'"{col}"' for col in columns)
+        with self._connect() as db:
+            return pd.read_sql_query(
+                f'SELECT row_id, {cols_sql} FROM "{worksheet}" WHERE row_id > ? ORDER BY row_id',
+                db, params=(after_row_id,)
+            )
+
+    def data_version(self, worksheet):
+        """Changes whenever rows are added - rows are append-only so the last row_id is enough"""
+        with self._connect() as db:
+            return db.execute(f'SELECT COALESCE(MAX(row_id), 0) FROM "{worksheet}"').fetchone()[0]
+
+    def row_count(self, worksheet):
+        with self._connect() as db:
+            return db.execute(f'SELECT COUNT(*) FROM "{worksheet}"').fetchone()[0]
+
+    def match_ids(self, worksheet):
+        with self._connect() as db:
+            return {match_id_key(row[0]) for row in db.execute(f'SELECT DISTINCT "Match_ID" FROM "{worksheet}"')}
+
+    def get_meta(self, key):
+        with self._connect() as db:
+            row = db.execute('SELECT value FROM "Meta" WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        with self._connect() as db:
+            db.execute('INSERT OR REPLACE INTO "Meta" VALUES (?, ?)', (key, value))
+
+    def import_dataframe(self, worksheet, df):
+        """Bulk load rows pulled from another store (e.g. seeding from Google Sheets).
+        Matches whose Match_ID is already here are skipped. Returns the number of rows added."""
+        df = df.dropna(how="all").reindex(columns=WORKSHEETS[worksheet])
+        df = df[~df["Match_ID"].map(match_id_key).isin(self.match_ids(worksheet))]
+        df = df.astype(object).where(df.notna(), None)
+        self.append(worksheet, df.to_dict("records"))
+        return len(df)
+
+
+class GSheetsMatchStore(MatchStore):
+    """Google Sheets backed history via st-gsheets-connection"""
+
+    def __init__(self, conn, writer, read_ttl="1m"):
+        self.conn = conn
+        self.writer = writer
+        self.read_ttl = read_ttl
+
+    def append(self, worksheet, rows):
+        self.writer.append(worksheet, rows, WORKSHEETS[worksheet])
+
+    def read(self, worksheet):
+        return self.conn.read(worksheet=worksheet, ttl=self.read_ttl)
+
+
+class ReplicatedMatchStore(MatchStore):
+    """Local store is the source of truth; every append is also journaled for the Sheets replica"""
+
+    def __init__(self, local, journal=None):
+        self.local = local
+        self.journal = journal
+
+    def append(self, worksheet, rows):
+        self.local.append(worksheet, rows)
+        if self.journal is not None:
+            self.journal.enqueue(worksheet, rows, WORKSHEETS[worksheet])
+
+    def read(self, worksheet):
+        return self.local.read(worksheet)
+
+    def read_since(self, worksheet, after_row_id):
+        return self.local.read_since(worksheet, after_row_id)
+
+    def data_version(self, worksheet):
+        return self.local.data_version(worksheet)
+
+
+def seed_from_sheets(local, sheets, journal=None):
+    """Copy the Google Sheets history into the local store, for each worksheet not seeded yet.
+
+    Seeding is recorded in the Meta table once a worksheet's import succeeds (not inferred from
+    the row count), so a match saved offline before the first seed doesn't stop the sheet's
+    history coming in later. Rows still pending in the journal - which may predate the local
+    store - are imported after it. Everything is deduped by Match_ID.
+    Returns {worksheet: rows imported}. Raises if the sheet can't be read; call again later.
+    """
+    imported = {}
+    for worksheet in WORKSHEETS:
+        key = f"seeded:{worksheet}"
+        if local.get_meta(key):
+            continue
+        count = local.import_dataframe(worksheet, sheets.read(worksheet))
+        pending = journal.pending_rows(worksheet) if journal is not None else []
+        if pending:
+            count += local.import_dataframe(worksheet, pd.DataFrame(pending))
+        local.set_meta(key, time.strftime("%Y-%m-%d %H:%M"))
+        imported[worksheet] = count
+    return imported
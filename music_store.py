@@ -0,0 +1,66 @@
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+
+MUSIC_DIR = "entrance_music"
+PROFILE_TRACKS_FILE = "profile_tracks.json"  # Inside MUSIC_DIR - profile name -> track id
+MIME_EXTENSIONS = {"audio/mpeg": ".mp3", "audio/mp3": ".mp3", "audio/wav": ".wav", "audio/x-wav": ".wav", "audio/ogg": ".ogg"}
+
+
+class MusicStore:
+    """Entrance music on disk, stored once per unique file.
+
+    A track id is the SHA-256 of the file plus its extension, so the same MP3 uploaded for
+    several players (or games) is written once. Games only hold track ids; the audio is
+    served from the file when a player enters.
+    """
+
+    def __init__(self, root=MUSIC_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def put(self, data, mime=None, filename=None):
+        """Store audio bytes and return their track id (no-op if the same bytes are already stored)"""
+        ext = MIME_EXTENSIONS.get(mime) or os.path.splitext(filename or "")[1].lower() or ".mp3"
+        track_id = hashlib.sha256(data).hexdigest() + ext
+        path = self.path(track_id)
+        if not os.path.exists(path):
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        return track_id
+
+    def path(self, track_id):
+        return os.path.join(self.root, os.path.basename(track_id))
+
+    def exists(self, track_id):
+        return track_id is not None and os.path.exists(self.path(track_id))
+
+    def mime(self, track_id):
+        return mimetypes.guess_type(track_id)[0] or "audio/mpeg"
+
+    # --- PROFILE TRACKS ---
+    def _profile_tracks(self):
+        try:
+            with open(os.path.join(self.root, PROFILE_TRACKS_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def profile_track(self, name):
+        """The entrance track last used by this profile, if its file is still here"""
+        track_id = self._profile_tracks().get(name)
+        return track_id if self.exists(track_id) else None
+
+    def set_profile_track(self, name, track_id):
+        with self._lock:
+            tracks = self._profile_tracks()
+            tracks[name] = track_id
+            tmp = os.path.join(self.root, PROFILE_TRACKS_FILE + ".tmp")
+            with open(tmp, "w") as f:
+                json.dump(tracks, f, indent=2)
+            os.replace(tmp, os.path.join(self.root, PROFILE_TRACKS_FILE))
@@ -0,0 +1,195 @@
+import argparse
+import re
+import sqlite3
+from datetime import datetime
+import pandas as pd
+
+from match_store import MATCH_DB_FILE, WORKSHEETS, SQLiteMatchStore
+
+DEFAULT_RATING = 1500.0
+K_FACTOR = 32.0
+GAMES = {"golf": "Matches", "cricket": "Cricket_Matches"}  # rating pool -> history worksheet
+
+
+# --- PLACEMENTS ---
+def golf_placements(rows):
+    """[(player, place)] from one golf match's rows - lowest total is 1st, ties share a place"""
+    totals = [(row['Player'], float(row['Total'])) for row in rows]
+    return [(player, 1 + sum(1 for _, other in totals if other < total)) for player, total in totals]
+
+
+def cricket_placements(rows):
+    """[(player, place)] from one cricket match's rows using the saved '1st'/'2nd'/... placement"""
+    placements = []
+    for row in rows:
+        digits = re.match(r"\d+", str(row['Placement']))
+        placements.append((row['Player'], int(digits.group()) if digits else len(rows)))
+    return placements
+
+
+PLACEMENT_FUNCS = {"golf": golf_placements, "cricket": cricket_placements}
+
+
+# --- ELO ---
+def elo_deltas(ratings, placements, k=K_FACTOR):
+    """Multi-player Elo: every pair of players is scored as a head-to-head game (win/tie/loss).
+
+    K is split across the n-1 opponents so a 4-player match moves ratings about as much as a 1v1.
+    """
+    n = len(placements)
+    deltas = {player: 0.0 for player, _ in placements}
+    if n < 2:
+        return deltas
+    for i in range(n):
+        player_i, place_i = placements[i]
+        rating_i = ratings.get(player_i, DEFAULT_RATING)
+        for j in range(i + 1, n):
+            player_j, place_j = placements[j]
+            rating_j = ratings.get(player_j, DEFAULT_RATING)
+            expected_i = 1.0 / (1.0 + 10 ** ((rating_j - rating_i) / 400.0))
+            score_i = 1.0 if place_i < place_j else (0.5 if place_i == place_j else 0.0)
+            change = k / (n - 1) * (score_i - expected_i)
+            deltas[player_i] += change
+            deltas[player_j] -= change
+    return deltas
+
+
+def replay(matches_df, game, k=K_FACTOR):
+    """Replay a whole history in date order and return (ratings table, rated match ids).
+
+    Elo depends on the order matches are played in, and history seeded from Sheets can be older
+    than matches saved here first, so rows are sorted by Date - stably, so save order breaks ties.
+    """
+    to_placements = PLACEMENT_FUNCS[game]
+    ratings, played, wins = {}, {}, {}
+    match_ids = []
+
+    # Rows for a match are saved together, so consecutive rows with the same Match_ID are one match
+    by_date = matches_df.sort_values(
+        'Date', kind="stable", key=lambda dates: pd.to_datetime(dates, errors="coerce", format="mixed")
+    )
+    records = by_date.to_dict("records")
+    start = 0
+    for end in range(1, len(records) + 1):
+        if end < len(records) and records[end]['Match_ID'] == records[start]['Match_ID']:
+            continue
+        placements = to_placements(records[start:end])
+        for player, delta in elo_deltas(ratings, placements, k).items():
+            ratings[player] = ratings.get(player, DEFAULT_RATING) + delta
+        for player, place in placements:
+            played[player] = played.get(player, 0) + 1
+            wins[player] = wins.get(player, 0) + (1 if place == 1 else 0)
+        match_ids.append(str(records[start]['Match_ID']))
+        start = end
+
+    table = pd.DataFrame({
+        'Player': list(ratings),
+        'Rating': [ratings[p] for p in ratings],
+        'Matches': [played[p] for p in ratings],
+        'Wins': [wins[p] for p in ratings]
+    })
+    return table, match_ids
+
+
+# --- PERSISTENCE ---
+class RatingStore:
+    """Current ratings per pool ('golf' / 'cricket'), kept next to match history in the same SQLite file"""
+
+    def __init__(self, path=MATCH_DB_FILE, k=K_FACTOR):
+        self.path = path
+        self.k = k
+        with self._connect() as db:
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS "Ratings" (game TEXT, player TEXT, rating REAL, matches INTEGER, '
+                'wins INTEGER, updated TEXT, PRIMARY KEY (game, player))'
+            )
+            # Which matches are already in the ratings - makes apply_match safe to call twice
+            db.execute('CREATE TABLE IF NOT EXISTS "Rated_Matches" (game TEXT, match_id TEXT, PRIMARY KEY (game, match_id))')
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    def apply_match(self, game, match_id, placements):
+        """Incremental update for one newly saved match - O(players in the match)
+
+        Runs in one write transaction taken up front (BEGIN IMMEDIATE), so boards saving at the
+        same time are applied one after the other instead of both updating the same old ratings.
+        """
+        with self._connect() as db:
+            db.execute('BEGIN IMMEDIATE')
+            # Claiming the match id first is the "already rated" guard
+            if not db.execute('INSERT OR IGNORE INTO "Rated_Matches" VALUES (?, ?)', (game, str(match_id))).rowcount:
+                return
+            players = [player for player, _ in placements]
+            marks = ", ".join("?" for _ in players)
+            current = {
+                row[0]: row[1:] for row in db.execute(
+                    f'SELECT player, rating, matches, wins FROM "Ratings" WHERE game = ? AND player IN ({marks})',
+                    [game] + players
+                )
+            }
+            ratings = {player: values[0] for player, values in current.items()}
+            deltas = elo_deltas(ratings, placements, self.k)
+            now = datetime.now().strftime("%Y-%m-%d %H:%M")
+            for player, place in placements:
+                rating, matches, wins = current.get(player, (DEFAULT_RATING, 0, 0))
+                db.execute(
+                    'INSERT OR REPLACE INTO "Ratings" VALUES (?, ?, ?, ?, ?, ?)',
+                    (game, player, rating + deltas[player], matches + 1, wins + (1 if place == 1 else 0), now)
+                )
+
+    def table(self, game):
+        """Precomputed ratings, best first"""
+        with self._connect() as db:
+            table = pd.read_sql_query(
+                'SELECT player AS Player, rating AS Rating, matches AS Matches, wins AS Wins '
+                'FROM "Ratings" WHERE game = ? ORDER BY rating DESC', db, params=(game,)
+            )
+        table['Rating'] = table['Rating'].round().astype(int)
+        return table
+
+    def is_empty(self, game):
+        with self._connect() as db:
+            return db.execute('SELECT COUNT(*) FROM "Rated_Matches" WHERE game = ?', (game,)).fetchone()[0] == 0
+
+    def rebuild(self, game):
+        """Throw away the stored ratings for a pool and replay its full history from the same file
+
+        History is read inside the write transaction (BEGIN IMMEDIATE), so a match saved and rated
+        by apply_match meanwhile is either in the replay or rated after it - never wiped.
+        """
+        columns = WORKSHEETS[GAMES[game]]
+        cols_sql = ", ".join(f'"{col}"' for col in columns)
+        now = datetime.now().strftime("%Y-%m-%d %H:%M")
+        with self._connect() as db:
+            db.execute('BEGIN IMMEDIATE')
+            matches_df = pd.read_sql_query(f'SELECT {cols_sql} FROM "{GAMES[game]}" ORDER BY row_id', db)
+            table, match_ids = replay(matches_df, game, self.k)
+            db.execute('DELETE FROM "Ratings" WHERE game = ?', (game,))
+            db.execute('DELETE FROM "Rated_Matches" WHERE game = ?', (game,))
+            db.executemany(
+                'INSERT INTO "Ratings" VALUES (?, ?, ?, ?, ?, ?)',
+                [(game, row.Player, row.Rating, row.Matches, row.Wins, now) for row in table.itertuples()]
+            )
+            db.executemany('INSERT OR IGNORE INTO "Rated_Matches" VALUES (?, ?)', [(game, m) for m in match_ids])
+        return len(match_ids)
+
+
+def rebuild_all(path=MATCH_DB_FILE):
+    SQLiteMatchStore(path)  # Creates the history tables if the file is new
+    ratings = RatingStore(path)
+    return {game: ratings.rebuild(game) for game in GAMES}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild player ratings by replaying all saved matches")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--db", default=MATCH_DB_FILE, help="match history SQLite file")
+    args = parser.parse_args()
+
+    start = datetime.now()
+    counts = rebuild_all(args.db)
+    elapsed = (datetime.now() - start).total_seconds()
+    for game, count in counts.items():
+        print(f"{game}: replayed {count} matches")
+    print(f"Done in {elapsed:.2f}s")
@@ -0,0 +1,263 @@
+import random
+from dataclasses import dataclass, field
+
+from game_clock import GameClock
+
+MIN_PLAYERS = 2
+MAX_PLAYERS = 20
+NUMBERS = 20  # Dartboard numbers 1-20, one per player
+ELIMINATION_MARKS = 10
+STARTING_PLAYERS = 2  # First two entrants start in the ring
+
+# Clock events
+ENTRY = "entry"
+NO_HEALING = "no_healing"
+
+
+@dataclass
+class HitRecord:
+    """One hit in the undo log - whose turn it was and the values it changed.
+
+    changes holds (list, index, old) for list cells and (None, attribute, old) for plain
+    attributes. Names, numbers and entrance music never change, so they are never copied.
+    """
+    current: int
+    changes: list = field(default_factory=list)
+
+
+class RoyalRumbleGame:
+    """Royal Rumble rules with no UI - timed entries, healing, no-healing phase and eliminations.
+
+    Players are indexes in entry order (0 enters first). Time comes from a GameClock: entries
+    and the start of no healing are scheduled on it and fire from tick() as soon as they are
+    due, whoever is throwing. Pass a clock with a fake time source to drive it in tests. Turn order is
+    a circular doubly-linked list over player indexes, so entering after the current player
+    and eliminating are O(1), and owner[number] maps each dartboard number to the player in
+    the ring who owns it.
+    """
+
+    def __init__(self, names, clock=None, entry_interval=120, no_healing_delay=300, music=None,
+                 numbers=None, entry_order=None, rng=None):
+        num_players = len(names)
+        if not MIN_PLAYERS <= num_players <= MAX_PLAYERS:
+            raise ValueError(f"Royal Rumble supports {MIN_PLAYERS}-{MAX_PLAYERS} players")
+        rng = rng or random
+        if numbers is None:
+            numbers = list(range(1, NUMBERS + 1))
+            rng.shuffle(numbers)
+        if entry_order is None:
+            entry_order = list(range(num_players))
+            rng.shuffle(entry_order)
+        music = music or [None] * num_players
+
+        # Per-player state, in entry order
+        self.num_players = num_players
+        self.names = [names[i] for i in entry_order]
+        self.music = [music[i] for i in entry_order]  # Entrance track ids (see music_store) or None
+        self.numbers = list(numbers[:num_players])
+        self.marks = [0] * num_players
+        self.eliminated = [False] * num_players
+        self.eliminated_by = [None] * num_players
+        self.has_entered = [False] * num_players
+
+        # Turn order - circular linked list of players in the ring
+        self.next_in = [None] * num_players
+        self.prev_in = [None] * num_players
+        self.head = None  # Where the turn order display starts
+        self.current = None
+        self.in_ring = 0
+        self.owner = [None] * (NUMBERS + 1)  # owner[number] -> player index (None if nobody in the ring has it)
+
+        # Timing (all in game time - see GameClock)
+        self.clock = clock or GameClock()
+        self.entry_interval = entry_interval
+        self.no_healing_delay = no_healing_delay
+        self.last_entry_time = self.clock.now()
+        self.next_entry_idx = 0
+        self.no_healing_start = None
+        self.no_healing_active = False
+
+        self.entering = None  # Player whose entrance is being announced
+        self.game_over = False
+        self.winner = None
+        self.history = []  # HitRecords, newest last
+        self._record = None
+
+        for _ in range(min(STARTING_PLAYERS, num_players)):
+            self._enter(self.next_entry_idx)
+        self.entering = None
+        if not self.all_entered():
+            self.clock.schedule(ENTRY, self.last_entry_time + entry_interval)
+
+    # --- TURN ORDER ---
+    def _enter(self, player):
+        """Put a player in the ring right after the current player, so they throw next"""
+        if self.head is None:
+            self.next_in[player] = self.prev_in[player] = player
+            self.head = self.current = player
+        else:
+            after = self.current
+            before = self.next_in[after]
+            self.next_in[after] = player
+            self.prev_in[player] = after
+            self.next_in[player] = before
+            self.prev_in[before] = player
+        self.has_entered[player] = True
+        self.owner[self.numbers[player]] = player
+        self.in_ring += 1
+        self.next_entry_idx += 1
+        self.entering = player
+
+    def _remove(self, player):
+        """Take an eliminated player out of the ring (only ever during a hit, so it's logged)"""
+        before, after = self.prev_in[player], self.next_in[player]
+        self._put(self.next_in, before, after)
+        self._put(self.prev_in, after, before)
+        if self.head == player:
+            self._set('head', after)
+        self._put(self.next_in, player, None)
+        self._put(self.prev_in, player, None)
+        self._put(self.owner, self.numbers[player], None)
+        self._set('in_ring', self.in_ring - 1)
+
+    def turn_order(self):
+        """Players in the ring in turn order"""
+        order = []
+        player = self.head
+        for _ in range(self.in_ring):
+            order.append(player)
+            player = self.next_in[player]
+        return order
+
+    def display_order(self):
+        """Ring in turn order, then eliminated players in entry order"""
+        return self.turn_order() + [i for i in range(self.num_players) if self.has_entered[i] and self.eliminated[i]]
+
+    def owner_of(self, number):
+        return self.owner[number]
+
+    def all_entered(self):
+        return self.next_entry_idx >= self.num_players
+
+    # --- CLOCK ---
+    @property
+    def paused(self):
+        return self.clock.paused
+
+    def pause(self):
+        self.clock.pause()
+
+    def resume(self):
+        self.clock.resume()
+
+    def elapsed(self):
+        return self.clock.now()
+
+    def time_until_next_entry(self):
+        due = self.clock.due_at(ENTRY)
+        return 0 if due is None else max(0, due - self.clock.now())
+
+    def time_until_no_healing(self):
+        due = self.clock.due_at(NO_HEALING)
+        return 0 if due is None else max(0, due - self.clock.now())
+
+    def next_deadline(self):
+        """Game time of the next entry or no-healing start (None if nothing is left to happen)"""
+        return None if self.game_over else self.clock.next_due()
+
+    def tick(self):
+        """Fire every clock event that is due. Returns the players who entered, in order."""
+        entered = []
+        while not self.game_over:
+            event = self.clock.pop_due()
+            if event is None:
+                break
+            at, name = event
+            if name == ENTRY:
+                entered.append(self._timed_entry(at))
+            elif name == NO_HEALING:
+                self.no_healing_active = True
+        return entered
+
+    def _timed_entry(self, at):
+        """Next entrant comes in. Timers run from when the entry was due, so a late tick doesn't push later entries back."""
+        player = self.next_entry_idx
+        self._enter(player)
+        self.history = []  # Undo can't reach back past an entrance
+        self.last_entry_time = at
+        if self.all_entered():
+            self.no_healing_start = at
+            self.clock.schedule(NO_HEALING, at + self.no_healing_delay)
+        else:
+            self.clock.schedule(ENTRY, at + self.entry_interval)
+        return player
+
+    # --- PLAY ---
+    def hit(self, number):
+        """Current player hit `number`: heals their own number (unless no healing), marks anyone else's.
+
+        Returns the eliminated player's index, or None.
+        """
+        if self.game_over:
+            raise ValueError("Game is over")
+        target = self.owner[number]
+        if target is None:
+            raise ValueError(f"Nobody in the ring has {number}")
+        self._record = HitRecord(self.current)
+        self.history.append(self._record)
+
+        if target == self.current:
+            # Hit own number - can only heal if not in no-healing phase
+            if not self.no_healing_active:
+                self._put(self.marks, target, max(0, self.marks[target] - 1))
+            return None
+
+        # Hit opponent - give them a mark
+        self._put(self.marks, target, self.marks[target] + 1)
+        if self.marks[target] < ELIMINATION_MARKS:
+            return None
+
+        self._put(self.eliminated, target, True)
+        self._put(self.eliminated_by, target, self.current)
+        self._remove(target)
+        # Last player standing wins (only once everyone has entered)
+        if self.in_ring == 1 and self.all_entered():
+            self._set('game_over', True)
+            self._set('winner', self.current)
+        return target
+
+    def next_player(self):
+        """End the current turn - play passes to the next player in the ring (a new entrant if one just came in)"""
+        self.current = self.next_in[self.current]
+        return self.current
+
+    def finish_entry(self):
+        """Entrance announcement is over - entries can be checked again"""
+        self.entering = None
+
+    # --- UNDO ---
+    # A hit changes a handful of cells, so each one is logged into the current HitRecord
+    # instead of copying the player lists
+    def _put(self, values, idx, value):
+        self._record.changes.append((values, idx, values[idx]))
+        values[idx] = value
+
+    def _set(self, attr, value):
+        self._record.changes.append((None, attr, getattr(self, attr)))
+        setattr(self, attr, value)
+
+    def undo(self):
+        """Roll back the last hit (and the turn back to whoever threw it). Returns False if there is nothing to undo."""
+        if not self.history:
+            return False
+        record = self.history.pop()
+        for values, idx, old in reversed(record.changes):
+            if values is None:
+                setattr(self, idx, old)
+            else:
+                values[idx] = old
+        self.current = record.current
+        return True
+
+    def can_undo(self):
+        return bool(self.history)
@@ -0,0 +1,123 @@
+import csv
+import functools
+import io
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import pandas as pd
+
+RING_SIZE = 5000  # Samples kept per session - older ones drop off the end
+TIMINGS_FILE = "section_timings"  # Download file name without the .json / .csv extension
+SAMPLE_FIELDS = ["time", "page", "section", "ms"]
+
+_OFF = nullcontext()  # Shared no-op context handed out while timing is off
+
+
+class _Section:
+    """Context manager that times one pass through a named section"""
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.timer.record(self.name, time.perf_counter() - self.start)
+
+
+class SectionTimer:
+    """Per-session timings of named hot-path sections, kept in a ring buffer.
+
+    Three ways to time a section: `with timer.section(name):`, the `@timer.timed(name)`
+    decorator, or `timer.lap(name)` between long blocks of a page (time since the previous lap
+    or start of the rerun). Off by default - then section() returns a shared no-op context,
+    timed functions call straight through and lap() returns, so each costs a flag check.
+    """
+
+    def __init__(self, size=RING_SIZE):
+        self.enabled = False
+        self.page = None
+        self.samples = deque(maxlen=size)  # (time.time(), page, section, ms)
+        self._rerun_start = self._lap_start = time.perf_counter()
+
+    # --- RECORDING ---
+    def start_rerun(self, page):
+        """Call at the top of every rerun with the page being drawn"""
+        self.page = page
+        self._rerun_start = self._lap_start = time.perf_counter()
+
+    def end_rerun(self):
+        """Call at the bottom of the script - records the whole rerun as 'rerun'"""
+        if self.enabled:
+            self.record("rerun", time.perf_counter() - self._rerun_start)
+
+    def record(self, name, seconds):
+        self.samples.append((time.time(), self.page, name, seconds * 1000))
+
+    def section(self, name):
+        return _Section(self, name) if self.enabled else _OFF
+
+    def timed(self, name=None):
+        """Decorator timing every call of a function (as `name`, default the function's name)"""
+        def decorate(func):
+            label = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(label, time.perf_counter() - start)
+            return wrapper
+        return decorate
+
+    def lap(self, name=None):
+        """Record the time since the last lap (or start of the rerun) as `name` - no name just restarts the lap"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if name is not None:
+            self.record(name, now - self._lap_start)
+        self._lap_start = now
+
+    def clear(self):
+        self.samples.clear()
+
+    # --- REPORTING ---
+    def summary(self):
+        """p50/p95/max per (page, section) over the samples in the buffer"""
+        columns = ["Page", "Section", "Calls", "p50_ms", "p95_ms", "Max_ms", "Total_ms"]
+        if not self.samples:
+            return pd.DataFrame(columns=columns)
+        df = pd.DataFrame(list(self.samples), columns=SAMPLE_FIELDS)
+        stats = df.groupby(["page", "section"], sort=False)["ms"].agg(
+            Calls="count",
+            p50_ms="median",
+            p95_ms=lambda ms: ms.quantile(0.95),
+            Max_ms="max",
+            Total_ms="sum",
+        ).reset_index().rename(columns={"page": "Page", "section": "Section"})
+        return stats.sort_values(["Page", "Total_ms"], ascending=[True, False]).round(2)
+
+    def export_json(self):
+        """The summary and every buffered sample as a JSON document"""
+        return json.dumps({
+            "summary": self.summary().to_dict(orient="records"),
+            "samples": [dict(zip(SAMPLE_FIELDS, sample)) for sample in self.samples],
+        }, indent=2)
+
+    def export_csv(self):
+        """Every buffered sample as CSV text, one row per timed call"""
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(SAMPLE_FIELDS)
+        writer.writerows(self.samples)
+        return out.getvalue()
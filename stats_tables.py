@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+GOLF_HOLES = 18
+
+
+def hole_score_matrix(df):
+    """(row index, players*matches x 18 float array) for rows with a full 18-hole card. Missing holes are NaN."""
+    valid = df['Hole_Scores'].map(lambda s: isinstance(s, list) and len(s) == GOLF_HOLES)
+    rows = df[valid]
+    if rows.empty:
+        return rows.index, np.empty((0, GOLF_HOLES))
+    scores = np.array(rows['Hole_Scores'].tolist(), dtype=float)  # None -> NaN
+    return rows.index, scores
+
+
+def build_hole_table(df):
+    """Long-form hole-level table (one row per player per match per hole), built in one shot.
+
+    'Row' is the index of the source row in df, so a filtered view of df can pick its holes
+    with hole_table[hole_table['Row'].isin(filtered_df.index)].
+    """
+    index, scores = hole_score_matrix(df)
+    n = len(index)
+    table = pd.DataFrame({
+        'Row': np.repeat(index.values, GOLF_HOLES),
+        'Player': np.repeat(df.loc[index, 'Player'].values, GOLF_HOLES),
+        'Hole': np.tile(np.arange(1, GOLF_HOLES + 1), n),
+        'Score': scores.ravel()
+    })
+    table = table[table['Score'].notna()].reset_index(drop=True)
+    table['Score'] = table['Score'].astype(int)
+    table['Is_Ace'] = (table['Score'] == 1).astype(int)
+    table['Is_Bogey'] = (table['Score'] >= 5).astype(int)
+    return table
+
+
+# --- HEAD TO HEAD ---
+def head_to_head_pairs(df, win_col, mode_col=None):
+    """One row per (winner, loser) in every match, built in a single merge.
+
+    Works for golf (win_col='Is_Winner', ties for first share the win) and
+    cricket (win_col='Won_Match'). Tied winners don't count as beating each other.
+    """
+    cols = ['Match_ID', 'Player'] + ([mode_col] if mode_col else [])
+    is_win = df[win_col].astype(bool)
+    winners = df.loc[is_win, ['Match_ID', 'Player']].rename(columns={'Player': 'Winner'})
+    losers = df.loc[~is_win, cols].rename(columns={'Player': 'Loser'})
+    pairs = winners.merge(losers, on='Match_ID')
+    if mode_col:
+        pairs = pairs.rename(columns={mode_col: 'Mode'})
+    return pairs.drop(columns='Match_ID')
+
+
+def head_to_head_summary(pairs):
+    """Winner / Loser / Wins, most lopsided matchups first"""
+    summary = pairs.groupby(['Winner', 'Loser']).size().reset_index(name='Wins')
+    return summary.sort_values('Wins', ascending=False)
+
+
+def head_to_head_records(pairs, by_mode=False):
+    """Per player vs opponent (optionally per mode): Wins, Losses, Games and Win %"""
+    keys = ['Mode'] if by_mode else []
+    wins = pairs.rename(columns={'Winner': 'Player', 'Loser': 'Opponent'})
+    losses = pairs.rename(columns={'Loser': 'Player', 'Winner': 'Opponent'})
+    wins = wins.groupby(['Player', 'Opponent'] + keys).size().rename('Wins')
+    losses = losses.groupby(['Player', 'Opponent'] + keys).size().rename('Losses')
+
+    records = pd.concat([wins, losses], axis=1).fillna(0).astype(int)
+    records['Games'] = records['Wins'] + records['Losses']
+    records['Win %'] = (records['Wins'] / records['Games'] * 100).round(1)
+    return records.reset_index().sort_values(['Player', 'Games'], ascending=[True, False])
+
+
+# --- STREAKS ---
+def streak_table(df, win_col, date_col='Date'):
+    """Win/loss streaks for every player in one vectorized pass.
+
+    Rows are ordered by date (stable, so same-day matches keep save order), split into
+    runs of consecutive results per player, and each player's longest winning run,
+    longest losing run and current run are picked from the run table.
+    """
+    d = df[['Player', date_col]].copy()
+    d['Won'] = df[win_col].astype(bool)
+    d = d.sort_values(['Player', date_col], kind='stable')
+
+    # A new run starts whenever the player or the result changes
+    new_run = (d['Player'] != d['Player'].shift()) | (d['Won'] != d['Won'].shift())
+    d['Run'] = new_run.cumsum()
+    runs = d.groupby('Run').agg(
+        Player=('Player', 'first'), Won=('Won', 'first'), Length=('Won', 'size'),
+        Start=(date_col, 'first'), End=(date_col, 'last')
+    )
+
+    def longest(run_rows, prefix):
+        # Stable sort keeps the earliest run when two streaks are the same length
+        best = run_rows.sort_values('Length', ascending=False, kind='stable').drop_duplicates('Player')
+        return best.set_index('Player')[['Length', 'Start', 'End']].rename(columns={
+            'Length': f'Longest_{prefix}_Streak', 'Start': f'{prefix}_Streak_Start', 'End': f'{prefix}_Streak_End'
+        })
+
+    current = runs.drop_duplicates('Player', keep='last').set_index('Player')
+    table = pd.DataFrame(index=pd.Index(sorted(d['Player'].unique()), name='Player'))
+    table = table.join(longest(runs[runs['Won']], 'Win')).join(longest(runs[~runs['Won']], 'Loss'))
+    table[['Longest_Win_Streak', 'Longest_Loss_Streak']] = table[['Longest_Win_Streak', 'Longest_Loss_Streak']].fillna(0).astype(int)
+    table['Current_Win_Streak'] = current['Length'].where(current['Won'], 0).astype(int)
+    table['Current_Streak'] = np.where(current['Won'], 'W', 'L') + current['Length'].astype(str)
+    return table
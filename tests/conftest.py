@@ -0,0 +1,16 @@
+import pytest
+
+
+class FakeTime:
+    """Time source for GameClock that a test moves by hand"""
+
+    def __init__(self, start=1000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_time():
+    return FakeTime()
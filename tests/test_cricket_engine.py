@@ -0,0 +1,184 @@
+import copy
+
+import pytest
+
+from cricket_engine import (
+    CRICKET_NUMBERS, CricketKOGame, KO, MISS, NEXT, NUMBER, PIN, SKIP, update_pin_count,
+)
+
+SINGLES = "Singles Match (1v1)"
+TAG_TEAM = "Tag Team (2v2)"
+TRIPLE_THREAT = "Triple Threat (1v1v1)"
+
+
+def new_game(mode, num_players):
+    return CricketKOGame([f"P{i+1}" for i in range(num_players)], mode, ko_numbers=list(range(1, num_players + 1)))
+
+
+def state(game):
+    """Everything a dart can change - the journal itself is left out"""
+    skip = {"journal", "redo_stack", "_event"}
+    return {name: copy.deepcopy(value) for name, value in vars(game).items() if name not in skip}
+
+
+def close_board(game):
+    """Current player triples every number - three perfect turns, so they keep the darts"""
+    for num in CRICKET_NUMBERS:
+        game.apply_dart(NUMBER, num, 3)
+    assert game.is_board_closed(game.current_player_idx)
+
+
+# --- UNDO / REDO ---
+def test_each_undo_restores_the_state_before_that_dart():
+    game = new_game(TRIPLE_THREAT, 3)
+    throws = [(NUMBER, 20, 2), (MISS, None, 1), (KO, 2, 1), (NUMBER, 19, 3), (NUMBER, 20, 1), (NUMBER, 18, 1), (NUMBER, 'B', 1)]
+    before = []
+    for kind, target, multiplier in throws:
+        before.append(state(game))
+        game.apply_dart(kind, target, multiplier)
+    after = state(game)
+
+    for expected in reversed(before):
+        assert game.undo()
+        assert state(game) == expected
+    assert not game.undo()
+
+    for _ in throws:
+        assert game.redo()
+    assert not game.redo()
+    assert state(game) == after
+
+
+def test_undo_a_perfect_turn():
+    game = new_game(SINGLES, 2)
+    for num in (20, 19):
+        game.apply_dart(NUMBER, num, 1)
+    before = state(game)
+    result = game.apply_dart(NUMBER, 18, 1)
+    assert result.perfect_turn and game.dart_count == 0 and game.current_player_idx == 0
+    game.undo()
+    assert state(game) == before
+
+
+def test_new_dart_clears_redo():
+    game = new_game(SINGLES, 2)
+    game.apply_dart(NUMBER, 20, 1)
+    game.undo()
+    game.apply_dart(MISS)
+    assert not game.can_redo()
+
+
+# --- SKIPS ---
+def test_lost_turn_undoes_with_the_throw_before_it():
+    game = new_game(TRIPLE_THREAT, 3)
+    game.apply_dart(KO, 1)  # P1 KOs P2
+    before_next = state(game)
+    game.next_player()
+    assert game.current_player_idx == 1 and game.current_is_skipped()
+    game.resolve_skip()  # P2's countdown runs out
+    after_skip = state(game)
+    assert game.current_player_idx == 2 and not game.ko_skipped[1]
+    assert [event.kind for event in game.journal] == [KO, NEXT, SKIP]
+
+    # One undo takes back the skip and the Next Player before it...
+    assert game.undo()
+    assert state(game) == before_next
+    assert [event.kind for event in game.journal] == [KO]
+
+    # ...and one redo puts both back
+    assert game.redo()
+    assert not game.can_redo()
+    assert state(game) == after_skip
+
+
+def test_undo_with_only_skips_left_does_nothing():
+    game = new_game(TRIPLE_THREAT, 3)
+    game.ko_skipped[0] = True
+    game.resolve_skip()
+    assert not game.can_undo()
+    assert not game.undo()
+    assert game.current_player_idx == 1
+
+
+# --- PIN ---
+@pytest.mark.parametrize("pin, player, closed, expected", [
+    (0, 0, True, 1), (0, 0, False, 0), (-2, 0, False, -1),
+    (0, 1, True, -1), (0, 1, False, 0), (2, 1, False, 1),
+])
+def test_update_pin_count(pin, player, closed, expected):
+    assert update_pin_count(pin, player, closed) == expected
+
+
+def test_singles_pin_direction_by_player():
+    game = new_game(SINGLES, 2)
+    close_board(game)
+    game.apply_dart(PIN)
+    assert game.pin_count == 1
+    game.next_player()
+
+    game.apply_dart(PIN)  # P2 can always push it back...
+    assert game.pin_count == 0
+    game.apply_dart(PIN)  # ...but not past 0 without a closed board
+    assert game.pin_count == 0
+
+
+def test_tag_team_pins_by_board():
+    game = new_game(TAG_TEAM, 4)
+    close_board(game)  # P1 closes team 1's board
+    game.apply_dart(PIN)
+    assert game.pin_count == 1
+    game.next_player()
+
+    assert game.current_player_idx == 2  # P3 (team 2) pushes back toward 0
+    game.apply_dart(PIN)
+    assert game.pin_count == 0
+    game.next_player()
+
+    assert game.current_player_idx == 1  # P2 shares P1's closed board, so moves it the same way
+    game.apply_dart(PIN)
+    assert game.pin_count == 1
+
+
+def test_pin_to_win():
+    game = new_game(SINGLES, 2)
+    close_board(game)
+    for _ in range(3):
+        result = game.apply_dart(PIN)
+    assert result.game_over and game.winner == 0
+    game.undo()
+    assert not game.game_over and game.winner is None and game.pin_count == 2
+
+
+# --- PLACEMENTS ---
+def test_placements_while_playing_rank_by_marks():
+    game = new_game(TRIPLE_THREAT, 3)
+    game.apply_dart(NUMBER, 20, 1)
+    game.next_player()
+    game.apply_dart(NUMBER, 20, 3)
+    game.next_player()
+    game.apply_dart(NUMBER, 20, 2)
+    game.next_player()
+    assert game.placements() == [1, 2, 0]
+
+
+def test_placements_winner_first_then_survivors():
+    game = new_game("Fatal 4 Way (1v1v1v1)", 4)
+    game.winner = 3
+    game.eliminated[0] = True
+    game.boards[0][0] = 3  # Most marks, but knocked out
+    game.boards[1][0] = 1
+    game.boards[2][0] = 1
+    game.total_darts[1] = 12
+    game.total_darts[2] = 9  # Same marks in fewer darts
+    assert game.placements() == [3, 2, 1, 0]
+
+
+def test_singles_pin_winner_placements():
+    game = new_game(SINGLES, 2)
+    game.apply_dart(NUMBER, 20, 1)
+    game.next_player()
+    close_board(game)
+    for _ in range(3):
+        game.apply_dart(PIN)
+    assert game.winner == 1
+    assert game.placements() == [1, 0]
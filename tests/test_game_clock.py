@@ -0,0 +1,84 @@
+from game_clock import GameClock
+
+
+def test_game_time_stops_while_paused(fake_time):
+    clock = GameClock(fake_time)
+    fake_time.now += 10
+    assert clock.now() == 10
+
+    clock.pause()
+    fake_time.now += 50
+    assert clock.paused and clock.now() == 10
+    clock.pause()  # Pausing twice doesn't move the pause point
+    assert clock.now() == 10
+
+    clock.resume()
+    fake_time.now += 5
+    assert not clock.paused and clock.now() == 15
+
+
+def test_pauses_add_up(fake_time):
+    clock = GameClock(fake_time)
+    for _ in range(3):
+        fake_time.now += 10
+        clock.pause()
+        fake_time.now += 100
+        clock.resume()
+    clock.resume()  # Resuming a running clock does nothing
+    assert clock.now() == 30
+
+
+def test_events_fire_in_due_order(fake_time):
+    clock = GameClock(fake_time)
+    clock.schedule("c", 30)
+    clock.schedule("a", 10)
+    clock.schedule("b", 20)
+    assert clock.next_due() == 10
+
+    fake_time.now += 25
+    assert clock.pop_due() == (10, "a")
+    assert clock.pop_due() == (20, "b")
+    assert clock.pop_due() is None  # "c" isn't due yet
+    assert clock.due_at("c") == 30
+
+
+def test_same_time_events_fire_in_schedule_order(fake_time):
+    clock = GameClock(fake_time)
+    for name in ["entry", "no_healing", "other"]:
+        clock.schedule(name, 0)
+    assert [clock.pop_due()[1] for _ in range(3)] == ["entry", "no_healing", "other"]
+
+
+def test_schedule_replaces_and_cancel_drops(fake_time):
+    clock = GameClock(fake_time)
+    clock.schedule("entry", 10)
+    clock.schedule("no_healing", 15)
+    clock.schedule("entry", 20)  # Rescheduled, not added twice
+    assert clock.due_at("entry") == 20
+
+    clock.cancel("no_healing")
+    assert clock.due_at("no_healing") is None
+    fake_time.now += 100
+    assert clock.pop_due() == (20, "entry")
+    assert clock.pop_due() is None
+
+    clock.schedule("a", 0)
+    clock.schedule("b", 0)
+    clock.cancel()
+    assert clock.next_due() is None
+
+
+def test_nothing_fires_while_paused(fake_time):
+    clock = GameClock(fake_time)
+    clock.schedule("entry", 10)
+    fake_time.now += 5
+    clock.pause()
+    fake_time.now += 100
+    assert clock.pop_due() is None
+    assert clock.wall_time(10) is None
+
+    clock.resume()
+    fake_time.now += 4
+    assert clock.pop_due() is None
+    fake_time.now += 1
+    assert clock.pop_due() == (10, "entry")
@@ -0,0 +1,175 @@
+import pytest
+
+from golf_engine import GolfMatch, REGULATION_HOLES, UNDO_DEPTH
+
+
+def play_regulation(match, scores_by_player):
+    """Submit 18 holes in turn order - scores_by_player[i] is one score used for every hole"""
+    for _ in range(REGULATION_HOLES):
+        for player in range(match.num_players):
+            assert match.active_idx == player
+            match.submit(scores_by_player[player])
+
+
+def snapshot(match):
+    return ([list(row) for row in match.scores], match._turn_state(), match.standings())
+
+
+# --- TIE BREAKER ---
+def test_tie_breaker_rotation_holes_19_and_20():
+    match = GolfMatch(3)
+    play_regulation(match, [3, 5, 3])  # P1 and P3 tie for the lead
+    assert match.in_tie_breaker and not match.game_over
+    assert match.tie_breaker_players == [0, 2]
+
+    order = []
+    for score in [3, 3, 3, 3]:
+        order.append((match.current_hole, match.active_idx))
+        match.submit(score)
+    # Hole 19 in order, hole 20 reversed
+    assert order == [(18, 0), (18, 2), (19, 2), (19, 0)]
+
+
+def test_tie_breaker_replays_until_one_player_wins():
+    match = GolfMatch(2)
+    play_regulation(match, [4, 4])
+    for score in [3, 4, 3, 4]:  # P1 3+4, P2 4+3 - level at 7
+        match.submit(score)
+
+    # Still tied - 19-20 are cleared and replayed by the same players
+    assert not match.game_over
+    assert (match.current_hole, match.active_idx) == (18, 0)
+    assert [match.scores[p][18:] for p in (0, 1)] == [[None, None], [None, None]]
+    assert match.tie_breaker_total(0) == match.tie_breaker_total(1) == 0
+
+    for score in [3, 4, 4, 2]:  # P1 on 19, P2 on 19, P2 on 20, P1 on 20
+        match.submit(score)
+    assert match.game_over
+    assert match.winner() == 0
+    assert match.regulation_total(0) == match.regulation_total(1) == 72
+
+
+def test_no_tie_breaker_when_disabled():
+    match = GolfMatch(2, tie_breaker=False)
+    play_regulation(match, [4, 4])
+    assert match.game_over and not match.in_tie_breaker
+    assert match.winner() == 0
+
+
+# --- UNDO / REDO ---
+def test_undo_redo_round_trip_through_a_tie_breaker_replay():
+    match = GolfMatch(2)
+    states = [snapshot(match)]
+    play_regulation(match, [4, 4])
+    for score in [3, 4, 3, 4, 2]:
+        match.submit(score)
+    final = snapshot(match)
+    submits = REGULATION_HOLES * 2 + 5
+
+    for _ in range(submits):
+        assert match.undo()
+    assert not match.undo()
+    assert snapshot(match) == states[0]
+
+    for _ in range(submits):
+        assert match.redo()
+    assert not match.redo()
+    assert snapshot(match) == final
+
+
+def test_undo_reverses_replay_clear():
+    match = GolfMatch(2)
+    play_regulation(match, [4, 4])
+    for score in [3, 4, 3, 4]:
+        match.submit(score)
+    assert match.scores[0][18] is None
+    match.undo()  # The submit that finished hole 20 also cleared 19-20 for the replay
+    assert match.scores[0][18:] == [3, None]
+    assert match.scores[1][18:] == [4, 3]
+    assert (match.current_hole, match.active_idx) == (19, 0)
+
+
+def test_new_submit_clears_redo():
+    match = GolfMatch(2)
+    match.submit(4)
+    match.undo()
+    assert match.can_redo()
+    match.submit(5)
+    assert not match.can_redo()
+    assert match.scores[0][0] == 5
+
+
+def test_undo_log_keeps_only_the_newest_edits():
+    depth = 5
+    match = GolfMatch(2, undo_depth=depth)
+    for score in range(1, 9):
+        match.submit(score)
+    for _ in range(depth):
+        assert match.undo()
+    assert not match.undo()
+    # The three oldest scores fell off the log and stay
+    assert [match.scores[0][0], match.scores[1][0], match.scores[0][1]] == [1, 2, 3]
+    assert match.scores[1][1] is None
+    for _ in range(depth):
+        assert match.redo()
+    assert [match.scores[p][h] for h in range(4) for p in (0, 1)] == list(range(1, 9))
+
+
+def test_default_undo_depth():
+    assert GolfMatch(2).undo_log.maxlen == UNDO_DEPTH
+
+
+# --- SKINS ---
+def test_skins_carry_over_and_pay_the_pot():
+    match = GolfMatch(3, mode="Skins", skin_value=5)
+    for score in [3, 3, 4]:  # Hole 1 tied - carries over
+        match.submit(score)
+    assert match.skins_pot() == (2, 10)
+
+    for score in [4, 2]:  # Hole 2 only partly scored - nothing settles yet
+        match.submit(score)
+    assert match.hole_winners(1) == []
+    assert match.holes_won() == [0, 0, 0]
+    assert match.skins_pot() == (2, 10)
+
+    match.submit(5)  # P2 wins hole 2 and the carried skin
+    assert match.holes_won() == [0, 2, 0]
+    assert match.skins_pot() == (1, 5)
+    assert match.payout_history() == [
+        {'hole': 1, 'winner': None, 'skins': 1, 'amount': 0},
+        {'hole': 2, 'winner': 1, 'skins': 2, 'amount': 10},
+    ]
+    assert match.standings()[1]['winnings'] == 10
+
+    match.undo()  # Hole 2 is partly scored again - the payout comes back off
+    assert match.holes_won() == [0, 0, 0]
+    assert match.skins_pot() == (2, 10)
+    assert len(match.payout_history()) == 1
+
+
+def test_adding_a_player_reopens_finished_holes():
+    match = GolfMatch(2, mode="Skins")
+    for score in [3, 4, 2, 4]:
+        match.submit(score)
+    assert match.holes_won() == [2, 0]
+
+    match.set_num_players(3)  # P3 hasn't scored holes 1-2, so neither counts any more
+    assert match.holes_won() == [0, 0, 0]
+    assert match.payout_history() == []
+    assert match.skins_pot() == (1, 0)
+
+    match.set_num_players(2)
+    assert match.holes_won() == [2, 0]
+
+
+def test_match_play_counts_holes_not_skins():
+    match = GolfMatch(2, mode="Match Play")
+    for score in [3, 3, 2, 4]:
+        match.submit(score)
+    assert match.holes_won() == [1, 0]
+
+
+@pytest.mark.parametrize("score", [0, -1])
+def test_submit_rejects_scores_below_one(score):
+    with pytest.raises(ValueError):
+        GolfMatch(2).submit(score)
@@ -0,0 +1,178 @@
+import copy
+
+import pytest
+
+from game_clock import GameClock
+from rumble_engine import ELIMINATION_MARKS, RoyalRumbleGame
+
+NUMBERS = [5, 10, 15, 20]
+
+
+@pytest.fixture
+def clock(fake_time):
+    return GameClock(fake_time)
+
+
+def new_game(clock, players=4, entry_interval=10, no_healing_delay=5):
+    names = [f"P{i+1}" for i in range(players)]
+    return RoyalRumbleGame(names, clock=clock, entry_interval=entry_interval, no_healing_delay=no_healing_delay,
+                           numbers=NUMBERS[:players], entry_order=list(range(players)))
+
+
+def state(game):
+    """Everything a hit can change - the clock and undo log are left out"""
+    skip = {"clock", "history", "_record"}
+    return {name: copy.deepcopy(value) for name, value in vars(game).items() if name not in skip}
+
+
+def eliminate(game, target_number):
+    for _ in range(ELIMINATION_MARKS):
+        eliminated = game.hit(target_number)
+    return eliminated
+
+
+# --- CLOCK EVENTS ---
+def test_entries_fire_on_tick(clock, fake_time):
+    game = new_game(clock)
+    assert game.turn_order() == [0, 1] and game.entering is None
+    assert game.tick() == []
+    assert game.time_until_next_entry() == 10
+
+    fake_time.now += 10
+    assert game.tick() == [2]
+    assert game.entering == 2
+    assert game.owner_of(15) == 2
+
+
+def test_late_tick_catches_up_in_order(clock, fake_time):
+    game = new_game(clock)
+    fake_time.now += 100  # Nobody ticked for a while
+    assert game.tick() == [2, 3]
+    assert game.all_entered() and game.no_healing_active
+    # Timers run from when each event was due, not from the late tick
+    assert game.last_entry_time == 20
+    assert game.no_healing_start == 20
+    assert game.next_deadline() is None
+
+
+def test_no_healing_follows_the_last_entry(clock, fake_time):
+    game = new_game(clock, players=3)
+    fake_time.now += 10
+    assert game.tick() == [2]
+    assert game.clock.due_at("entry") is None
+    assert game.time_until_no_healing() == 5
+
+    fake_time.now += 4
+    game.tick()
+    assert not game.no_healing_active
+    fake_time.now += 1
+    game.tick()
+    assert game.no_healing_active
+
+
+def test_paused_game_holds_entries(clock, fake_time):
+    game = new_game(clock)
+    fake_time.now += 4
+    game.pause()
+    fake_time.now += 1000
+    assert game.tick() == []
+    assert game.paused and game.time_until_next_entry() == 6
+    game.resume()
+    fake_time.now += 6
+    assert game.tick() == [2]
+
+
+# --- NUMBER INDEX ---
+def test_owner_index_follows_entries_and_eliminations(clock, fake_time):
+    game = new_game(clock, players=3)
+    assert [game.owner_of(n) for n in NUMBERS] == [0, 1, None, None]
+    with pytest.raises(ValueError):
+        game.hit(15)  # Not in the ring yet
+
+    fake_time.now += 10
+    game.tick()
+    game.finish_entry()
+    assert game.owner_of(15) == 2
+    assert game.turn_order() == [0, 2, 1]  # Entrant throws right after the current player
+
+    assert eliminate(game, 10) == 1
+    assert game.owner_of(10) is None
+    assert game.turn_order() == [0, 2]
+    assert game.display_order() == [0, 2, 1]
+    assert game.eliminated_by[1] == 0
+    with pytest.raises(ValueError):
+        game.hit(10)
+
+
+def test_last_player_standing_wins(clock, fake_time):
+    game = new_game(clock, players=3)
+    fake_time.now += 10
+    game.tick()
+    eliminate(game, 10)
+    eliminate(game, 15)
+    assert game.game_over and game.winner == 0
+    assert game.in_ring == 1
+    with pytest.raises(ValueError):
+        game.hit(5)
+
+
+def test_no_winner_until_everyone_has_entered(clock):
+    game = new_game(clock, players=3)
+    eliminate(game, 10)
+    assert game.in_ring == 1 and not game.game_over
+
+
+def test_healing_only_before_no_healing(clock, fake_time):
+    game = new_game(clock, players=3)
+    game.next_player()
+    game.hit(5)
+    game.hit(5)
+    game.next_player()
+    game.hit(5)  # P1 heals their own number
+    assert game.marks[0] == 1
+
+    fake_time.now += 15
+    game.tick()
+    assert game.no_healing_active
+    game.hit(5)
+    assert game.marks[0] == 1
+
+
+# --- UNDO ---
+def test_undo_restores_an_elimination(clock, fake_time):
+    game = new_game(clock, players=3)
+    fake_time.now += 10
+    game.tick()
+    game.finish_entry()
+    eliminate(game, 15)
+    for _ in range(ELIMINATION_MARKS - 1):
+        game.hit(10)
+    before = state(game)
+    game.hit(10)  # Knocks out P2 - and wins it for P1
+    assert game.game_over and game.winner == 0
+
+    assert game.undo()
+    assert state(game) == before
+    assert game.turn_order() == [0, 1]
+    assert game.owner_of(10) == 1
+
+
+def test_undo_every_hit_in_a_turn(clock):
+    game = new_game(clock)
+    start = state(game)
+    for number in [10, 10, 5]:
+        game.hit(number)
+    game.next_player()
+    for _ in range(3):
+        assert game.undo()
+    assert not game.undo()
+    assert state(game) == start
+
+
+def test_entry_clears_undo(clock, fake_time):
+    game = new_game(clock)
+    game.hit(10)
+    assert game.can_undo()
+    fake_time.now += 10
+    game.tick()
+    assert not game.can_undo()